@@ -0,0 +1,84 @@
+# Bu kod, MASK_RULES kurallarını geri izlemeyi (backtracking) tetikleyen uzun
+# girdilerle çalıştırır ve girdi boyu 4 katına çıktığında sürenin kaç kat
+# arttığını ölçer. Güvenli moddaki herhangi bir kural doğrusalın üstüne
+# çıkarsa betik 1 koduyla çıkar.
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_mask import MASK_RULES, MaskEngine, bound_rule  # noqa: E402
+
+# Kural sınıflarının içinde kalan, ama anahtar kelimeye hiç ulaşmayan dizgiler
+GENERATORS = {
+    "harf_bosluk": "Ab ",
+    "harf": "a",
+    "rakam": "1",
+    "rakam_nokta": "1.",
+    "buyuk_nokta": "A.",
+    "rakam_bosluk": "1 ",
+    "karisik": "Ab1.- ",
+}
+# Çapa kontrolünü geçip tüm kuralların gerçekten denenmesi için eklenir
+ANCHOR_PREFIX = "Kanun Vergi Mah Cad Sok Blv Bulvar A.Ş. Ltd Limited Anonim. "
+BASE_LEN = 2000
+GROWTH = 4
+MAX_EXPONENT = 1.5  # 1.0 doğrusal, 2.0 karesel
+
+
+def en_iyi_sure(func, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def buyume_ussu(func):
+    """En kötü üreteçteki süre büyüme üssünü ve üretecin adını döndürür."""
+    worst, worst_name = 0.0, None
+    for name, unit in GENERATORS.items():
+        small = unit * (BASE_LEN // len(unit))
+        large = unit * (BASE_LEN * GROWTH // len(unit))
+        t_small = max(en_iyi_sure(func, small), 1e-6)
+        t_large = en_iyi_sure(func, large)
+        exponent = math.log(t_large / t_small, GROWTH)
+        if exponent > worst:
+            worst, worst_name = exponent, name
+    return worst, worst_name
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 75)
+    print(f"🧨 PATOLOJİK GİRDİ TESTİ (boy {BASE_LEN} -> {BASE_LEN * GROWTH}, eşik üs {MAX_EXPONENT})")
+    print("=" * 75)
+    print(f"{'Kural':<20} | {'Eski üs':<8} | {'Güvenli üs':<10} | {'En kötü girdi':<14} | Durum")
+    print("-" * 75)
+
+    failed = []
+    for rule in MASK_RULES:
+        old_exp, _ = buyume_ussu(lambda t, p=rule["pattern"]: p.sub("", t))
+        safe = bound_rule(rule)
+        new_exp, gen = buyume_ussu(lambda t, p=safe["pattern"]: p.sub("", t))
+        ok = new_exp <= MAX_EXPONENT
+        if not ok:
+            failed.append(rule["name"])
+        print(f"{rule['name']:<20} | {old_exp:<8.2f} | {new_exp:<10.2f} | {gen:<14} | {'✅' if ok else '❌'}")
+
+    engine = MaskEngine(MASK_RULES, safe=True)
+    engine_exp, gen = buyume_ussu(lambda t: engine.mask(ANCHOR_PREFIX + t))
+    ok = engine_exp <= MAX_EXPONENT
+    if not ok:
+        failed.append("MaskEngine")
+    print("-" * 75)
+    print(f"{'MaskEngine (safe)':<20} | {'-':<8} | {engine_exp:<10.2f} | {gen:<14} | {'✅' if ok else '❌'}")
+    print("-" * 75)
+
+    if failed:
+        print(f"\n❌ Doğrusal olmayan kurallar: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✅ Güvenli modda tüm kurallar doğrusal süreyle çalışıyor.")
@@ -0,0 +1,68 @@
+# Bu kod, risk sınıflandırmasını cümle cümle (eski predict_risk_level yöntemi) ve
+# risk_classifier.classify_batch ile farklı token bütçelerinde çalıştırıp saniyedeki
+# cümle sayısını ve dolgu (padding) oranını karşılaştırır. Girdi, test CSV'sindeki
+# cümlelerdir; model ./trained-models/yg_eqa.
+import csv
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # model yolları depo köküne göre
+
+import torch  # noqa: E402
+
+from model_registry import MODEL_REGISTRY  # noqa: E402
+from risk_classifier import DEFAULT_MODEL_PATH, classify_batch, token_budget_batches  # noqa: E402
+
+CSV_FILE = "datase-v1-test.csv"
+MAX_SENTENCES = 512
+TOKEN_BUDGETS = [2048, 8192, 16384]
+
+
+def cumle_cumle(texts, tokenizer, model):
+    labels = []
+    with torch.no_grad():
+        for text in texts:
+            inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=256)
+            labels.append(int(torch.argmax(model(**inputs).logits, dim=-1)))
+    return labels
+
+
+def dolgu_orani(lengths, max_tokens):
+    padded = sum(len(b) * max(lengths[i] for i in b) for b in token_budget_batches(lengths, max_tokens))
+    return 1 - sum(lengths) / padded
+
+
+if __name__ == "__main__":
+    with open(CSV_FILE, encoding="utf-8") as f:
+        texts = [row["text"] for row in csv.DictReader(f)][:MAX_SENTENCES]
+
+    tokenizer, model = MODEL_REGISTRY.get(DEFAULT_MODEL_PATH)
+    lengths = [len(ids) for ids in tokenizer(texts, truncation=True, max_length=256)["input_ids"]]
+    classify_batch(texts[:8])  # ısınma
+
+    print("\n" + "=" * 80)
+    print(f"⚡ RİSK SINIFLANDIRMA: CÜMLE CÜMLE vs TOPLU ({len(texts)} cümle, {DEFAULT_MODEL_PATH})")
+    print("=" * 80)
+    print(f"{'Yöntem':<32} | {'Süre (sn)':<10} | {'Cümle/sn':<10} | {'Dolgu %':<8} | {'Hız':<6}")
+    print("-" * 80)
+
+    start = time.perf_counter()
+    reference_labels = cumle_cumle(texts, tokenizer, model)
+    reference = time.perf_counter() - start
+    print(f"{'cümle cümle (no_grad)':<32} | {reference:<10.2f} | {len(texts) / reference:<10.1f} | "
+          f"{0.0:<8.1f} | {1.0:<6.2f}x")
+
+    id2label = model.config.id2label
+    for budget in TOKEN_BUDGETS:
+        start = time.perf_counter()
+        results = classify_batch(texts, max_tokens=budget)
+        elapsed = time.perf_counter() - start
+        same = sum(r["label"] == id2label[l] for r, l in zip(results, reference_labels))
+        print(f"{f'classify_batch (bütçe={budget})':<32} | {elapsed:<10.2f} | {len(texts) / elapsed:<10.1f} | "
+              f"{dolgu_orani(lengths, budget) * 100:<8.1f} | {reference / elapsed:<6.2f}x")
+        if same != len(texts):
+            print(f"⚠️ {len(texts) - same} cümlede etiket cümle cümle sonuçtan farklı.")
+    print("-" * 80)
@@ -0,0 +1,94 @@
+# Bu kod, doc_extract içindeki PDF arka uçlarını (PyMuPDF, pypdf, pdfminer) depodaki
+# 2-turkiye-arnavutluk.pdf ve ondan çoğaltılan büyük sentetik PDF'ler üzerinde
+# karşılaştırır. Her ölçüm ayrı bir süreçte yapılır; böylece tepe bellek (max RSS)
+# bir önceki arka ucun ayırdığı bellekten etkilenmez.
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from doc_extract import available_backends, iter_pages  # noqa: E402
+
+PDF_PATH = os.path.join(ROOT, "2-turkiye-arnavutluk.pdf")
+SYNTHETIC_PAGES = [200, 2000]
+
+
+def sentetik_pdf(source, pages, target):
+    """Kaynak PDF'in sayfalarını tekrarlayarak istenen sayfa sayısında PDF yazar."""
+    try:
+        import fitz
+
+        src = fitz.open(source)
+        out = fitz.open()
+        while out.page_count < pages:
+            out.insert_pdf(src, to_page=min(src.page_count, pages - out.page_count) - 1)
+        out.save(target)
+        return target
+    except ImportError:
+        from pypdf import PdfReader, PdfWriter
+
+        reader = PdfReader(source)
+        writer = PdfWriter()
+        while len(writer.pages) < pages:
+            writer.add_page(reader.pages[len(writer.pages) % len(reader.pages)])
+        with open(target, "wb") as f:
+            writer.write(f)
+        return target
+
+
+def _olc(path, backend, queue):
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    pages = chars = 0
+    for text in iter_pages(path, backend):
+        pages += 1
+        chars += len(text)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((pages, chars, elapsed, (peak - base) / 1024))  # Linux'ta KB -> MB
+
+
+def olc(path, backend):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    proc = context.Process(target=_olc, args=(path, backend, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+if __name__ == "__main__":
+    backends = available_backends(".pdf")
+    if not backends:
+        print("🚨 HATA: Kurulu PDF arka ucu yok (pymupdf, pypdf veya pdfminer.six kurun).")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = [("2-turkiye-arnavutluk.pdf", PDF_PATH)]
+        for n in SYNTHETIC_PAGES:
+            inputs.append((f"sentetik-{n}s.pdf", sentetik_pdf(PDF_PATH, n, os.path.join(tmp, f"s{n}.pdf"))))
+
+        print("\n" + "=" * 85)
+        print(f"📄 METİN ÇIKARMA ARKA UÇ KARŞILAŞTIRMASI (kurulu: {', '.join(backends)})")
+        print("=" * 85)
+        print(f"{'Dosya':<26} | {'Arka uç':<10} | {'Sayfa':<6} | {'Sayfa/sn':<10} | "
+              f"{'Karakter':<10} | {'Tepe bellek (MB)':<16}")
+        print("-" * 85)
+        fastest = {}
+        for label, path in inputs:
+            for backend in backends:
+                pages, chars, elapsed, mem = olc(path, backend)
+                rate = pages / max(elapsed, 1e-9)
+                print(f"{label:<26} | {backend:<10} | {pages:<6} | {rate:<10.1f} | {chars:<10} | {mem:<16.1f}")
+                if rate > fastest.get(label, (None, 0))[1]:
+                    fastest[label] = (backend, rate)
+            print("-" * 85)
+
+    for label, (backend, rate) in fastest.items():
+        print(f"🥇 {label}: en hızlı arka uç {backend} ({rate:.1f} sayfa/sn)")
@@ -0,0 +1,76 @@
+# Bu kod, sözlük boyutu büyüdükçe Gazetteer (Aho-Corasick) ile aynı girdilerden
+# kurulan regex alternasyonunun tarama süresini karşılaştırır. Ayrıca otomatın
+# ilk kurulum süresi ile disk önbelleğinden yüklenme süresini raporlar.
+import csv
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import gazetteer  # noqa: E402
+from gazetteer import Gazetteer, alternation, read_list  # noqa: E402
+
+SIZES = [100, 1_000, 10_000, 50_000]
+LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+CSV_FILES = ["dataset-v1-train.csv", "datase-v1-test.csv"]
+
+
+def sentetik_girdiler(n, seed=42):
+    """Gerçek il listesine ek olarak n adet rastgele 1-3 kelimelik girdi üretir."""
+    rng = random.Random(seed)
+    entries = set(read_list("iller"))
+    while len(entries) < n:
+        words = ["".join(rng.choice(LETTERS) for _ in range(rng.randint(4, 9))).capitalize()
+                 for _ in range(rng.randint(1, 3))]
+        entries.add(" ".join(words))
+    return sorted(entries)
+
+
+def metni_yukle():
+    texts = []
+    for name in CSV_FILES:
+        with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+            texts.extend(re.sub(r"\s+", " ", row["text"]) for row in csv.DictReader(f))
+    return " ".join(texts)
+
+
+def sure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    text = metni_yukle()
+    print("\n" + "=" * 90)
+    print(f"📚 GAZETTEER ÖLÇEKLENME TESTİ (metin: {len(text) / 1e3:.0f} bin karakter)")
+    print("=" * 90)
+    print(f"{'Girdi':<8} | {'Kurulum (s)':<12} | {'Önbellek (s)':<12} | {'AC tarama (s)':<14} | "
+          f"{'Regex tarama (s)':<16} | {'Eşleşme':<8}")
+    print("-" * 90)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        list_dir = os.path.join(tmp, "lists")
+        cache_dir = os.path.join(tmp, "cache")
+        os.makedirs(list_dir)
+        for n in SIZES:
+            entries = sentetik_girdiler(n)
+            with open(os.path.join(list_dir, f"sentetik_{n}.txt"), "w", encoding="utf-8") as f:
+                f.write("\n".join(entries))
+
+            build_time, gaz = sure(lambda: Gazetteer(f"sentetik_{n}", directory=list_dir, cache_dir=cache_dir))
+            gazetteer._loaded.clear()  # süreç içi önbelleği boşalt, diskten yüklensin
+            load_time, gaz = sure(lambda: Gazetteer(f"sentetik_{n}", directory=list_dir, cache_dir=cache_dir))
+
+            ac_time, hits = sure(lambda: sum(1 for _ in gaz.finditer(text)))
+            pattern = re.compile(rf"\b(?:{alternation(entries)})\b", re.IGNORECASE)
+            regex_time, _ = sure(lambda: sum(1 for _ in pattern.finditer(text)))
+
+            print(f"{n:<8} | {build_time:<12.3f} | {load_time:<12.3f} | {ac_time:<14.3f} | "
+                  f"{regex_time:<16.3f} | {hits:<8}")
+    print("-" * 90)
@@ -0,0 +1,69 @@
+# Bu kod, data_mask içindeki MaskEngine ile eski kural-kural döngüsünü
+# (mask_text_sequential) aynı sözleşme cümleleri üzerinde karşılaştırır. Çapasız
+# satır, kazancın ne kadarının çapa ön elemesinden geldiğini gösterir. Tüm belge tek
+# metin olarak verildiğinde neredeyse her çapa geçer; MaskEngine burada çakışma
+# çözümü yüzünden eski döngüden biraz yavaştır (boru hattı cümle cümle maskeler).
+# Tek bir cümlede bile çıktı farklıysa farklar yazdırılır ve betik hata koduyla çıkar.
+import csv
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_mask import MASK_RULES, MaskEngine, mask_text, mask_text_sequential  # noqa: E402
+
+CSV_FILES = ["dataset-v1-train.csv", "datase-v1-test.csv"]
+REPEAT = 3
+
+
+def cumleleri_yukle():
+    """Eğitim ve test CSV'lerindeki cümleleri boşlukları sadeleştirerek yükler."""
+    texts = []
+    for name in CSV_FILES:
+        with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                texts.append(re.sub(r"\s+", " ", row["text"]).strip())
+    return texts
+
+
+def olc(func, texts):
+    """Fonksiyonun saniyede işlediği cümle ve karakter sayısını döndürür."""
+    chars = sum(len(t) for t in texts) * REPEAT
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for t in texts:
+            func(t)
+    elapsed = time.perf_counter() - start
+    return len(texts) * REPEAT / elapsed, chars / elapsed / 1e6
+
+
+if __name__ == "__main__":
+    sentences = cumleleri_yukle()
+    document = [" ".join(sentences)]  # pdf_metin_cikar çıktısı gibi tek uzun metin
+    unanchored = MaskEngine([{k: v for k, v in rule.items() if k != "anchors"} for rule in MASK_RULES])
+
+    print("\n" + "=" * 75)
+    print(f"🏁 MASKELEME THROUGHPUT KARŞILAŞTIRMASI ({len(sentences)} cümle, x{REPEAT})")
+    print("=" * 75)
+    print(f"{'Yöntem':<28} | {'Girdi':<12} | {'Cümle/sn':<12} | {'MB/sn':<8}")
+    print("-" * 75)
+    for label, func in [("Eski döngü (kural başına)", mask_text_sequential),
+                        ("MaskEngine (çapasız)", unanchored.mask),
+                        ("MaskEngine", mask_text)]:
+        sps, mbps = olc(func, sentences)
+        print(f"{label:<28} | {'cümle':<12} | {sps:<12.1f} | {mbps:<8.3f}")
+        _, mbps = olc(func, document)
+        print(f"{label:<28} | {'tek metin':<12} | {'-':<12} | {mbps:<8.3f}")
+    print("-" * 75)
+
+    mismatches = [t for t in sentences + document if mask_text(t) != mask_text_sequential(t)]
+    print(f"Eski döngü ile birebir aynı çıktı: {len(sentences) + 1 - len(mismatches)}/{len(sentences) + 1} girdi")
+    if mismatches:
+        for t in mismatches[:5]:
+            print(f"❌ Girdi:      {t[:200]}")
+            print(f"   MaskEngine: {mask_text(t)[:200]}")
+            print(f"   Eski döngü: {mask_text_sequential(t)[:200]}")
+        sys.exit(1)
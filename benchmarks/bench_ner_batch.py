@@ -0,0 +1,54 @@
+# Bu kod, pdf_analiz_v3 içindeki NER aşamasını cümle cümle (eski yöntem) ve
+# uzunluğa göre gruplanmış batch'lerle çalıştırıp saniyedeki cümle sayısını
+# karşılaştırır. Varsayılan girdi depodaki 2-turkiye-arnavutluk.pdf dosyasıdır.
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pdf_analiz_v3 import (  # noqa: E402
+    NER_MODEL_NAME,
+    load_ner_pipeline,
+    ner_toplu_calistir,
+    pdf_metin_cikar,
+)
+from sentence_splitter import split_sentences  # noqa: E402
+
+PDF_PATH = os.path.join(ROOT, "2-turkiye-arnavutluk.pdf")
+BATCH_SIZES = [8, 16, 32, 64]
+
+
+def olc(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else PDF_PATH
+    sentences = [s.text for s in split_sentences(pdf_metin_cikar(pdf_path))]
+    ner_pipeline = load_ner_pipeline(NER_MODEL_NAME)
+    ner_pipeline(sentences[:4])  # ısınma: ilk çağrıdaki tek seferlik maliyetleri dışarıda bırak
+
+    print("\n" + "=" * 65)
+    print(f"⚡ NER BATCH KARŞILAŞTIRMASI ({os.path.basename(pdf_path)}, {len(sentences)} cümle)")
+    print("=" * 65)
+    print(f"{'Yöntem':<30} | {'Süre (sn)':<10} | {'Cümle/sn':<10} | {'Hız':<6}")
+    print("-" * 65)
+
+    base_time, base = olc(lambda: [ner_pipeline(s) for s in sentences])
+    print(f"{'Cümle cümle (eski)':<30} | {base_time:<10.2f} | {len(sentences) / base_time:<10.1f} | {'1.0x':<6}")
+
+    for batch_size in BATCH_SIZES:
+        elapsed, batched = olc(lambda: ner_toplu_calistir(sentences, ner_pipeline, batch_size))
+        same = sum(
+            [(e["entity_group"], e["start"], e["end"]) for e in a]
+            == [(e["entity_group"], e["start"], e["end"]) for e in b]
+            for a, b in zip(base, batched)
+        )
+        label = f"Batch={batch_size} (uzunluk sıralı)"
+        print(f"{label:<30} | {elapsed:<10.2f} | {len(sentences) / elapsed:<10.1f} | "
+              f"{base_time / elapsed:<4.1f}x  (aynı varlık: {same}/{len(sentences)})")
+    print("-" * 65)
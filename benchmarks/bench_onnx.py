@@ -0,0 +1,73 @@
+# Bu kod, risk modelini PyTorch ve onnxruntime (onnx_backend) arka uçlarıyla
+# karşılaştırır: soğuk başlangıç (yeni süreçte içe aktarma + yükleme + ilk tahmin),
+# tek cümle gecikmesi, toplu işlem hızı ve test CSV'sinde logit eşdeğerliği.
+# Önce ONNX modeli üretilmiş olmalı: python onnx_backend.py ./trained-models/yg_eqa
+import csv
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # model yolları depo köküne göre
+
+from onnx_backend import PARITY_ATOL, TEST_CSV, onnx_dir, parity_check  # noqa: E402
+from risk_classifier import DEFAULT_MODEL_PATH, classify_batch  # noqa: E402
+
+MODEL_PATH = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MODEL_PATH
+BACKENDS = ["torch", "onnx"]
+LATENCY_SAMPLES = 50
+COLD_START_RUNS = 3
+
+COLD_START = """
+import time
+start = time.perf_counter()
+from risk_classifier import classify_batch
+classify_batch(["Sözleşme tek taraflı feshedilebilir."], {model!r}, backend={backend!r})
+print(time.perf_counter() - start)
+"""
+
+
+def soguk_baslangic(backend):
+    code = COLD_START.format(model=MODEL_PATH, backend=backend)
+    runs = [float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                 check=True, cwd=ROOT).stdout.strip().splitlines()[-1])
+            for _ in range(COLD_START_RUNS)]
+    return min(runs)
+
+
+if __name__ == "__main__":
+    if not os.path.exists(onnx_dir(MODEL_PATH)):
+        print(f"🚨 HATA: {onnx_dir(MODEL_PATH)} yok. Önce: python onnx_backend.py {MODEL_PATH}")
+        sys.exit(1)
+    with open(TEST_CSV, encoding="utf-8") as f:
+        texts = [row["text"] for row in csv.DictReader(f)]
+
+    print("\n" + "=" * 85)
+    print(f"🔁 PYTORCH vs ONNX RUNTIME ({MODEL_PATH}, {len(texts)} test cümlesi)")
+    print("=" * 85)
+    print(f"{'Arka uç':<8} | {'Soğuk başlangıç (sn)':<20} | {'p50 ms':<8} | {'p95 ms':<8} | {'Cümle/sn':<9}")
+    print("-" * 85)
+    throughput = {}
+    for backend in BACKENDS:
+        cold = soguk_baslangic(backend)
+        classify_batch(texts[:8], MODEL_PATH, backend=backend)  # ısınma
+        latencies = []
+        for text in texts[:LATENCY_SAMPLES]:
+            start = time.perf_counter()
+            classify_batch([text], MODEL_PATH, backend=backend)
+            latencies.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        classify_batch(texts, MODEL_PATH, backend=backend)
+        throughput[backend] = len(texts) / (time.perf_counter() - start)
+        print(f"{backend:<8} | {cold:<20.2f} | {statistics.median(latencies):<8.1f} | "
+              f"{statistics.quantiles(latencies, n=20)[-1]:<8.1f} | {throughput[backend]:<9.1f}")
+    print("-" * 85)
+    print(f"⚡ ONNX toplu hız: {throughput['onnx'] / throughput['torch']:.2f}x")
+
+    max_diff, agreement = parity_check(MODEL_PATH, texts)
+    status = "✅" if max_diff <= PARITY_ATOL and agreement == 1.0 else "⚠️"
+    print(f"{status} Logit eşdeğerliği: en büyük mutlak fark {max_diff:.2e} (eşik {PARITY_ATOL:.0e}), "
+          f"tahmin uyuşması %{agreement * 100:.2f}")
@@ -0,0 +1,85 @@
+# Bu kod, risk modellerinin fp32 ve dinamik INT8 (model_quantize) sürümlerini CPU'da
+# karşılaştırır: yükleme süresi, ağırlık belleği, tek cümle gecikmesi (p50/p95),
+# toplu işlem hızı ve datase-v1-test.csv üzerinde doğruluk / ağırlıklı F1 farkı.
+# Ayrıca INT8 modelin kaç cümlede fp32 ile farklı karar verdiği raporlanır.
+import csv
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # model yolları depo köküne göre
+
+import evaluate  # noqa: E402
+import torch  # noqa: E402
+
+from model_registry import MODEL_REGISTRY, model_bytes  # noqa: E402
+from risk_classifier import classify_batch  # noqa: E402
+
+MODEL_PATHS = ["./final-legal-bert-risk-model", "./trained-models/yg_eqa_v3"]
+TEST_CSV = "datase-v1-test.csv"
+LATENCY_SAMPLES = 50
+
+acc = evaluate.load("accuracy")
+f1 = evaluate.load("f1")
+
+
+def test_verisi():
+    with open(TEST_CSV, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return [row["text"] for row in rows], [int(row["label"]) for row in rows]
+
+
+def olc(model_path, quantized, texts, labels):
+    MODEL_REGISTRY.unload()
+    start = time.perf_counter()
+    _, model = MODEL_REGISTRY.get(model_path, quantized=quantized)
+    load_seconds = time.perf_counter() - start
+    label2id = {v: int(k) for k, v in model.config.id2label.items()}
+
+    latencies = []
+    for text in texts[:LATENCY_SAMPLES]:
+        start = time.perf_counter()
+        classify_batch([text], model_path, quantized=quantized)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    results = classify_batch(texts, model_path, quantized=quantized)
+    elapsed = time.perf_counter() - start
+    preds = [label2id[r["label"]] for r in results]
+    return {
+        "load": load_seconds,
+        "mb": model_bytes(model) / 1024 ** 2,
+        "p50": statistics.median(latencies),
+        "p95": statistics.quantiles(latencies, n=20)[-1],
+        "throughput": len(texts) / elapsed,
+        "accuracy": acc.compute(predictions=preds, references=labels)["accuracy"],
+        "f1": f1.compute(predictions=preds, references=labels, average="weighted")["f1"],
+        "preds": preds,
+    }
+
+
+if __name__ == "__main__":
+    torch.set_num_threads(os.cpu_count() or 1)
+    texts, labels = test_verisi()
+
+    print("\n" + "=" * 112)
+    print(f"🧮 FP32 vs DİNAMİK INT8 (CPU, {torch.get_num_threads()} thread, {len(texts)} test cümlesi)")
+    print("=" * 112)
+    print(f"{'Model':<30} | {'Mod':<5} | {'Yükleme':<8} | {'MB':<7} | {'p50 ms':<7} | {'p95 ms':<7} | "
+          f"{'Cümle/sn':<9} | {'Accuracy':<8} | {'F1 (w)':<7} | {'ΔF1':<7}")
+    print("-" * 112)
+    for model_path in MODEL_PATHS:
+        fp32 = olc(model_path, False, texts, labels)
+        int8 = olc(model_path, True, texts, labels)
+        for mode, r in (("fp32", fp32), ("int8", int8)):
+            delta = r["f1"] - fp32["f1"]
+            print(f"{model_path:<30} | {mode:<5} | {r['load']:<8.1f} | {r['mb']:<7.0f} | {r['p50']:<7.1f} | "
+                  f"{r['p95']:<7.1f} | {r['throughput']:<9.1f} | {r['accuracy']:<8.4f} | "
+                  f"{r['f1']:<7.4f} | {delta:<+7.4f}")
+        changed = sum(a != b for a, b in zip(fp32["preds"], int8["preds"]))
+        print(f"↳ INT8: {fp32['p50'] / int8['p50']:.2f}x gecikme, {int8['throughput'] / fp32['throughput']:.2f}x "
+              f"hız, %{int8['mb'] / fp32['mb'] * 100:.0f} bellek; {changed}/{len(texts)} cümlede karar değişti.")
+        print("-" * 112)
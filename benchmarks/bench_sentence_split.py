@@ -0,0 +1,102 @@
+# Bu kod, sentence_splitter (tek geçiş) ile doc_sentence_splitter'ın eski yer tutucu
+# yöntemini ve NLTK punkt'ı (kuruluysa) aynı metin üzerinde karşılaştırır. Veri
+# setindeki cümlelerde tarih bulunmadığı için her cümlenin ardına tarihli bir hüküm
+# eklenmiş ikinci bir metin de ölçülür: eski yöntem her cümlede tüm yer tutucuları
+# geri yazdığından süresi cümle sayısı x tarih sayısıyla, yani karesel büyür.
+import csv
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sentence_splitter import split_sentences  # noqa: E402
+
+CSV_FILES = ["dataset-v1-train.csv", "datase-v1-test.csv"]
+SCALES = [1, 3, 10]
+
+
+def eski_split_sentences(text):
+    """doc_sentence_splitter.split_sentences'ın önceki (yer tutucu) sürümü, tarih filtresi hariç."""
+    abbreviations = ["Mr", "Mrs", "Dr", "Prof", "Sn", "T.C", "No", "Madde", "Md", "Bkz"]
+    date_pattern = r"\d{1,2}\.\d{1,2}\.\d{2,4}"
+    protected = {}
+    for i, abbr in enumerate(abbreviations):
+        text = text.replace(abbr + ".", f"__ABBR{i}__")
+        protected[f"__ABBR{i}__"] = abbr + "."
+    for i, m in enumerate(re.findall(date_pattern, text)):
+        text = text.replace(m, f"__DATE{i}__")
+        protected[f"__DATE{i}__"] = m
+    restored = []
+    for s in re.split(r"(?<=[.!?])\s+", text):
+        for key, val in protected.items():
+            s = s.replace(key, val)
+        s = s.strip()
+        if s:
+            restored.append(s)
+    return restored
+
+
+def nltk_splitter():
+    try:
+        from nltk.tokenize import sent_tokenize
+
+        sent_tokenize("Deneme. Deneme.", language="turkish")
+    except (ImportError, LookupError):
+        return None
+    return lambda text: sent_tokenize(text, language="turkish")
+
+
+def metni_yukle(tarihli=False):
+    texts = []
+    for name in CSV_FILES:
+        with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+            texts.extend(re.sub(r"\s+", " ", row["text"]).strip() for row in csv.DictReader(f))
+    if tarihli:
+        texts = [f"{t} Bu hüküm {i % 28 + 1:02}.{i % 12 + 1:02}.2024 tarihinde yürürlüğe girer."
+                 for i, t in enumerate(texts)]
+    return " ".join(texts)
+
+
+def olc(func, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        best = min(best, time.perf_counter() - start)
+    return best, len(result)
+
+
+if __name__ == "__main__":
+    methods = [
+        ("sentence_splitter (tek geçiş)", lambda t: split_sentences(t)),
+        ("eski yer tutucu yöntemi", eski_split_sentences),
+    ]
+    punkt = nltk_splitter()
+    if punkt:
+        methods.append(("NLTK punkt (turkish)", punkt))
+    else:
+        print("ℹ️ NLTK veya punkt verisi kurulu değil; punkt karşılaştırması atlandı.")
+
+    for label, base in [("veri seti", metni_yukle()), ("veri seti + tarihli hükümler", metni_yukle(True))]:
+        print("\n" + "=" * 90)
+        print(f"✂️ CÜMLE AYIRMA KARŞILAŞTIRMASI: {label} (taban metin: {len(base)} karakter)")
+        print("=" * 90)
+        print(f"{'Ölçek':<6} | {'Yöntem':<30} | {'Cümle':<8} | {'Süre (sn)':<10} | {'MB/sn':<8} | {'Hız':<8}")
+        print("-" * 90)
+        for scale in SCALES:
+            text = " ".join([base] * scale)
+            mb = len(text.encode("utf-8")) / 1e6
+            reference = None
+            for name, func in methods:
+                elapsed, count = olc(func, text, repeat=1 if scale >= 3 else 3)
+                reference = reference or elapsed
+                print(f"{scale:<6} | {name:<30} | {count:<8} | {elapsed:<10.4f} | "
+                      f"{mb / max(elapsed, 1e-9):<8.2f} | {elapsed / reference:<8.2f}x")
+            print("-" * 90)
+
+    sample = split_sentences(base)
+    assert all(base[s.start:s.end] == s.text for s in sample), "ofsetler metinle uyuşmuyor"
+    print(f"✅ {len(sample)} cümlenin ofsetleri orijinal metinle birebir uyuşuyor.")
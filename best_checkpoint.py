@@ -0,0 +1,103 @@
+# Bu kod, eğitim sırasında yalnızca en iyi ağırlıkları tutar. Trainer'ın
+# save_strategy="epoch" + load_best_model_at_end davranışı her epoch optimizer
+# durumu dahil ~440MB'lık tam bir checkpoint yazar ve sonunda hepsi silinir.
+# Bunun yerine her değerlendirmede metrik iyileşirse ağırlıklar bellekte (CPU
+# kopyası) ya da üzerine yazılan tek bir safetensors dosyasında saklanır, eğitim
+# bitince modele geri yüklenir. Optimizer durumu yalnızca devam ettirilebilirlik
+# (resumable=True) istenirse diske yazılır. Nihai model atomik olarak kaydedilir.
+#
+# Kullanım:
+#   args = TrainingArguments(..., **checkpoint_args(resumable=False))
+#   trainer = Trainer(..., callbacks=best_model_callbacks(resumable=False))
+#   save_model_atomic(trainer, tokenizer, "./trained-models/yg_eqa")
+import os
+import shutil
+
+from transformers import TrainerCallback
+
+BEST_FILE = "best.safetensors"
+
+
+def checkpoint_args(resumable=False):
+    """TrainingArguments için checkpoint ayarları."""
+    if resumable:
+        # Eski davranış: epoch başına tam checkpoint (optimizer dahil), en fazla iki tane
+        return {"save_strategy": "epoch", "load_best_model_at_end": True, "save_total_limit": 2}
+    return {"save_strategy": "no", "load_best_model_at_end": False}
+
+
+def best_model_callbacks(resumable=False, storage="memory"):
+    """resumable=False ise en iyi ağırlıkları tutan callback listesi döndürür."""
+    return [] if resumable else [BestModelCallback(storage)]
+
+
+class BestModelCallback(TrainerCallback):
+    """metric_for_best_model iyileştikçe ağırlıkları saklar, eğitim sonunda geri yükler.
+
+    storage="memory": ağırlıkların CPU kopyası (disk G/Ç yok).
+    storage="disk": output_dir/best.safetensors, her seferinde atomik olarak üzerine yazılır.
+    """
+
+    def __init__(self, storage="memory"):
+        if storage not in ("memory", "disk"):
+            raise ValueError(f"Bilinmeyen storage: {storage}")
+        self.storage = storage
+        self.best_metric = None
+        self.best_epoch = None
+        self._state = None
+        self._path = None
+
+    def _better(self, args, value):
+        if self.best_metric is None:
+            return True
+        return value > self.best_metric if args.greater_is_better else value < self.best_metric
+
+    def on_evaluate(self, args, state, control, metrics=None, model=None, **kwargs):
+        name = args.metric_for_best_model or "loss"
+        key = name if name.startswith("eval_") else f"eval_{name}"
+        if not metrics or key not in metrics or model is None:
+            return
+        if not self._better(args, metrics[key]):
+            return
+        self.best_metric = metrics[key]
+        self.best_epoch = state.epoch
+        if self.storage == "memory":
+            self._state = {k: v.detach().to("cpu", copy=True) for k, v in model.state_dict().items()}
+        else:
+            from safetensors.torch import save_model
+
+            os.makedirs(args.output_dir, exist_ok=True)
+            self._path = os.path.join(args.output_dir, BEST_FILE)
+            tmp = f"{self._path}.tmp"
+            save_model(model, tmp)
+            os.replace(tmp, self._path)
+
+    def on_train_end(self, args, state, control, model=None, **kwargs):
+        if model is None or self.best_metric is None:
+            return
+        if self.storage == "memory":
+            model.load_state_dict(self._state)
+            self._state = None
+        else:
+            from safetensors.torch import load_model
+
+            load_model(model, self._path, device=str(next(model.parameters()).device))
+        print(f"🏅 En iyi ağırlıklar geri yüklendi (epoch {self.best_epoch:.0f}, "
+              f"{args.metric_for_best_model}={self.best_metric:.4f})")
+
+
+def save_model_atomic(trainer, tokenizer, save_path):
+    """Modeli ve tokenizer'ı önce geçici klasöre yazar, sonra save_path ile yer değiştirir.
+
+    Yarıda kalan bir kayıt, önceki geçerli modeli bozmaz.
+    """
+    save_path = os.path.normpath(save_path)
+    tmp = f"{save_path}.{os.getpid()}.tmp"
+    old = f"{save_path}.{os.getpid()}.old"
+    shutil.rmtree(tmp, ignore_errors=True)
+    trainer.save_model(tmp)
+    tokenizer.save_pretrained(tmp)
+    if os.path.exists(save_path):
+        os.replace(save_path, old)
+    os.replace(tmp, save_path)
+    shutil.rmtree(old, ignore_errors=True)
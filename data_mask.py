@@ -1,8 +1,13 @@
+import bisect
+import hashlib
 import re
 
+from gazetteer import Gazetteer, alternation, read_list
+
 # -------------------------------------------------------------------
 # HER KATEGORİ İÇİN REGEX + MASKE KURALLARI
 # Her regex'in üstünde ÖRNEK kullanım açıklaması vardır.
+# Sözlük tabanlı kurallarda "pattern" bir Gazetteer'dır (gazetteers/*.txt).
 # -------------------------------------------------------------------
 MASK_RULES = [
 
@@ -21,6 +26,7 @@ MASK_RULES = [
             re.IGNORECASE,
         ),
         "replacement": "[ŞİRKET_ADI]",
+        "anchors": ("aş", "a.ş", "ltd", "limited", "anonim"),
     },
 
     # ------------------------------------------------------------
@@ -51,7 +57,7 @@ MASK_RULES = [
     },
 
     # ------------------------------------------------------------
-    # ŞEHİR ADI (örnek bazı şehirler)
+    # ŞEHİR ADI (gazetteers/iller.txt: 81 il ve yaygın kısa adları)
     # Örnek:
     #   "İstanbul"
     #   "Ankara"
@@ -59,10 +65,7 @@ MASK_RULES = [
     # ------------------------------------------------------------
     {
         "name": "yer_adi",
-        "pattern": re.compile(
-            r"\b(İstanbul|Ankara|İzmir|Bursa|Antalya|Adana|Konya)\b",
-            re.IGNORECASE,
-        ),
+        "pattern": Gazetteer("iller"),
         "replacement": "[YER_ADI]",
     },
 
@@ -81,6 +84,7 @@ MASK_RULES = [
             r"[A-ZÇĞİÖŞÜa-zçığıöşü0-9\s\.,/-]{0,120})"
         ),
         "replacement": "[ADRES]",
+        "anchors": ("mah", "cad", "sok", "bulvar", "blv"),
     },
 
     # "No: 3"
@@ -115,8 +119,7 @@ MASK_RULES = [
         "name": "tarih_yazili",
         "pattern": re.compile(
             r"\b\d{1,2}\s+"
-            r"(Ocak|Şubat|Mart|Nisan|Mayıs|Haziran|Temmuz|Ağustos|"
-            r"Eylül|Ekim|Kasım|Aralık)"
+            rf"({alternation(read_list('aylar'))})"
             r"\s+\d{2,4}\b",
             re.IGNORECASE,
         ),
@@ -174,12 +177,10 @@ MASK_RULES = [
         "replacement": "[TUTAR]",
     },
 
-    # "Türk Lirası"
+    # "Türk Lirası" (gazetteers/para_birimleri.txt)
     {
         "name": "para_birimi_tanim",
-        "pattern": re.compile(
-            r"\b(Türk\s+Lirası|Amerikan\s+Doları|Euro)\b", re.IGNORECASE
-        ),
+        "pattern": Gazetteer("para_birimleri"),
         "replacement": "[PARA_BIRIMI]",
     },
 
@@ -197,6 +198,13 @@ MASK_RULES = [
         "replacement": "[BANKA_BILGISI]",
     },
 
+    # "Ziraat Bankası", "Türkiye İş Bankası" (gazetteers/bankalar.txt)
+    {
+        "name": "banka_adi",
+        "pattern": Gazetteer("bankalar"),
+        "replacement": "[BANKA_BILGISI]",
+    },
+
     {
         "name": "hesap_no",
         "pattern": re.compile(
@@ -274,6 +282,19 @@ MASK_RULES = [
             re.IGNORECASE,
         ),
         "replacement": "[VERGI_DAIRESI]",
+        "anchors": ("vergi",),
+    },
+
+    # ------------------------------------------------------------
+    # MAHKEME / İCRA DAİRESİ (gazetteers/mahkemeler.txt)
+    # Örnek:
+    #   "Asliye Ticaret Mahkemesi"
+    #   "İcra Müdürlüğü"
+    # ------------------------------------------------------------
+    {
+        "name": "mahkeme_adi",
+        "pattern": Gazetteer("mahkemeler"),
+        "replacement": "[MAHKEME_ADI]",
     },
 
     # ------------------------------------------------------------
@@ -304,10 +325,11 @@ MASK_RULES = [
             re.IGNORECASE,
         ),
         "replacement": "[KANUN_ADI]",
+        "anchors": ("kanun", "yönetmel", "tebl"),
     },
 
     # ------------------------------------------------------------
-    # ÜNVAN
+    # ÜNVAN (gazetteers/unvanlar.txt)
     # Örnek:
     #   "Genel Müdür"
     #   "Av."
@@ -315,20 +337,293 @@ MASK_RULES = [
     # ------------------------------------------------------------
     {
         "name": "unvan",
-        "pattern": re.compile(
-            r"\b(Genel\s+Müdür|Müdür|Yönetim\s+Kurulu\s+Başkanı|"
-            r"Şube\s+Müdürü|Av\.?|Dr\.?|Prof\.?\s*Dr\.?)\b",
-            re.IGNORECASE,
-        ),
+        "pattern": Gazetteer("unvanlar"),
         "replacement": "[UNVAN]",
     },
 ]
 
 
+# -------------------------------------------------------------------
+# DERLENMİŞ MASKELEME MOTORU (TEK YENİDEN YAZIM)
+# Her kural orijinal metinde kendi finditer'ı ile bir kez taranır; eşleşmeler
+# kural-kural döngüsünde olduğu gibi MASK_RULES sırasıyla kabul edilir (önceki
+# kuralın eşleşmesi, daha solda başlasa bile sonrakini geçersiz kılar) ve metin
+# tek seferde yazılır. Çapa kelimesi metinde geçmeyen kurallar hiç taranmaz.
+# Python'un re modülünde tüm kuralları tek alternasyonda birleştirmek her desenin
+# kendi önek optimizasyonlarını kaybettirdiği için kural başına taramadan yavaştır;
+# cümle başına kazancın asıl kaynağı çapa ön elemesi ve ara metinlerin yeniden
+# kurulmamasıdır. Tüm belge tek metin olarak verildiğinde çapalar neredeyse hep
+# geçer ve çakışma çözümü eklendiği için eski döngüden biraz yavaştır
+# (bkz. benchmarks/bench_mask.py); boru hattı cümle cümle maskeler.
+# -------------------------------------------------------------------
+
+# -------------------------------------------------------------------
+# GÜVENLİ MOD (GERİ İZLEME SINIRI, İSTEĞE BAĞLI)
+# "\b[ A-Z...]+(Kanunu|...)" gibi sınırsız bir karakter sınıfıyla başlayan
+# kurallar, noktalaması az uzun metinde her konumdan yeniden denenir ve
+# karesel süreye çıkar. Güvenli modda (safe=True) bu baştaki tekrar
+# {1,SAFE_WINDOW} penceresine bağlanır; böylece konum başına iş sabit kalır.
+# Pencereden uzun bir ad artık bütünüyle maskelenmediği için çıktı değişebilir;
+# bu yüzden varsayılan kapalıdır ve yalnızca güvenilmeyen uzun girdiler için açılır.
+# "anchors" listesi olan kurallar her iki modda da çapa kelimesi metinde yoksa
+# hiç denenmez; bu yalnızca bir ön filtredir, çıktıyı değiştirmez (çapalar küçük
+# harfli ve kuraldan gevşek olmalıdır).
+# Örnek:
+#   r"\b[A-Z\s]+Vergi\s+Dairesi\b" -> r"\b[A-Z\s]{1,80}Vergi\s+Dairesi\b"
+# -------------------------------------------------------------------
+SAFE_WINDOW = 80
+
+_LEADING_REPEAT = re.compile(r"^(\\b)?(\(*)(\[(?:\\.|[^\]\\])+\])([+*])")
+
+
+def bound_rule(rule, window=SAFE_WINDOW):
+    """Baştaki sınırsız karakter sınıfı tekrarını pencereye bağlar."""
+    pattern = rule["pattern"]
+    if not isinstance(pattern, re.Pattern):
+        return rule
+    match = _LEADING_REPEAT.match(pattern.pattern)
+    if match is None:
+        return rule
+    low = 1 if match.group(4) == "+" else 0
+    bounded = (
+        (match.group(1) or "")
+        + match.group(2)
+        + match.group(3)
+        + f"{{{low},{window}}}"
+        + pattern.pattern[match.end():]
+    )
+    return {**rule, "pattern": re.compile(bounded, pattern.flags)}
+
+
+def ruleset_version(rules):
+    """Kural setinin içeriğinden kısa bir sürüm özeti üretir (önbellek anahtarı için)."""
+    digest = hashlib.sha256()
+    for rule in rules:
+        pattern = rule["pattern"]
+        body = pattern.key if isinstance(pattern, Gazetteer) else f"{pattern.pattern}/{pattern.flags}"
+        digest.update(f"{rule['name']}\0{body}\0{rule['replacement']}\n".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def _anchor_text(text):
+    """Çapa kontrolü için metni katlar.
+
+    re.IGNORECASE altında "i", "I", "İ" ve "ı" aynı harf sayılır ("vergı" de
+    "Vergi" kuralına uyar); bu yüzden hepsi "i"ye indirilir. str.lower() "İ"
+    için bıraktığı birleşik noktayı da atar.
+    """
+    return text.lower().replace("\u0307", "").replace("ı", "i").replace("ſ", "s")
+
+
+class _MaskedView:
+    """Önceki maskelerin uygulandığı metin (mask_text_sequential'ın o kuralda gördüğü)."""
+
+    def __init__(self, text, spans):
+        pieces, self.gaps, self.labels, pos, offset = [], [], [], 0, 0
+        for start, end, _, replacement in spans:
+            pieces.append(text[pos:start])
+            # (görünümdeki başlangıç, görünümdeki bitiş, orijinaldeki başlangıç)
+            self.gaps.append((offset, offset + start - pos, pos))
+            # Boşluğun ardından gelen maske etiketinin orijinaldeki aralığı
+            self.labels.append((start, end))
+            offset += start - pos + len(replacement)
+            pieces.append(replacement)
+            pos = end
+        pieces.append(text[pos:])
+        self.gaps.append((offset, offset + len(text) - pos, pos))
+        self.text = "".join(pieces)
+        self._view_starts = [gap[0] for gap in self.gaps]
+        self._orig_starts = [gap[2] for gap in self.gaps]
+
+    def _gap(self, position, original):
+        """Orijinal (original=True) veya görünümdeki konumun düştüğü maskesiz aralığın sırası."""
+        starts = self._orig_starts if original else self._view_starts
+        return bisect.bisect_right(starts, position) - 1
+
+    def _original(self, position, is_end):
+        """Görünümdeki konumu orijinale eşler; etiketin içine düşen konum, etiketin
+        yerini aldığı aralığın başına (is_end=False) veya sonuna (is_end=True) gider."""
+        k = self._gap(position, original=False)
+        view_start, view_end, orig_start = self.gaps[k]
+        if position <= view_end:
+            return position - view_start + orig_start
+        return self.labels[k][1 if is_end else 0]
+
+    def rescan(self, rule, resume, matches, i):
+        """Kuralı görünümde orijinal resume konumundan itibaren tarar.
+
+        Bulunan bir eşleşme matches[j] ile aynı aralığa denk gelince tarama
+        bırakılır; (kabul edilen eşleşmeler, devam edilecek indeks) döndürülür.
+        Maske etiketini kapsayan eşleşmeler (ör. "Ek-1 [KİŞİ_ADI]") eski döngüdeki
+        gibi o etiketi de yutar; aralığı etiketin yerini aldığı metnin sonuna uzar.
+        """
+        view_start, _, orig_start = self.gaps[self._gap(resume, original=True)]
+        position = resume - orig_start + view_start
+        pattern = rule["pattern"]
+        template = isinstance(pattern, re.Pattern) and "\\" in rule["replacement"]
+        if isinstance(pattern, Gazetteer):
+            found = ((s, e, None) for s, e in pattern.finditer(self.text) if s >= position)
+        else:
+            found = ((m.start(), m.end(), m) for m in pattern.finditer(self.text, position))
+        pending = {match: j for j, match in enumerate(matches[i:], i)}
+        accepted = []
+        for start, end, match in found:
+            if start == end:
+                continue
+            orig = (self._original(start, is_end=False), self._original(end, is_end=True))
+            replacement = match.expand(rule["replacement"]) if template else rule["replacement"]
+            accepted.append((*orig, rule["name"], replacement))
+            gap_start, gap_end, _ = self.gaps[self._gap(start, original=False)]
+            j = pending.get(orig)
+            if j is not None and gap_start < start and end < gap_end:
+                return accepted, j + 1
+        return accepted, len(matches)
+
+
+class MaskEngine:
+    """MASK_RULES listesini tek yeniden yazımla uygular.
+
+    "anchors" anahtarı olan kurallar, çapa kelimelerinden biri metinde
+    geçmiyorsa taramaya hiç alınmaz. safe=True (isteğe bağlı) iken ayrıca
+    baştaki sınırsız tekrarlar pencereye bağlanır; bu, çok uzun adlarda
+    çıktıyı mask_text_sequential'dan farklılaştırabilir. Gazetteer kuralları Aho-Corasick ile
+    ayrıca taranır; regex ve sözlük eşleşmeleri çakıştığında MASK_RULES
+    sırasında önce gelen kural kazanır. Çakışan kuralın eşleşmeleri, eski
+    döngüdeki gibi önceki maskelerin uygulandığı metinde yeniden aranır
+    (mask_text_sequential ile aynı çıktı).
+    """
+
+    def __init__(self, rules=MASK_RULES, safe=False, window=SAFE_WINDOW):
+        if safe:
+            rules = [bound_rule(rule, window) for rule in rules]
+        self.rules = list(rules)
+        # Tüm sözlük kuralları tek otomatta birleşir: etiket -> kural sırası
+        self._gazetteer_rules = [
+            i for i, rule in enumerate(self.rules)
+            if isinstance(rule["pattern"], Gazetteer)
+        ]
+        self._gazetteer = None
+        if self._gazetteer_rules:
+            self._gazetteer = Gazetteer.union(
+                [self.rules[i]["pattern"] for i in self._gazetteer_rules]
+            )
+        self._anchored = [
+            (i, tuple(_anchor_text(a) for a in rule["anchors"]))
+            for i, rule in enumerate(self.rules)
+            if rule.get("anchors")
+        ]
+        self._active = {}
+        self.version = ruleset_version(self.rules)
+
+    def _active_rules(self, text):
+        """Metinde taranacak regex kurallarının sıraları (çapası geçmeyenler atlanır)."""
+        skipped = ()
+        if self._anchored:
+            folded = _anchor_text(text)
+            skipped = tuple(
+                i for i, anchors in self._anchored
+                if not any(a in folded for a in anchors)
+            )
+        active = self._active.get(skipped)
+        if active is None:
+            active = tuple(
+                i for i, r in enumerate(self.rules)
+                if i not in skipped and isinstance(r["pattern"], re.Pattern)
+            )
+            self._active[skipped] = active
+        return active
+
+    def _gazetteer_candidates(self, text):
+        """Her sözlük kuralının kendi finditer'ı ile bulacağı eşleşmeler: {kural sırası: [(bas, bit)]}."""
+        found = {}
+        if self._gazetteer is None:
+            return found
+        last_end = {}
+        for start, end, label in self._gazetteer.candidates_labeled(text):
+            if start < last_end.get(label, 0):
+                continue
+            last_end[label] = end
+            found.setdefault(self._gazetteer_rules[label], []).append((start, end))
+        return found
+
+    def _regex_candidates(self, text, active):
+        """Her regex kuralının kendi finditer'ı ile bulduğu boş olmayan eşleşmeler: {kural sırası: [(bas, bit)]}."""
+        found = {}
+        for index in active:
+            matches = [m.span() for m in self.rules[index]["pattern"].finditer(text) if m.end() > m.start()]
+            if matches:
+                found[index] = matches
+        return found
+
+    def _resolved(self, text, active):
+        """Eşleşmeleri kural sırasına göre çakışmasız hale getirir.
+
+        (başlangıç, bitiş, kural_adı, maske) dörtlülerini soldan sağa döndürür.
+        """
+        by_rule = []
+        for index, matches in self._regex_candidates(text, active).items():
+            by_rule.append((index, True, matches))
+        for index, matches in self._gazetteer_candidates(text).items():
+            by_rule.append((index, False, matches))
+        by_rule.sort(key=lambda item: item[0])
+
+        starts, spans = [], []
+        for index, is_regex, matches in by_rule:
+            rule = self.rules[index]
+            accepted, view, i = [], None, 0
+            while i < len(matches):
+                start, end = matches[i]
+                k = bisect.bisect_right(starts, start)
+                # Önceki bir maskeyle çakışan veya ona bitişik eşleşme: eski döngüde bu
+                # kural maskelenmiş metni taradığı için eşleşmeler kayabilir.
+                if (k and spans[k - 1][1] >= start) or (k < len(starts) and starts[k] <= end):
+                    view = view or _MaskedView(text, spans)
+                    resume = accepted[-1][1] if accepted else 0
+                    found, i = view.rescan(rule, resume, matches, i)
+                    accepted.extend(found)
+                    continue
+                replacement = rule["replacement"]
+                if is_regex and "\\" in replacement:
+                    replacement = rule["pattern"].match(text, start).expand(replacement)
+                accepted.append((start, end, rule["name"], replacement))
+                i += 1
+            for span in accepted:
+                # Etiketi yutan eşleşme, kapsadığı önceki maskelerin yerini alır.
+                k = bisect.bisect_left(starts, span[0])
+                stop = k
+                while stop < len(spans) and spans[stop][1] <= span[1]:
+                    stop += 1
+                starts[k:stop] = [span[0]]
+                spans[k:stop] = [span]
+        return spans
+
+    def mask(self, text: str) -> str:
+        """Metni tek yeniden yazımla maskeler."""
+        pieces, pos = [], 0
+        for start, end, _, replacement in self._resolved(text, self._active_rules(text)):
+            pieces.append(text[pos:start])
+            pieces.append(replacement)
+            pos = end
+        pieces.append(text[pos:])
+        return "".join(pieces)
+
+    def spans(self, text: str):
+        """(başlangıç, bitiş, kural_adı, maske) dörtlülerini sırayla üretir."""
+        yield from self._resolved(text, self._active_rules(text))
+
+
+MASK_ENGINE = MaskEngine(MASK_RULES)
+
+
 # -------------------------------------------------------------------
 # ANA MASKELEME FONKSİYONU
 # -------------------------------------------------------------------
 def mask_text(text: str) -> str:
+    return MASK_ENGINE.mask(text)
+
+
+def mask_text_sequential(text: str) -> str:
+    """Eski yöntem: her kural için metin baştan sona ayrı ayrı taranır."""
     for rule in MASK_RULES:
         text = rule["pattern"].sub(rule["replacement"], text)
     return text
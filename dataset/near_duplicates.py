@@ -0,0 +1,194 @@
+# Bu kod, etiketli CSV'lerde yakın kopya (near-duplicate) maddeleri MinHash
+# imzaları ve LSH bantlamasıyla bulur. Yalnızca tarih, sayı veya bir isim farkı olan
+# kalıp maddeler aynı kümeye düşer; böylece hem bir dosya içindeki tekrarlar hem de
+# train ile test arasında sızan (leakage) maddeler ve aynı maddeye farklı etiket
+# verilmiş satırlar (etiket çakışması) raporlanır. Tüm çiftler karşılaştırılmaz:
+# yalnızca en az bir LSH bandını paylaşan satırlar aday olur, bu yüzden milyonlarca
+# satıra ölçeklenir.
+#
+# Kullanım:
+#   python dataset/near_duplicates.py dataset-v1-train.csv datase-v1-test.csv
+#   python dataset/near_duplicates.py dataset-v1-train.csv datase-v1-test.csv --drop --threshold 0.85
+import argparse
+import os
+import re
+import zlib
+from collections import defaultdict
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+NUM_PERM = 128
+BANDS = 16             # 16 bant x 8 satır: ~%70 benzerlikten itibaren aday olma olasılığı hızla artar
+THRESHOLD = 0.8        # tahmini Jaccard benzerliği eşiği
+SHINGLE_WORDS = 3
+MERSENNE = (1 << 61) - 1
+SEED = 42
+
+_rng = np.random.RandomState(SEED)
+_A = _rng.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_NOKTALAMA = re.compile(r"[^\w\s]")
+_RAKAM = re.compile(r"\d+")
+
+
+def normalize(text):
+    """Küçük harf (Türkçe I/İ), rakamlar tek simgeye, noktalama ve fazla boşluk atılır."""
+    text = str(text).replace("I", "ı").replace("İ", "i").lower()
+    text = _RAKAM.sub("0", text)
+    text = _NOKTALAMA.sub(" ", text)
+    return " ".join(text.split())
+
+
+def shingles(text):
+    words = normalize(text).split()
+    if len(words) < SHINGLE_WORDS:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def minhash(text):
+    """NUM_PERM uzunluğunda uint32 MinHash imzası."""
+    hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles(text)), dtype=np.uint64)
+    # (a*h + b) mod p; a, h < 2^32 olduğu için çarpım uint64'te taşmaz
+    values = (np.outer(hashes, _A) + _B) % MERSENNE
+    return (values.min(axis=0) & 0xFFFFFFFF).astype(np.uint32)
+
+
+def signatures(texts, workers=1):
+    if workers > 1:
+        with Pool(workers) as pool:
+            return np.vstack(pool.map(minhash, texts, chunksize=1024))
+    return np.vstack([minhash(t) for t in texts]) if texts else np.empty((0, NUM_PERM), np.uint32)
+
+
+class _Birlesim:
+    """Union-find; kümeler kök indeksiyle temsil edilir."""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def yakin_kopya_kumeleri(sigs, threshold=THRESHOLD, bands=BANDS):
+    """İmzalardan en az iki elemanlı yakın kopya kümelerini (indeks listeleri) döndürür.
+
+    Her LSH kovasında üyeler kovanın ilk elemanıyla karşılaştırılır (yıldız doğrulama);
+    büyük kalıp kovalarında bile karşılaştırma sayısı doğrusal kalır.
+    """
+    n = len(sigs)
+    rows = NUM_PERM // bands
+    uf = _Birlesim(n)
+    for band in range(bands):
+        buckets = defaultdict(list)
+        chunk = np.ascontiguousarray(sigs[:, band * rows:(band + 1) * rows])
+        for i in range(n):
+            buckets[chunk[i].tobytes()].append(i)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            anchor = members[0]
+            others = np.array(members[1:])
+            similarity = (sigs[others] == sigs[anchor]).mean(axis=1)
+            for j in others[similarity >= threshold]:
+                uf.union(anchor, int(j))
+
+    clusters = defaultdict(list)
+    for i in range(n):
+        clusters[uf.find(i)].append(i)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def analiz_et(paths, threshold=THRESHOLD, workers=1):
+    frames = []
+    for path in paths:
+        df = pd.read_csv(path)
+        df["split"] = os.path.basename(path)
+        df["satir"] = range(len(df))
+        frames.append(df[["split", "satir", "text", "label"]])
+    data = pd.concat(frames, ignore_index=True)
+    sigs = signatures(data["text"].tolist(), workers)
+    clusters = yakin_kopya_kumeleri(sigs, threshold)
+    return data, clusters
+
+
+def raporla(data, clusters, splits):
+    cross = [c for c in clusters if data.loc[c, "split"].nunique() > 1]
+    conflicts = [c for c in clusters if data.loc[c, "label"].nunique() > 1]
+    print("\n" + "=" * 70)
+    print(f"🔁 YAKIN KOPYA ANALİZİ ({len(data)} satır, {len(clusters)} küme)")
+    print("=" * 70)
+    print(f"{'Dosya':<25} | {'Satır':<7} | {'Kopya satır':<11} | {'Diğer dosyada da var':<20}")
+    print("-" * 70)
+    for split in splits:
+        in_split = data["split"] == split
+        dup = sum(max(0, int(in_split[c].sum()) - 1) for c in clusters)
+        leaked = sum(int(in_split[c].sum()) for c in cross)
+        print(f"{split:<25} | {int(in_split.sum()):<7} | {dup:<11} | {leaked:<20}")
+    print("-" * 70)
+    print(f"⚠️ Dosyalar arası sızıntı: {len(cross)} küme, etiket çakışması: {len(conflicts)} küme")
+    for c in (cross + [c for c in conflicts if c not in cross])[:10]:
+        print("   ↳ " + " | ".join(f"{data.at[i, 'split']}:{data.at[i, 'satir']} (etiket {data.at[i, 'label']})"
+                                     for i in c[:4]) + (" ..." if len(c) > 4 else ""))
+        print(f"     \"{str(data.at[c[0], 'text'])[:90]}\"")
+
+
+def kumeleri_kaydet(data, clusters, output):
+    rows = [{"kume": k, **data.loc[i, ["split", "satir", "label", "text"]].to_dict()}
+            for k, c in enumerate(clusters) for i in c]
+    pd.DataFrame(rows, columns=["kume", "split", "satir", "label", "text"]).to_csv(output, index=False)
+    print(f"💾 Küme raporu → {output}")
+
+
+def temizle(data, clusters, splits):
+    """İlk dosya (train) dışındakilere dokunmadan kopyaları ilk dosyadan atar.
+
+    - Etiket çakışması olan kümelerin ilk dosyadaki tüm üyeleri atılır.
+    - Diğer dosyalarda (test) da bulunan kümelerin ilk dosyadaki üyeleri atılır (sızıntı).
+    - Kalan kümelerde ilk dosyada yalnızca ilk satır tutulur.
+    Diğer dosyalar (test) olduğu gibi yazılır; değerlendirme kümesi değişmez.
+    """
+    drop = set()
+    for c in clusters:
+        members = data.loc[c]
+        conflict = members["label"].nunique() > 1
+        cross = members["split"].nunique() > 1
+        train = members[members["split"] == splits[0]]
+        if conflict or cross:
+            drop.update(train.index)
+        else:
+            drop.update(train.index[1:])
+    for split in splits:
+        kept = data[(data["split"] == split) & ~data.index.isin(drop)]
+        root, ext = os.path.splitext(split)
+        output = f"{root}-dedup{ext}"
+        kept[["text", "label"]].to_csv(output, index=False)
+        print(f"🧹 {split}: {int((data['split'] == split).sum()) - len(kept)} satır atıldı → {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MinHash/LSH ile yakın kopya ve train/test sızıntı tespiti.")
+    parser.add_argument("paths", nargs="+", help="CSV dosyaları (text,label); ilki train kabul edilir")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Tahmini Jaccard eşiği")
+    parser.add_argument("--workers", type=int, default=1, help="İmza hesaplama süreç sayısı")
+    parser.add_argument("--report", default="yakin_kopyalar.csv", help="Küme raporu CSV'si")
+    parser.add_argument("--drop", action="store_true", help="Temizlenmiş <ad>-dedup.csv dosyalarını yaz")
+    args = parser.parse_args()
+
+    splits = [os.path.basename(p) for p in args.paths]
+    data, clusters = analiz_et(args.paths, args.threshold, args.workers)
+    raporla(data, clusters, splits)
+    kumeleri_kaydet(data, clusters, args.report)
+    if args.drop:
+        temizle(data, clusters, splits)
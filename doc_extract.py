@@ -0,0 +1,93 @@
+# Bu kod, PDF ve DOCX dosyalarından metin çıkarmayı tek bir modülde toplar.
+# Her arka uç (pypdf, PyMuPDF, pdfminer.six, python-docx) aynı arayüzü sunar:
+# dosyayı sayfa sayfa okuyup her sayfanın metnini üretir. Backend seçilmezse
+# makinede kurulu olan en hızlı arka uç kullanılır (sıra benchmarks/bench_extract.py
+# ölçümlerine göredir).
+#
+# Kullanım:
+#   from doc_extract import iter_pages
+#   for page_text in iter_pages("sozlesme.pdf"):
+#       ...
+import importlib.util
+import os
+
+
+def _pymupdf_pages(path):
+    import fitz  # PyMuPDF
+
+    with fitz.open(path) as doc:
+        for page in doc:
+            yield page.get_text("text")
+
+
+def _pypdf_pages(path):
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+def _pdfminer_pages(path):
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+
+    for layout in extract_pages(path):
+        yield "".join(el.get_text() for el in layout if isinstance(el, LTTextContainer))
+
+
+def _docx_pages(path):
+    # DOCX'te sabit sayfa yoktur; tüm paragraflar tek "sayfa" olarak döner.
+    import docx
+
+    document = docx.Document(path)
+    yield "\n".join(p.text for p in document.paragraphs)
+
+
+# uzantı -> [(backend adı, gerekli modül, sayfa üreteci)], hızlıdan yavaşa
+BACKENDS = {
+    ".pdf": [
+        ("pymupdf", "fitz", _pymupdf_pages),
+        ("pypdf", "pypdf", _pypdf_pages),
+        ("pdfminer", "pdfminer", _pdfminer_pages),
+    ],
+    ".docx": [
+        ("python-docx", "docx", _docx_pages),
+    ],
+}
+
+
+def available_backends(extension=".pdf"):
+    """Bu makinede kurulu olan arka uçların adlarını tercih sırasıyla döndürür."""
+    return [
+        name for name, module, _ in BACKENDS.get(extension, [])
+        if importlib.util.find_spec(module) is not None
+    ]
+
+
+def iter_pages(path, backend=None):
+    """Dosyanın sayfa metinlerini sırayla üretir.
+
+    backend verilmezse dosya türü için kurulu en hızlı arka uç seçilir.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in BACKENDS:
+        raise ValueError("Desteklenmeyen dosya türü. Sadece PDF veya DOCX olmalı.")
+
+    candidates = BACKENDS[extension]
+    if backend is not None:
+        candidates = [c for c in candidates if c[0] == backend]
+        if not candidates:
+            raise ValueError(f"'{backend}' arka ucu {extension} dosyalarını desteklemiyor.")
+    for name, module, pages in candidates:
+        if importlib.util.find_spec(module) is not None:
+            return pages(path)
+    raise ImportError(
+        f"{extension} için kurulu arka uç yok. Şunlardan birini kurun: "
+        + ", ".join(c[0] for c in candidates)
+    )
+
+
+def extract_text(path, backend=None):
+    """Tüm sayfaları satır sonlarıyla birleştirip tek metin olarak döndürür."""
+    return "\n".join(iter_pages(path, backend))
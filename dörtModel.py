@@ -1,18 +1,22 @@
+import argparse
 import sys
 import os
 import shutil
 import numpy as np
 import torch
-from datasets import load_dataset
 from transformers import (
     AutoTokenizer,
     AutoModelForSequenceClassification,
-    Trainer,
     TrainingArguments,
     DataCollatorWithPadding
 )
 import evaluate
 
+from best_checkpoint import best_model_callbacks, checkpoint_args, save_model_atomic
+from token_budget_sampler import TOKEN_BUDGET, TokenBudgetTrainer
+from model_scheduler import default_parallel, run_concurrent
+from tokenize_cache import tokenized_dataset
+
 # ⚠️ ÖN KOŞULLAR:
 # 'dataset-v1-train.csv' ve 'datase-v1-test.csv' dosyaları bu kod ile aynı klasörde olmalıdır.
 # Gerekli kütüphaneler (transformers, datasets, evaluate, numpy) yüklü olmalıdır.
@@ -30,9 +34,7 @@ files = {
     "train": "dataset-v1-train.csv", 
     "test": "datase-v1-test.csv"
 }
-try:
-    dataset = load_dataset("csv", data_files=files)
-except FileNotFoundError:
+if not all(os.path.exists(path) for path in files.values()):
     print("🚨 HATA: Veri setleri (dataset-v1-train.csv veya datase-v1-test.csv) bulunamadı.")
     sys.exit(1)
 
@@ -53,11 +55,18 @@ def compute_metrics(eval_pred):
     f1w = f1.compute(predictions=preds, references=labels, average="weighted")["f1"]
     return {"accuracy": accuracy, "f1_weighted": f1w}
 
+# Checkpoint: False ise yalnızca en iyi ağırlıklar bellekte tutulur (epoch başına
+# ~440MB tam checkpoint ve optimizer dökümü yazılmaz); True ise eğitim devam ettirilebilir.
+RESUMABLE_CHECKPOINTS = False
+
 # Cihaz Ayarı
 device = "cuda" if torch.cuda.is_available() else ("mps" if torch.backends.mps.is_available() else "cpu")
 
-def train_and_evaluate_model(model_info, dataset):
-    """Belirtilen modeli fine-tuning eder ve test eder."""
+def train_and_evaluate_model(model_info, files, callbacks=None):
+    """Belirtilen modeli fine-tuning eder ve test eder.
+
+    callbacks verilirse (eşzamanlı çalıştırmada ilerleme bildirimi) tqdm çubukları kapatılır.
+    """
     model_path = model_info["path"]
     model_alias = model_info["alias"]
     output_dir = f"./results-{model_alias}"
@@ -70,12 +79,8 @@ def train_and_evaluate_model(model_info, dataset):
     # Tokenizer yükleme
     tokenizer = AutoTokenizer.from_pretrained(model_path)
     
-    # Ön İşleme fonksiyonu
-    def preprocess_function(examples):
-        return tokenizer(examples["text"], truncation=True, max_length=256)
-
-    # Veri setini token haline getirme
-    tokenized_datasets = dataset.map(preprocess_function, batched=True)
+    # Veri setini token haline getirme (aynı tokenizer + CSV için önbellekten gelir)
+    tokenized_datasets = tokenized_dataset(files, tokenizer, max_length=256)
     
     # 🚨 ÖNEMLİ DÜZELTME: ignore_mismatched_sizes=True ekleniyor.
     # Bu, eski modelin 180 veya 23 sınıflık çıkış katmanını atıp yeni, 3 sınıflık katman oluşturur.
@@ -92,38 +97,39 @@ def train_and_evaluate_model(model_info, dataset):
     args = TrainingArguments(
         output_dir=output_dir,
         num_train_epochs=5,  # Karşılaştırma için yeterli bir epoch sayısı.
-        per_device_train_batch_size=16, 
+        per_device_train_batch_size=16,   # TokenBudgetTrainer'da batch başına cümle üst sınırı
         per_device_eval_batch_size=16,
         learning_rate=3e-5,
         evaluation_strategy="epoch",
-        save_strategy="epoch",
-        load_best_model_at_end=True,
+        **checkpoint_args(RESUMABLE_CHECKPOINTS),
         metric_for_best_model="f1_weighted",
         greater_is_better=True,
         logging_steps=10,
         fp16=torch.cuda.is_available(),
-        report_to=["none"] # Raporlamayı devre dışı bırakıyoruz.
+        report_to=["none"], # Raporlamayı devre dışı bırakıyoruz.
+        disable_tqdm=callbacks is not None,
     )
 
     collator = DataCollatorWithPadding(tokenizer=tokenizer)
 
-    trainer = Trainer(
+    # Batch'ler TOKEN_BUDGET token'a göre kurulur (dolgu azalır); en fazla 16 cümle, adım sayısı korunur.
+    trainer = TokenBudgetTrainer(
+        max_tokens=TOKEN_BUDGET,
         model=model,
         args=args,
         train_dataset=tokenized_datasets["train"],
         eval_dataset=tokenized_datasets["test"],
         tokenizer=tokenizer,
         data_collator=collator,
-        compute_metrics=compute_metrics
+        compute_metrics=compute_metrics,
+        callbacks=(callbacks or []) + best_model_callbacks(RESUMABLE_CHECKPOINTS)
     )
 
     # Eğitimi Başlat
     trainer.train()
 
     # Modeli Kaydet
-    os.makedirs(save_path, exist_ok=True)
-    trainer.save_model(save_path)
-    tokenizer.save_pretrained(save_path)
+    save_model_atomic(trainer, tokenizer, save_path)
     print(f"✅ Model kaydedildi: {save_path}")
 
     # Test/Değerlendirme
@@ -136,23 +142,46 @@ def train_and_evaluate_model(model_info, dataset):
     return evaluation_results
 
 # 4️⃣ Tüm Modelleri Eğitme ve Sonuçları Toplama
+def _ozet(results):
+    if "Error" in results:
+        return {"Error": results["Error"]}
+    return {
+        "Accuracy": results.get("eval_accuracy", 0),
+        "F1_Weighted": results.get("eval_f1_weighted", 0),
+        "Loss": results.get("eval_loss", float('inf'))
+    }
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MODEL_LIST modellerini eğitip karşılaştırır.")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Eşzamanlı eğitim süreci sayısı (varsayılan: CPU'da çekirdeğe göre, GPU'da 1)")
+    cli = parser.parse_args()
+    jobs = cli.jobs or (default_parallel(len(MODEL_LIST)) if device == "cpu" else 1)
+
     all_results = {}
     
     # 📁 Tüm eğitilmiş modelleri tutacak ana klasörü oluştur
     os.makedirs("./trained-models", exist_ok=True)
 
-    for model_info in MODEL_LIST:
-        try:
-            results = train_and_evaluate_model(model_info, dataset)
-            all_results[model_info["name"]] = {
-                "Accuracy": results.get("eval_accuracy", 0),
-                "F1_Weighted": results.get("eval_f1_weighted", 0),
-                "Loss": results.get("eval_loss", float('inf'))
-            }
-        except Exception as e:
-            print(f"❌ KRİTİK HATA OLUŞTU ({model_info['name']}): {e}")
-            all_results[model_info["name"]] = {"Error": str(e)}
+    if jobs > 1:
+        # Token önbelleğini önceden doldur: süreçler aynı Arrow dosyalarını bellek eşlemeli paylaşır.
+        for model_info in MODEL_LIST:
+            tokenized_dataset(files, AutoTokenizer.from_pretrained(model_info["path"]), max_length=256)
+        results = run_concurrent(
+            train_and_evaluate_model,
+            [(model_info["name"], (model_info, files)) for model_info in MODEL_LIST],
+            max_parallel=jobs,
+        )
+        for model_info in MODEL_LIST:
+            all_results[model_info["name"]] = _ozet(results[model_info["name"]])
+    else:
+        for model_info in MODEL_LIST:
+            try:
+                results = train_and_evaluate_model(model_info, files)
+                all_results[model_info["name"]] = _ozet(results)
+            except Exception as e:
+                print(f"❌ KRİTİK HATA OLUŞTU ({model_info['name']}): {e}")
+                all_results[model_info["name"]] = {"Error": str(e)}
 
     # 5️⃣ Karşılaştırma Sonuçlarını Yazdırma (Raporun Ana Verisi)
     print("\n\n=======================================================")
@@ -0,0 +1,206 @@
+# Bu kod, gazetteers/ klasöründeki kelime listelerinden (il, banka, mahkeme vb.)
+# Aho-Corasick otomatı kurar ve metindeki tüm sözlük geçişlerini tek taramada bulur.
+# Otomat bir kez kurulur ve diske (pickle) kaydedilir; liste değişince yeniden kurulur.
+# Tarama maliyeti sözlük boyutuyla değil metin uzunluğuyla büyür.
+import hashlib
+import os
+import pickle
+import re
+from collections import deque
+
+GAZETTEER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gazetteers")
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "gazetteer")
+# Katlama kuralı veya otomat yapısı değişirse artırılmalı (eski önbellek geçersizleşir)
+FOLD_VERSION = 1
+
+# Türkçe büyük/küçük harf: "İ" -> "i", "I" -> "ı". str.lower() "İ" için iki
+# karakter ürettiği için önce çevrilir; böylece katlanmış metin ile orijinal
+# metnin uzunlukları (ve ofsetleri) birebir aynı kalır.
+_TR_UPPER = str.maketrans({"İ": "i", "I": "ı"})
+_SPACES = re.compile(r"\s+")
+
+_loaded = {}
+
+
+def turkish_fold(text):
+    """Metni Türkçe kurallarıyla küçültür (uzunluk korunur)."""
+    return text.translate(_TR_UPPER).lower()
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def _normalize_entry(entry):
+    return _SPACES.sub(" ", turkish_fold(entry.strip()))
+
+
+def read_list(name, directory=GAZETTEER_DIR):
+    """gazetteers/<name>.txt dosyasını okur ('#' ile başlayan satırlar yorumdur)."""
+    entries = []
+    with open(os.path.join(directory, f"{name}.txt"), encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                entries.append(line)
+    return entries
+
+
+def alternation(entries):
+    """Girdileri regex alternasyonu olarak döndürür (uzun olan önce denenir)."""
+    parts = sorted(set(entries), key=len, reverse=True)
+    return "|".join(r"\s+".join(re.escape(w) for w in p.split()) for p in parts)
+
+
+def _build_automaton(entries):
+    """(girdi, etiket) çiftlerinden goto / fail / çıktı tablolarını kurar."""
+    goto = [{}]
+    outputs = [()]
+    for entry, label in entries:
+        node = 0
+        for ch in entry:
+            nxt = goto[node].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[node][ch] = nxt
+                goto.append({})
+                outputs.append(())
+            node = nxt
+        if (len(entry), label) not in outputs[node]:
+            outputs[node] = outputs[node] + ((len(entry), label),)
+
+    # BFS ile fail bağlantıları; çıktılar fail zinciri boyunca birleştirilir
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        node = queue.popleft()
+        for ch, child in goto[node].items():
+            queue.append(child)
+            f = fail[node]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[child] = goto[f].get(ch, 0)
+            outputs[child] = outputs[child] + outputs[fail[child]]
+    return goto, fail, outputs
+
+
+class Gazetteer:
+    """Bir veya birden çok kelime listesinden derlenmiş sözlük eşleyici.
+
+    re.Pattern gibi sub() sunar; bu sayede MASK_RULES içinde "pattern"
+    yerine doğrudan kullanılabilir. Eşleşmeler kelime sınırına oturmalıdır
+    ve çakışmalarda en soldaki en uzun girdi seçilir.
+    """
+
+    def __init__(self, *names, directory=GAZETTEER_DIR, cache_dir=CACHE_DIR):
+        self.names = names
+        entries = []
+        for name in names:
+            entries.extend(read_list(name, directory))
+        self._compile([(entry, 0) for entry in entries], cache_dir)
+
+    @classmethod
+    def union(cls, gazetteers, cache_dir=CACHE_DIR):
+        """Birden çok sözlüğü tek otomatta birleştirir; etiket = listedeki sıra.
+
+        Aynı aralık birden çok sözlükte geçiyorsa küçük etiket kazanır.
+        """
+        merged = cls.__new__(cls)
+        merged.names = tuple(name for g in gazetteers for name in g.names)
+        merged._compile(
+            [(entry, label) for label, g in enumerate(gazetteers) for entry in g.entries],
+            cache_dir,
+        )
+        return merged
+
+    def _compile(self, labeled, cache_dir):
+        self.entries = [entry for entry, _ in labeled]
+        folded = sorted({(_normalize_entry(e), label) for e, label in labeled if e.strip()})
+        digest = hashlib.sha256(f"{FOLD_VERSION}\n".encode("utf-8"))
+        for entry, label in folded:
+            digest.update(f"{label}\t{entry}\n".encode("utf-8"))
+        self.key = digest.hexdigest()[:16]
+        if self.key not in _loaded:
+            _loaded[self.key] = self._load_or_build(folded, cache_dir)
+        self._goto, self._fail, self._outputs = _loaded[self.key]
+
+    def _load_or_build(self, folded, cache_dir):
+        path = os.path.join(cache_dir, f"{self.key}.pkl") if cache_dir else None
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        automaton = _build_automaton(folded)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(automaton, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        return automaton
+
+    def candidates_labeled(self, text):
+        """Kelime sınırına uyan tüm (örtüşenler dahil) (başlangıç, bitiş, etiket) üçlüleri.
+
+        Sıra: başlangıç artan, aynı başlangıçta uzun olan önce.
+        """
+        folded = turkish_fold(text)
+        offsets = None
+        if "  " in folded or any(c in folded for c in "\t\n\r\f\v"):
+            # Boşluk dizileri tek boşluğa indirilir, ofsetler orijinale eşlenir.
+            pieces, offsets, pos = [], [], 0
+            for m in _SPACES.finditer(folded):
+                pieces.append(folded[pos:m.start()])
+                offsets.extend(range(pos, m.start()))
+                pieces.append(" ")
+                offsets.append(m.start())
+                pos = m.end()
+            pieces.append(folded[pos:])
+            offsets.extend(range(pos, len(folded)))
+            offsets.append(len(folded))
+            folded = "".join(pieces)
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        candidates = []
+        node = 0
+        for i, ch in enumerate(folded):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, label in outputs[node]:
+                start, end = i + 1 - length, i + 1
+                if start > 0 and _is_word_char(folded[start - 1]) and _is_word_char(folded[start]):
+                    continue
+                if end < len(folded) and _is_word_char(folded[end]) and _is_word_char(folded[end - 1]):
+                    continue
+                candidates.append((start, -length, label))
+
+        for start, neg_length, label in sorted(candidates):
+            end = start - neg_length
+            if offsets is None:
+                yield start, end, label
+            else:
+                yield offsets[start], offsets[end - 1] + 1, label
+
+    def finditer_labeled(self, text):
+        """Metindeki (başlangıç, bitiş, etiket) üçlülerini soldan sağa üretir."""
+        last_end = 0
+        for start, end, label in self.candidates_labeled(text):
+            if start < last_end:
+                continue
+            last_end = end
+            yield start, end, label
+
+    def finditer(self, text):
+        """Metindeki (başlangıç, bitiş) aralıklarını soldan sağa üretir."""
+        for start, end, _ in self.finditer_labeled(text):
+            yield start, end
+
+    def sub(self, repl, text):
+        """Eşleşen her aralığı repl ile değiştirir (re.sub ile aynı sıra)."""
+        pieces, pos = [], 0
+        for start, end in self.finditer(text):
+            pieces.append(text[pos:start])
+            pieces.append(repl)
+            pos = end
+        pieces.append(text[pos:])
+        return "".join(pieces)
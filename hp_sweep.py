@@ -0,0 +1,216 @@
+# Bu kod, modelKıyaslama.py'deki train_and_evaluate_model_v3 akışı üzerinde
+# hiperparametre taraması yapar. Arama uzayından (öğrenme oranı, batch boyu, epoch,
+# warmup, weight decay) rastgele denemeler seçilir; her epoch sonundaki f1_weighted
+# önceki denemelerin aynı epoch'taki medyanının altındaysa deneme erken durdurulur
+# (median stopping). Tüm denemeler ve epoch eğrileri SQLite sonuç deposuna yazılır;
+# aynı çalışma (study) yeniden başlatılınca tamamlanmış denemeler atlanır.
+#
+# Kullanım:
+#   python hp_sweep.py --model yg_eqa_v3 --trials 20 --study v4
+import argparse
+import itertools
+import json
+import os
+import random
+import sqlite3
+import statistics
+import time
+
+from transformers import TrainerCallback
+
+from modelKıyaslama import MODEL_LIST_FOCUSED_V3, V3_HPARAMS, files, train_and_evaluate_model_v3
+
+STORE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "sweeps.sqlite")
+SEARCH_SPACE = {
+    "learning_rate": [1e-5, 2e-5, 3e-5, 5e-5],
+    "batch_size": [8, 16, 32],
+    "num_train_epochs": [4, 6, 8],
+    "warmup_ratio": [0.0, 0.06, 0.1],
+    "weight_decay": [0.0, 0.01, 0.1],
+}
+MIN_TRIALS = 3       # medyan karşılaştırması için gereken önceki deneme sayısı
+WARMUP_EPOCHS = 1    # ilk epoch'larda budama yapılmaz
+
+
+class SweepStore:
+    """Denemeler ve epoch başına metrikler için SQLite deposu."""
+
+    def __init__(self, path=STORE_FILE):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS trials ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, study TEXT NOT NULL, model TEXT NOT NULL,"
+            " params TEXT NOT NULL, status TEXT NOT NULL, f1 REAL, accuracy REAL, loss REAL,"
+            " epochs REAL, seconds REAL, created REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS epochs ("
+            " trial_id INTEGER NOT NULL, epoch INTEGER NOT NULL, f1 REAL NOT NULL, loss REAL,"
+            " PRIMARY KEY (trial_id, epoch))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def params_key(params):
+        return json.dumps(params, sort_keys=True)
+
+    def start(self, study, model, params):
+        cur = self._conn.execute(
+            "INSERT INTO trials (study, model, params, status, created) VALUES (?, ?, ?, 'running', ?)",
+            (study, model, self.params_key(params), time.time()),
+        )
+        self._conn.commit()
+        return cur.lastrowid
+
+    def log_epoch(self, trial_id, epoch, f1, loss):
+        self._conn.execute("INSERT OR REPLACE INTO epochs VALUES (?, ?, ?, ?)", (trial_id, epoch, f1, loss))
+        self._conn.commit()
+
+    def finish(self, trial_id, status, results, epochs, seconds):
+        self._conn.execute(
+            "UPDATE trials SET status = ?, f1 = ?, accuracy = ?, loss = ?, epochs = ?, seconds = ? WHERE id = ?",
+            (status, results.get("eval_f1_weighted"), results.get("eval_accuracy"),
+             results.get("eval_loss"), epochs, seconds, trial_id),
+        )
+        self._conn.commit()
+
+    def done_params(self, study, model):
+        rows = self._conn.execute(
+            "SELECT params FROM trials WHERE study = ? AND model = ? AND status IN ('complete', 'pruned')",
+            (study, model),
+        )
+        return {row[0] for row in rows}
+
+    def best_so_far(self, study, model, epoch, exclude):
+        """Diğer denemelerin epoch'a kadarki en iyi F1 değerleri (medyan budama için)."""
+        rows = self._conn.execute(
+            "SELECT e.trial_id, MAX(e.f1) FROM epochs e JOIN trials t ON t.id = e.trial_id"
+            " WHERE t.study = ? AND t.model = ? AND t.status IN ('complete', 'pruned') AND t.id != ?"
+            "   AND e.epoch <= ? GROUP BY e.trial_id"
+            " HAVING MAX(e.epoch) >= ?",
+            (study, model, exclude, epoch, epoch),
+        )
+        return [f1 for _, f1 in rows]
+
+    def leaderboard(self, study, model):
+        """Tamamlanan ve budanan denemeler, F1'e göre; hata verenler sıralamaya girmez."""
+        return self._conn.execute(
+            "SELECT id, params, status, f1, accuracy, epochs, seconds FROM trials"
+            " WHERE study = ? AND model = ? AND status IN ('complete', 'pruned') ORDER BY f1 DESC",
+            (study, model),
+        ).fetchall()
+
+    def error_count(self, study, model):
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM trials WHERE study = ? AND model = ? AND status = 'error'",
+            (study, model),
+        ).fetchone()[0]
+
+
+class MedianStoppingCallback(TrainerCallback):
+    """Epoch sonu F1, önceki denemelerin aynı epoch'taki medyanının altındaysa eğitimi durdurur."""
+
+    def __init__(self, store, study, model, trial_id, min_trials=MIN_TRIALS, warmup_epochs=WARMUP_EPOCHS):
+        self.store = store
+        self.study = study
+        self.model = model
+        self.trial_id = trial_id
+        self.min_trials = min_trials
+        self.warmup_epochs = warmup_epochs
+        self.best = float("-inf")
+        self.epochs = 0
+        self.pruned = False
+        self.training = True
+
+    def on_train_end(self, args, state, control, **kwargs):
+        # Sonraki trainer.evaluate() en iyi ağırlıklarla çalışır; epoch eğrisine girmemeli.
+        self.training = False
+
+    def on_evaluate(self, args, state, control, metrics=None, **kwargs):
+        if not self.training or not metrics or "eval_f1_weighted" not in metrics:
+            return
+        epoch = round(state.epoch)
+        self.epochs = epoch
+        self.best = max(self.best, metrics["eval_f1_weighted"])
+        self.store.log_epoch(self.trial_id, epoch, metrics["eval_f1_weighted"], metrics.get("eval_loss"))
+        if epoch <= self.warmup_epochs:
+            return
+        others = self.store.best_so_far(self.study, self.model, epoch, self.trial_id)
+        if len(others) >= self.min_trials and self.best < statistics.median(others):
+            print(f"✂️ Deneme {self.trial_id} budandı: epoch {epoch} F1 {self.best:.4f} < "
+                  f"medyan {statistics.median(others):.4f} ({len(others)} deneme)")
+            self.pruned = True
+            control.should_training_stop = True
+
+
+def sample_configs(space, n, seed):
+    """Arama uzayından tekrarsız n rastgele yapılandırma seçer."""
+    keys = sorted(space)
+    grid = [dict(zip(keys, values)) for values in itertools.product(*(space[k] for k in keys))]
+    random.Random(seed).shuffle(grid)
+    return grid[:n]
+
+
+def tara(model_info, study, trials, seed=42, min_trials=MIN_TRIALS, warmup_epochs=WARMUP_EPOCHS, store=None):
+    store = store or SweepStore()
+    alias = model_info["alias"]
+    done = store.done_params(study, alias)
+    for params in sample_configs(SEARCH_SPACE, trials, seed):
+        if store.params_key(params) in done:
+            continue
+        trial_id = store.start(study, alias, params)
+        pruner = MedianStoppingCallback(store, study, alias, trial_id, min_trials, warmup_epochs)
+        start = time.perf_counter()
+        try:
+            results = train_and_evaluate_model_v3(model_info, files, hparams=params, callbacks=[pruner],
+                                                  run_name=f"sweep-{study}-{trial_id}", save=False)
+        except Exception as e:
+            print(f"❌ Deneme {trial_id} hata verdi: {e}")
+            store.finish(trial_id, "error", {}, pruner.epochs, time.perf_counter() - start)
+            continue
+        store.finish(trial_id, "pruned" if pruner.pruned else "complete", results, pruner.epochs,
+                     time.perf_counter() - start)
+    return store.leaderboard(study, alias)
+
+
+def raporla(rows, study, model_alias, errors=0):
+    print("\n" + "=" * 110)
+    print(f"🔬 HİPERPARAMETRE TARAMASI: {model_alias} (çalışma: {study}, {len(rows)} deneme)")
+    print("=" * 110)
+    print(f"{'#':<4} | {'LR':<7} | {'Batch':<5} | {'Epoch':<5} | {'Warmup':<6} | {'WD':<5} | "
+          f"{'Durum':<9} | {'F1 (w)':<7} | {'Accuracy':<8} | {'Koşulan':<7} | {'Süre (sn)':<9}")
+    print("-" * 110)
+    for trial_id, params, status, f1w, accuracy, epochs, seconds in rows:
+        p = json.loads(params)
+        print(f"{trial_id:<4} | {p['learning_rate']:<7.0e} | {p['batch_size']:<5} | {p['num_train_epochs']:<5} | "
+              f"{p['warmup_ratio']:<6} | {p['weight_decay']:<5} | {status:<9} | {f1w or 0:<7.4f} | "
+              f"{accuracy or 0:<8.4f} | {epochs or 0:<7.0f} | {seconds or 0:<9.0f}")
+    print("-" * 110)
+    planned = sum(json.loads(params)["num_train_epochs"] for _, params, *_ in rows)
+    run = sum(epochs or 0 for *_, epochs, _ in rows)
+    if planned:
+        print(f"✂️ Budama ile {planned} planlanan epoch'tan {run:.0f} tanesi koşuldu (%{run / planned * 100:.0f}).")
+    if errors:
+        print(f"❌ {errors} deneme hata verdi; sıralamaya ve epoch toplamına katılmadı.")
+    if rows:
+        print(f"🥇 EN İYİ: {json.loads(rows[0][1])} → F1 {rows[0][3] or 0:.4f}")
+        print(f"   (V3 varsayılanları: {V3_HPARAMS})")
+
+
+if __name__ == "__main__":
+    aliases = {m["alias"]: m for m in MODEL_LIST_FOCUSED_V3}
+    parser = argparse.ArgumentParser(description="train_and_evaluate_model_v3 için erken budamalı hiperparametre taraması.")
+    parser.add_argument("--model", choices=sorted(aliases), default=MODEL_LIST_FOCUSED_V3[-1]["alias"])
+    parser.add_argument("--study", default="varsayilan", help="Sonuç deposundaki çalışma adı")
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--min-trials", type=int, default=MIN_TRIALS)
+    parser.add_argument("--warmup-epochs", type=int, default=WARMUP_EPOCHS)
+    args = parser.parse_args()
+
+    store = SweepStore()
+    rows = tara(aliases[args.model], args.study, args.trials, args.seed, args.min_trials, args.warmup_epochs, store)
+    raporla(rows, args.study, args.model, store.error_count(args.study, args.model))
@@ -0,0 +1,117 @@
+# Bu kod, maskelenmiş cümleleri SQLite tabanlı kalıcı bir önbellekte tutar.
+# Anahtar: cümle metni + NER model adı + kural seti sürümünün SHA-256 özeti.
+# Sözleşmelerdeki tekrar eden kalıp maddeler (tebligat, yetkili mahkeme, imza
+# blokları) ikinci kez NER'e ve regex'e girmez. Kayıt sayısı veya toplam boyut
+# sınırı aşılınca en uzun süredir kullanılmayan (LRU) kayıtlar silinir.
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from data_mask import MASK_ENGINE
+from mask_spans import SOURCE_PRIORITY, Span
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "mask_cache.sqlite")
+MAX_ENTRIES = 200_000
+MAX_BYTES = 512 * 1024 * 1024
+
+
+def cache_namespace(ner_model_name, engine=MASK_ENGINE):
+    """Model adı, kural seti sürümü ve çakışma politikasından ad alanı üretir."""
+    priority = ",".join(f"{k}={v}" for k, v in sorted(SOURCE_PRIORITY.items()))
+    return f"{ner_model_name}|{engine.version}|{priority}"
+
+
+class MaskCache:
+    """Cümle -> (maskeli metin, aralıklar) için LRU kalıcı önbellek."""
+
+    def __init__(self, path=CACHE_FILE, namespace="", max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.path = path
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Toplu işte birden çok süreç aynı dosyaya yazar; kilit için beklenir.
+        self._conn = sqlite3.connect(path, timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS masks ("
+            " key TEXT PRIMARY KEY, masked TEXT NOT NULL, spans TEXT NOT NULL,"
+            " size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS masks_last_used ON masks(last_used)")
+        self._conn.commit()
+
+    def key(self, text):
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts):
+        """Önbellekte bulunan cümleler için {metin: (maskeli, [Span])} döndürür."""
+        keys = {self.key(t): t for t in set(texts)}
+        found = {}
+        key_list = list(keys)
+        for i in range(0, len(key_list), 500):  # SQLite parametre sınırı
+            chunk = key_list[i:i + 500]
+            rows = self._conn.execute(
+                f"SELECT key, masked, spans FROM masks WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, masked, spans in rows:
+                found[keys[key]] = (masked, [Span(*s) for s in json.loads(spans)])
+
+        if found:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE masks SET last_used = ? WHERE key = ?",
+                [(now, self.key(t)) for t in found],
+            )
+            self._conn.commit()
+        self.hits += sum(1 for t in texts if t in found)
+        self.misses += sum(1 for t in texts if t not in found)
+        return found
+
+    def put_many(self, items):
+        """items: {metin: (maskeli, [Span])}. Yazdıktan sonra sınırları uygular."""
+        now = time.time()
+        rows = []
+        for text, (masked, spans) in items.items():
+            spans_json = json.dumps([list(s) for s in spans], ensure_ascii=False)
+            size = len(masked.encode("utf-8")) + len(spans_json.encode("utf-8"))
+            rows.append((self.key(text), masked, spans_json, size, now))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO masks (key, masked, spans, size, last_used) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._evict()
+        self._conn.commit()
+
+    def _evict(self):
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM masks").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # Boyut sınırı için ortalama kayıt boyutundan silinecek adet tahmin edilir.
+        excess = max(count - self.max_entries, 0)
+        if total > self.max_bytes:
+            excess = max(excess, int((total - self.max_bytes) / max(total / count, 1)) + 1)
+        self._conn.execute(
+            "DELETE FROM masks WHERE key IN (SELECT key FROM masks ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+
+    def stats(self):
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM masks").fetchone()
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "entries": count,
+            "bytes": total,
+        }
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,163 @@
+# Bu kod, maskeleme sonuçlarını aşağı akıştaki analiz işleri için yapılandırılmış
+# biçimde yazar ve okur. JSONL her zaman kullanılabilir ve satır satır akışla
+# yazılır; pyarrow kuruluysa Parquet de desteklenir (kayıtlar parça parça row group
+# olarak yazılır, okurken yalnızca istenen sütunlar diskten okunur).
+#
+# Kayıt alanları: belge_id, id, baslangic, bitis, orjinal_cumle, maskelenmis_cumle,
+# maske_araliklari [(start, end, label, source)], degisti (manifest yoksa None),
+# risk ve risk_skoru (sınıflandırma yapılmadıysa None).
+#
+# Kullanım:
+#   sonuclari_yaz(kayitlar, "cikti.parquet", belge_id="sozlesme")
+#   for maskeli in read_column("masked_outputs/", "maskelenmis_cumle"):
+#       ...
+import glob
+import importlib.util
+import json
+import os
+
+from mask_spans import Span
+
+FORMATS = {".jsonl": "jsonl", ".parquet": "parquet"}
+COLUMNS = ["belge_id", "id", "baslangic", "bitis", "orjinal_cumle", "maskelenmis_cumle",
+           "maske_araliklari", "degisti", "risk", "risk_skoru"]
+PARQUET_ROW_GROUP = 4096
+
+
+def pyarrow_available():
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _satir(record, belge_id):
+    return {
+        "belge_id": belge_id,
+        "id": record["id"],
+        "baslangic": record.get("baslangic"),
+        "bitis": record.get("bitis"),
+        "orjinal_cumle": record["orjinal_cumle"],
+        "maskelenmis_cumle": record["maskelenmis_cumle"],
+        "maske_araliklari": [span._asdict() for span in record["maske_araliklari"]],
+        "degisti": record.get("degisti"),
+        "risk": record.get("risk"),
+        "risk_skoru": record.get("risk_skoru"),
+    }
+
+
+def write_jsonl(records, output_file, belge_id):
+    """Kayıtları geldikçe JSONL'e yazar; yazılan kayıt sayısını döndürür."""
+    count = 0
+    with open(output_file, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(_satir(record, belge_id), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _parquet_schema():
+    import pyarrow as pa
+
+    span = pa.struct([("start", pa.int32()), ("end", pa.int32()),
+                      ("label", pa.string()), ("source", pa.string())])
+    return pa.schema([
+        ("belge_id", pa.string()),
+        ("id", pa.int64()),
+        ("baslangic", pa.int64()),
+        ("bitis", pa.int64()),
+        ("orjinal_cumle", pa.string()),
+        ("maskelenmis_cumle", pa.string()),
+        ("maske_araliklari", pa.list_(span)),
+        ("degisti", pa.bool_()),
+        ("risk", pa.string()),
+        ("risk_skoru", pa.float64()),
+    ])
+
+
+def write_parquet(records, output_file, belge_id, row_group=PARQUET_ROW_GROUP):
+    """Kayıtları row_group'luk parçalar hâlinde Parquet'e yazar (bellekte tek parça tutulur)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema()
+    count = 0
+    with pq.ParquetWriter(output_file, schema, compression="zstd") as writer:
+        rows = []
+        for record in records:
+            rows.append(_satir(record, belge_id))
+            if len(rows) >= row_group:
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                count += len(rows)
+                rows = []
+        if rows or count == 0:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            count += len(rows)
+    return count
+
+
+def sonuclari_yaz(records, output_file, belge_id):
+    """Uzantıya göre (.jsonl / .parquet) yapılandırılmış çıktı yazar."""
+    extension = os.path.splitext(output_file)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Desteklenmeyen çıktı biçimi: {extension} (.jsonl veya .parquet olmalı)")
+    if FORMATS[extension] == "parquet":
+        if not pyarrow_available():
+            raise ImportError("Parquet çıktısı için pyarrow kurulu olmalı (pip install pyarrow).")
+        return write_parquet(records, output_file, belge_id)
+    return write_jsonl(records, output_file, belge_id)
+
+
+def output_files(paths):
+    """Dosya ve klasörleri (.jsonl / .parquet) dosya listesine açar."""
+    if isinstance(paths, str):
+        paths = [paths]
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for extension in FORMATS:
+                files.extend(glob.glob(os.path.join(path, f"*{extension}")))
+        else:
+            files.append(path)
+    return sorted(dict.fromkeys(files))
+
+
+def _spanlar(value):
+    return [Span(s["start"], s["end"], s["label"], s["source"]) for s in value]
+
+
+def iter_records(paths, columns=None):
+    """Kayıtları dosya dosya, sırayla üretir; columns verilirse yalnızca o alanlar döner.
+
+    Parquet'te istenmeyen sütunlar diskten hiç okunmaz ve dosyalar row group
+    row group okunur; JSONL'de her satır okunur ama yalnızca istenen alanlar
+    kayda konur.
+    """
+    columns = list(columns) if columns else COLUMNS
+    unknown = set(columns) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen sütun(lar): {', '.join(sorted(unknown))}")
+
+    for path in output_files(paths):
+        if path.lower().endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(path).iter_batches(columns=columns):
+                for row in batch.to_pylist():
+                    if "maske_araliklari" in row:
+                        row["maske_araliklari"] = _spanlar(row["maske_araliklari"])
+                    yield row
+        else:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    row = {name: data.get(name) for name in columns}
+                    if "maske_araliklari" in row:
+                        row["maske_araliklari"] = _spanlar(row["maske_araliklari"])
+                    yield row
+
+
+def read_column(paths, name):
+    """Tek bir sütunun değerlerini tüm dosyalar boyunca sırayla üretir."""
+    for row in iter_records(paths, [name]):
+        yield row[name]
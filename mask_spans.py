@@ -0,0 +1,114 @@
+# Bu kod, NER ve regex maskelemesini ortak bir "aralık" (span) katmanında birleştirir.
+# Her kaynak (başlangıç, bitiş, etiket, kaynak) kayıtları üretir; çakışmalar öncelik
+# politikasıyla çözülür ve metin yalnızca bir kez yeniden yazılır. Aralık listesi
+# aynı zamanda neyin nerede maskelendiğini gösteren bir denetim kaydıdır.
+from bisect import bisect_left
+from typing import NamedTuple
+
+from data_mask import MASK_ENGINE
+
+
+class Span(NamedTuple):
+    start: int
+    end: int
+    label: str   # metne yazılacak maske, ör. "[KİŞİ_ADI]"
+    source: str  # "ner:PER", "regex:hesap_no" gibi
+
+
+# Küçük değer = yüksek öncelik. Eski akışta NER önce uygulandığı için önde.
+SOURCE_PRIORITY = {"ner": 0, "regex": 1}
+
+
+def ner_spans(entities, mapping):
+    """NER pipeline çıktısını Span listesine çevirir (eşlemede olmayanlar atlanır)."""
+    spans = []
+    for entity in entities:
+        label = entity["entity_group"]
+        if label in mapping:
+            spans.append(Span(entity["start"], entity["end"], mapping[label], f"ner:{label}"))
+    return spans
+
+
+def regex_spans(text, engine=MASK_ENGINE):
+    """MaskEngine eşleşmelerini Span listesine çevirir.
+
+    "\\1[BANKA_BILGISI]" gibi grup korumalı maskelerde aralık, yalnızca
+    değişen kısma (ör. hesap numarasına) daraltılır.
+    """
+    spans = []
+    for start, end, name, replacement in engine.spans(text):
+        matched = text[start:end]
+        prefix = 0
+        if not replacement.startswith("["):
+            limit = min(len(matched), len(replacement))
+            while prefix < limit and matched[prefix] == replacement[prefix]:
+                prefix += 1
+        spans.append(Span(start + prefix, end, replacement[prefix:], f"regex:{name}"))
+    return spans
+
+
+def _outermost(spans):
+    """Boş aralıkları ve daha uzun bir aralığın içinde kalanları atar.
+
+    Aynı sınırlara sahip aralıklar birbirini içermez; aralarında öncelik seçer.
+    """
+    ordered = sorted((s for s in spans if s.start < s.end), key=lambda s: (s.start, -s.end))
+    kept, reach = [], -1
+    i = 0
+    while i < len(ordered):
+        # Aynı başlangıçlı grubun en uzunu önde; kısaları onun içindedir.
+        start, longest = ordered[i].start, ordered[i].end
+        while i < len(ordered) and ordered[i].start == start:
+            span = ordered[i]
+            if span.end == longest and span.end > reach:
+                kept.append(span)
+            i += 1
+        reach = max(reach, longest)
+    return kept
+
+
+def resolve_spans(spans, priority=SOURCE_PRIORITY):
+    """Çakışan aralıkları çözer; sonuç başlangıca göre sıralı ve çakışmasızdır.
+
+    Başka bir aralığın tamamen içinde kalan aralık, kaynağından bağımsız olarak
+    elenir (ör. "Ek-3 ile Ahmet Yılmaz" referans eşleşmesi içindeki NER kişi adı);
+    aksi halde uzun aralığın geri kalanı maskesiz kalırdı. Kısmi çakışmalarda önce
+    kaynak önceliği, sonra uzun aralık, sonra soldaki aralık kazanır.
+    """
+    ordered = sorted(
+        _outermost(spans),
+        key=lambda s: (priority.get(s.source.split(":", 1)[0], len(priority)), s.start - s.end, s.start),
+    )
+    starts, accepted = [], []
+    for span in ordered:
+        i = bisect_left(starts, span.start)
+        if i > 0 and accepted[i - 1].end > span.start:
+            continue
+        if i < len(accepted) and accepted[i].start < span.end:
+            continue
+        starts.insert(i, span.start)
+        accepted.insert(i, span)
+    return accepted
+
+
+def apply_spans(text, spans):
+    """Çakışmasız, sıralı aralıkları metne tek geçişte uygular."""
+    pieces, pos = [], 0
+    for span in spans:
+        pieces.append(text[pos:span.start])
+        pieces.append(span.label)
+        pos = span.end
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+def mask_with_spans(text, entities=(), ner_mapping=None, engine=MASK_ENGINE):
+    """NER varlıkları ve regex eşleşmelerini birleştirip metni bir kez maskeler.
+
+    (maskeli_metin, uygulanan_aralıklar) döndürür.
+    """
+    spans = regex_spans(text, engine)
+    if ner_mapping:
+        spans += ner_spans(entities, ner_mapping)
+    resolved = resolve_spans(spans)
+    return apply_spans(text, resolved), resolved
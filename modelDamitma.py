@@ -0,0 +1,281 @@
+import sys
+import os
+import shutil
+import time
+import numpy as np
+import torch
+import torch.nn.functional as F
+from datasets import Dataset, load_dataset
+from transformers import (
+    AutoTokenizer,
+    AutoModelForSequenceClassification,
+    Trainer,
+    TrainingArguments,
+    DataCollatorWithPadding
+)
+import evaluate
+
+from mask_output import output_files, read_column
+from risk_classifier import classify_batch, token_budget_batches
+
+# Bu kod, en iyi modeli (Law-EQA V3, F1=0.9202) öğretmen olarak kullanıp 4 ve 6
+# katmanlı öğrenci modellere bilgi damıtır (knowledge distillation). Öğrenci,
+# öğretmenin katmanlarından seçilenlerle başlatılır ve öğretmenin yumuşak
+# logit'lerini (sıcaklık T) etiketli eğitim verisi + etiketsiz maskeli cümleler
+# üzerinde taklit eder; etiketli örneklerde ayrıca gerçek etikete göre kayıp eklenir.
+# Sonuçlar öğretmenle aynı tabloda F1 ve saniyedeki cümle sayısı ile raporlanır.
+
+# ⚠️ ÖN KOŞULLAR: trained-models/yg_eqa_v3 (modelKıyaslama.py çıktısı) hazır olmalıdır.
+
+# 1️⃣ Öğretmen ve Öğrenci Modeller
+TEACHER = {"name": "Law-EQA (V3) öğretmen", "path": "./trained-models/yg_eqa_v3"}
+STUDENT_LIST = [
+    {"name": "Law-EQA öğrenci (6 katman)", "layers": 6, "alias": "yg_eqa_student6"},
+    {"name": "Law-EQA öğrenci (4 katman)", "layers": 4, "alias": "yg_eqa_student4"},
+]
+
+# Etiketsiz maskeli cümle kaynakları (pdf_analiz_v3 / sozlesme_risk_analizi çıktıları)
+UNLABELED_SOURCES = ["masked_outputs", "risk_outputs", "masked_document_output.txt"]
+UNLABELED_MIN_CHARS = 30
+
+TEMPERATURE = 2.0
+ALPHA = 0.5  # etiketli örneklerde gerçek etiket kaybının ağırlığı
+
+# 2️⃣ Veri Yükleme
+files = {
+    "train": "dataset-v1-train.csv",
+    "test": "datase-v1-test.csv"
+}
+try:
+    dataset = load_dataset("csv", data_files=files)
+except FileNotFoundError:
+    print("🚨 HATA: Veri setleri bulunamadı.")
+    sys.exit(1)
+
+# Etiket Haritası
+id2label = {0: "YUKSEK_RISK", 1: "ORTA_RISK", 2: "RISKSIZ"}
+label2id = {"YUKSEK_RISK": 0, "ORTA_RISK": 1, "RISKSIZ": 2}
+
+# Metrikler
+acc = evaluate.load("accuracy")
+f1 = evaluate.load("f1")
+
+def compute_metrics(eval_pred):
+    """Eğitim metriklerini hesaplar: Accuracy ve Ağırlıklı F1."""
+    logits, labels = eval_pred
+    if isinstance(logits, tuple):
+        logits = logits[0]
+    preds = np.argmax(logits, axis=1)
+    accuracy = acc.compute(predictions=preds, references=labels)["accuracy"]
+    f1w = f1.compute(predictions=preds, references=labels, average="weighted")["f1"]
+    return {"accuracy": accuracy, "f1_weighted": f1w}
+
+# Cihaz Ayarı
+device = "cuda" if torch.cuda.is_available() else ("mps" if torch.backends.mps.is_available() else "cpu")
+
+def etiketsiz_cumleler(sources=UNLABELED_SOURCES):
+    """Maskeleme çıktılarından (JSONL/Parquet klasörleri veya metin dökümü) cümle toplar."""
+    sentences = []
+    for source in sources:
+        if not os.path.exists(source):
+            continue
+        if source.endswith(".txt"):
+            with open(source, encoding="utf-8") as f:
+                sentences.extend(line[len("Maskeli:"):].strip() for line in f if line.startswith("Maskeli:"))
+        elif output_files(source):
+            sentences.extend(read_column(source, "maskelenmis_cumle"))
+    sentences = [s for s in dict.fromkeys(sentences) if len(s) >= UNLABELED_MIN_CHARS]
+    return sentences
+
+def ogretmen_logitleri(model, tokenizer, texts, max_tokens=8192):
+    """Öğretmenin logit'lerini uzunluğa göre gruplanmış batch'lerle hesaplar (girdi sırasıyla)."""
+    encoded = tokenizer(texts, truncation=True, max_length=256)
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+    logits = [None] * len(texts)
+    model.eval()
+    with torch.inference_mode():
+        for batch in token_budget_batches(lengths, max_tokens):
+            features = [{k: encoded[k][i] for k in encoded.keys()} for i in batch]
+            inputs = tokenizer.pad(features, return_tensors="pt").to(device)
+            for i, row in zip(batch, model(**inputs).logits.float().cpu().tolist()):
+                logits[i] = row
+    return logits
+
+def ogrenci_olustur(teacher, num_layers):
+    """Öğretmenin config'inden daha az katmanlı öğrenci kurar; gömmeler, sınıflandırıcı ve
+    eşit aralıklı seçilen encoder katmanları öğretmenden kopyalanır."""
+    config = teacher.config.__class__.from_dict(teacher.config.to_dict())
+    config.num_hidden_layers = num_layers
+    student = AutoModelForSequenceClassification.from_config(config)
+
+    teacher_layers = teacher.config.num_hidden_layers
+    picked = [round(i * (teacher_layers - 1) / (num_layers - 1)) for i in range(num_layers)]
+    state = teacher.state_dict()
+    student_state = {}
+    for key in student.state_dict():
+        source = key
+        if ".encoder.layer." in key:
+            prefix, rest = key.split(".encoder.layer.", 1)
+            index, suffix = rest.split(".", 1)
+            source = f"{prefix}.encoder.layer.{picked[int(index)]}.{suffix}"
+        student_state[key] = state[source]
+    student.load_state_dict(student_state)
+    return student, picked
+
+class DistillationTrainer(Trainer):
+    """Kayıp = ALPHA x CE(gerçek etiket) + (1-ALPHA) x T² x KL(öğrenci/T || öğretmen/T).
+
+    Etiketsiz örneklerin etiketi -100'dür; bunlarda yalnızca damıtma kaybı kullanılır.
+    """
+
+    def compute_loss(self, model, inputs, return_outputs=False, **kwargs):
+        labels = inputs.pop("labels")
+        teacher_logits = inputs.pop("teacher_logits")
+        outputs = model(**inputs)
+        logits = outputs.logits
+
+        distill = F.kl_div(
+            F.log_softmax(logits / TEMPERATURE, dim=-1),
+            F.softmax(teacher_logits / TEMPERATURE, dim=-1),
+            reduction="batchmean",
+        ) * TEMPERATURE ** 2
+        labeled = labels != -100
+        if labeled.any():
+            hard = F.cross_entropy(logits[labeled], labels[labeled])
+            loss = ALPHA * hard + (1 - ALPHA) * distill
+        else:
+            loss = distill
+        return (loss, outputs) if return_outputs else loss
+
+def cumle_hizi(model_path, texts):
+    """classify_batch ile saniyedeki cümle sayısını ölçer (ısınma sonrası)."""
+    classify_batch(texts[:8], model_path)
+    start = time.perf_counter()
+    classify_batch(texts, model_path)
+    return len(texts) / (time.perf_counter() - start)
+
+def distill_student(student_info, teacher, tokenizer, train_dataset, eval_dataset):
+    """Öğrenciyi öğretmenin yumuşak logit'leriyle eğitir ve kaydeder."""
+    output_dir = f"./results-{student_info['alias']}"
+    save_path = f"./trained-models/{student_info['alias']}"
+
+    print(f"\n=======================================================")
+    print(f"🚀 BAŞLANIYOR: {student_info['name']} - DAMITMA")
+    print(f"=======================================================")
+
+    student, picked = ogrenci_olustur(teacher, student_info["layers"])
+    print(f"Öğretmen katmanlarından kopyalananlar: {picked}")
+    student.to(device)
+
+    args = TrainingArguments(
+        output_dir=output_dir,
+        num_train_epochs=8,
+        per_device_train_batch_size=32,
+        per_device_eval_batch_size=32,
+        learning_rate=5e-5,
+        evaluation_strategy="epoch",
+        save_strategy="epoch",
+        load_best_model_at_end=True,
+        metric_for_best_model="f1_weighted",
+        greater_is_better=True,
+        logging_steps=10,
+        fp16=torch.cuda.is_available(),
+        remove_unused_columns=False,  # teacher_logits modele değil kayba gider
+        report_to=["none"]
+    )
+
+    trainer = DistillationTrainer(
+        model=student,
+        args=args,
+        train_dataset=train_dataset,
+        eval_dataset=eval_dataset,
+        tokenizer=tokenizer,
+        data_collator=DataCollatorWithPadding(tokenizer=tokenizer),
+        compute_metrics=compute_metrics
+    )
+
+    trainer.train()
+
+    os.makedirs(save_path, exist_ok=True)
+    trainer.save_model(save_path)
+    tokenizer.save_pretrained(save_path)
+    print(f"✅ Model kaydedildi: {save_path}")
+
+    evaluation_results = trainer.evaluate()
+    shutil.rmtree(output_dir, ignore_errors=True)
+    return evaluation_results, save_path
+
+# 3️⃣ Ana Çalıştırma Bloğu
+if __name__ == "__main__":
+
+    tokenizer = AutoTokenizer.from_pretrained(TEACHER["path"])
+    teacher = AutoModelForSequenceClassification.from_pretrained(TEACHER["path"]).to(device)
+
+    # Eğitim verisi: etiketli CSV + etiketsiz maskeli cümleler (etiket = -100)
+    unlabeled = etiketsiz_cumleler()
+    train_texts = list(dataset["train"]["text"]) + unlabeled
+    train_labels = list(dataset["train"]["label"]) + [-100] * len(unlabeled)
+    print(f"📚 Eğitim: {len(dataset['train'])} etiketli + {len(unlabeled)} etiketsiz maskeli cümle")
+
+    print("🧑‍🏫 Öğretmen logit'leri hesaplanıyor...")
+    teacher_logits = ogretmen_logitleri(teacher, tokenizer, train_texts)
+
+    def preprocess_function(examples):
+        return tokenizer(examples["text"], truncation=True, max_length=256)
+
+    train_dataset = Dataset.from_dict(
+        {"text": train_texts, "label": train_labels, "teacher_logits": teacher_logits}
+    ).map(preprocess_function, batched=True, remove_columns=["text"])
+    # Test logit'leri hem öğretmenin kendi skoru hem de değerlendirme kaybı için kullanılır
+    test_texts = list(dataset["test"]["text"])
+    test_logits = ogretmen_logitleri(teacher, tokenizer, test_texts)
+    eval_dataset = Dataset.from_dict(
+        {"text": test_texts, "label": list(dataset["test"]["label"]), "teacher_logits": test_logits}
+    ).map(preprocess_function, batched=True, remove_columns=["text"])
+
+    # Öğretmenin kendi test sonucu (aynı metriklerle)
+    teacher_metrics = compute_metrics((np.array(test_logits), np.array(dataset["test"]["label"])))
+    all_results = {
+        TEACHER["name"]: {
+            "Layers": teacher.config.num_hidden_layers,
+            "Accuracy": teacher_metrics["accuracy"],
+            "F1_Weighted": teacher_metrics["f1_weighted"],
+            "Sent_Per_Sec": cumle_hizi(TEACHER["path"], test_texts),
+        }
+    }
+
+    for student_info in STUDENT_LIST:
+        try:
+            results, save_path = distill_student(student_info, teacher, tokenizer, train_dataset, eval_dataset)
+            all_results[student_info["name"]] = {
+                "Layers": student_info["layers"],
+                "Accuracy": results.get("eval_accuracy", 0),
+                "F1_Weighted": results.get("eval_f1_weighted", 0),
+                "Sent_Per_Sec": cumle_hizi(save_path, test_texts),
+            }
+        except Exception as e:
+            print(f"❌ KRİTİK HATA OLUŞTU ({student_info['name']}): {e}")
+            all_results[student_info["name"]] = {"Error": str(e)}
+
+    # 4️⃣ Damıtma Sonuçlarını Yazdırma
+    print("\n\n=======================================================")
+    print("🏆 DAMITMA KARŞILAŞTIRMASI (ÖĞRETMEN vs ÖĞRENCİLER)")
+    print(f"AYARLAR: Epochs=8, Batch=32, LR=5e-5, T={TEMPERATURE}, Alpha={ALPHA}")
+    print("=======================================================")
+    print(f"{'Model Adı':<28} | {'Katman':<6} | {'Accuracy':<10} | {'F1 Weighted':<15} | {'Cümle/sn':<10} | {'Hız':<6}")
+    print("-" * 90)
+
+    teacher_speed = all_results[TEACHER["name"]]["Sent_Per_Sec"]
+    for name, metrics in all_results.items():
+        if "Error" in metrics:
+            print(f"{name:<28} | {'HATA':<6} | {metrics['Error']}")
+            continue
+
+        acc_str = f"{metrics['Accuracy']:.4f}"
+        f1_str = f"{metrics['F1_Weighted']:.4f}"
+        speed_str = f"{metrics['Sent_Per_Sec']:.1f}"
+        ratio_str = f"{metrics['Sent_Per_Sec'] / teacher_speed:.2f}x"
+
+        print(f"{name:<28} | {metrics['Layers']:<6} | {acc_str:<10} | {f1_str:<15} | {speed_str:<10} | {ratio_str:<6}")
+
+    print("-" * 90)
@@ -3,16 +3,18 @@ import os
 import shutil
 import numpy as np
 import torch
-from datasets import load_dataset
 from transformers import (
     AutoTokenizer,
     AutoModelForSequenceClassification,
-    Trainer,
     TrainingArguments,
     DataCollatorWithPadding
 )
 import evaluate
 
+from best_checkpoint import best_model_callbacks, checkpoint_args, save_model_atomic
+from token_budget_sampler import TokenBudgetTrainer
+from tokenize_cache import tokenized_dataset
+
 # ⚠️ ÖN KOŞULLAR: Veri setleri ve kütüphaneler yüklü olmalıdır.
 
 # 1️⃣ Odaklanılacak Modeller Listesi
@@ -26,9 +28,7 @@ files = {
     "train": "dataset-v1-train.csv", 
     "test": "datase-v1-test.csv"
 }
-try:
-    dataset = load_dataset("csv", data_files=files)
-except FileNotFoundError:
+if not all(os.path.exists(path) for path in files.values()):
     print("🚨 HATA: Veri setleri bulunamadı.")
     sys.exit(1)
 
@@ -48,26 +48,44 @@ def compute_metrics(eval_pred):
     f1w = f1.compute(predictions=preds, references=labels, average="weighted")["f1"]
     return {"accuracy": accuracy, "f1_weighted": f1w}
 
+# Checkpoint: False ise yalnızca en iyi ağırlıklar bellekte tutulur (epoch başına
+# ~440MB tam checkpoint ve optimizer dökümü yazılmaz); True ise eğitim devam ettirilebilir.
+RESUMABLE_CHECKPOINTS = False
+
 # Cihaz Ayarı
 device = "cuda" if torch.cuda.is_available() else ("mps" if torch.backends.mps.is_available() else "cpu")
 
-def train_and_evaluate_model_v3(model_info, dataset):
-    """Belirtilen modeli optimize edilmiş ayarlar ile fine-tuning eder."""
+# ⚙️ ÜÇÜNCÜ TUR AYARLARI (hp_sweep.py taramasında her deneme bunları ezer)
+V3_HPARAMS = {
+    "num_train_epochs": 8,     # Sabit tutuldu
+    "batch_size": 16,          # 12'den 16'ya yükseltildi; token bütçesi = batch_size x 256
+    "learning_rate": 3e-5,     # 2e-5'ten 3e-5'e yükseltildi
+    "warmup_ratio": 0.0,
+    "weight_decay": 0.0,
+}
+
+def train_and_evaluate_model_v3(model_info, files, hparams=None, callbacks=None, run_name=None, save=True):
+    """Belirtilen modeli optimize edilmiş ayarlar ile fine-tuning eder.
+
+    hparams, V3_HPARAMS üzerine yazılır; callbacks Trainer'a eklenir (ör. erken budama).
+    save=False ise model trained-models altına kaydedilmez.
+    """
+    hp = {**V3_HPARAMS, **(hparams or {})}
     model_path = model_info["path"]
     model_alias = model_info["alias"]
-    output_dir = f"./results-{model_alias}"
+    output_dir = f"./results-{run_name or model_alias}"
     save_path = f"./trained-models/{model_alias}"
 
     print(f"\n=======================================================")
     print(f"🚀 BAŞLANIYOR: {model_info['name']} - ÜÇÜNCÜ TUR AYARLARI")
+    if hparams:
+        print(f"⚙️ {', '.join(f'{k}={v}' for k, v in hp.items())}")
     print(f"=======================================================")
 
     tokenizer = AutoTokenizer.from_pretrained(model_path)
     
-    def preprocess_function(examples):
-        return tokenizer(examples["text"], truncation=True, max_length=256)
-
-    tokenized_datasets = dataset.map(preprocess_function, batched=True)
+    # Aynı tokenizer + CSV için token'lar önbellekten gelir
+    tokenized_datasets = tokenized_dataset(files, tokenizer, max_length=256)
     
     # Boyut uyumsuzluğu düzeltmesi
     model = AutoModelForSequenceClassification.from_pretrained(
@@ -79,16 +97,16 @@ def train_and_evaluate_model_v3(model_info, dataset):
     )
     model.to(device)
     
-    # ⚙️ ÜÇÜNCÜ TUR AYARLARI
     args = TrainingArguments(
         output_dir=output_dir,
-        num_train_epochs=8,               # Sabit tutuldu
-        per_device_train_batch_size=16,   # 12'den 16'ya yükseltildi
+        num_train_epochs=hp["num_train_epochs"],
+        per_device_train_batch_size=hp["batch_size"],   # TokenBudgetTrainer'da batch başına cümle üst sınırı
         per_device_eval_batch_size=16,
-        learning_rate=3e-5,               # 2e-5'ten 3e-5'e yükseltildi
+        learning_rate=hp["learning_rate"],
+        warmup_ratio=hp["warmup_ratio"],
+        weight_decay=hp["weight_decay"],
         evaluation_strategy="epoch",
-        save_strategy="epoch",
-        load_best_model_at_end=True,
+        **checkpoint_args(RESUMABLE_CHECKPOINTS),
         metric_for_best_model="f1_weighted",
         greater_is_better=True,
         logging_steps=10,
@@ -98,22 +116,24 @@ def train_and_evaluate_model_v3(model_info, dataset):
 
     collator = DataCollatorWithPadding(tokenizer=tokenizer)
 
-    trainer = Trainer(
+    # Batch'ler batch_size x 256 token'a göre kurulur (dolgu azalır); cümle sayısı batch_size'ı aşmaz.
+    trainer = TokenBudgetTrainer(
+        max_tokens=hp["batch_size"] * 256,
         model=model,
         args=args,
         train_dataset=tokenized_datasets["train"],
         eval_dataset=tokenized_datasets["test"],
         tokenizer=tokenizer,
         data_collator=collator,
-        compute_metrics=compute_metrics
+        compute_metrics=compute_metrics,
+        callbacks=(callbacks or []) + best_model_callbacks(RESUMABLE_CHECKPOINTS)
     )
 
     trainer.train()
 
-    os.makedirs(save_path, exist_ok=True)
-    trainer.save_model(save_path)
-    tokenizer.save_pretrained(save_path)
-    print(f"✅ Model kaydedildi: {save_path}")
+    if save:
+        save_model_atomic(trainer, tokenizer, save_path)
+        print(f"✅ Model kaydedildi: {save_path}")
 
     evaluation_results = trainer.evaluate()
     shutil.rmtree(output_dir, ignore_errors=True)
@@ -128,7 +148,7 @@ if __name__ == "__main__":
 
     for model_info in MODEL_LIST_FOCUSED_V3:
         try:
-            results = train_and_evaluate_model_v3(model_info, dataset)
+            results = train_and_evaluate_model_v3(model_info, files)
             all_results[model_info["name"]] = {
                 "Accuracy": results.get("eval_accuracy", 0),
                 "F1_Weighted": results.get("eval_f1_weighted", 0),
@@ -0,0 +1,146 @@
+# Bu kod, dörtModel.py'deki aday encoder'ları tam fine-tuning yapmadan hızlıca
+# sıralar. Her encoder dondurulmuş halde train ve test cümleleri üzerinden bir kez
+# çalıştırılır; havuzlanmış (mean / CLS) gömmeler .cache/embeddings altında bellek
+# eşlemeli NumPy dizileri olarak saklanır. Ardından bu vektörler üzerinde hafif bir
+# sınıflandırıcı (lojistik regresyon / küçük MLP) eğitilip encoder başına F1 raporlanır.
+# Gömmeler bir kez çıkarıldıktan sonra farklı başlık denemeleri saniyeler sürer.
+#
+# Kullanım:
+#   python modelTarama.py                      # tüm MODEL_LIST, mean + cls, logreg + mlp
+#   python modelTarama.py --heads logreg --pooling mean
+import argparse
+import csv
+import hashlib
+import os
+import time
+
+import numpy as np
+import torch
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from transformers import AutoModel, AutoTokenizer
+
+from dörtModel import MODEL_LIST, files
+from risk_classifier import token_budget_batches
+from run_manifest import file_hash
+
+EMBED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "embeddings")
+POOLINGS = ["mean", "cls"]
+MAX_LENGTH = 256
+MAX_TOKENS = 16384
+
+
+def ornekler(path):
+    with open(path, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return [row["text"] for row in rows], np.array([int(row["label"]) for row in rows])
+
+
+def _anahtar(model_path, csv_path):
+    digest = hashlib.sha256(f"{model_path}:{MAX_LENGTH}:{file_hash(csv_path)}".encode())
+    return f"{model_path.replace('/', '__')}-{digest.hexdigest()[:16]}"
+
+
+def _yollar(model_path, csv_path):
+    key = _anahtar(model_path, csv_path)
+    return {pooling: os.path.join(EMBED_DIR, f"{key}-{pooling}.npy") for pooling in POOLINGS}
+
+
+def gommeleri_cikar(model_path, texts, paths):
+    """Dondurulmuş encoder'dan mean ve CLS gömmelerini doğrudan memmap dosyalarına yazar."""
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModel.from_pretrained(model_path).eval()
+    encoded = tokenizer(texts, truncation=True, max_length=MAX_LENGTH)
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+    hidden = model.config.hidden_size
+
+    os.makedirs(EMBED_DIR, exist_ok=True)
+    tmp = {pooling: f"{path}.{os.getpid()}.tmp.npy" for pooling, path in paths.items()}
+    out = {pooling: np.lib.format.open_memmap(tmp[pooling], mode="w+", dtype=np.float32,
+                                              shape=(len(texts), hidden))
+           for pooling in paths}
+    with torch.inference_mode():
+        for batch in token_budget_batches(lengths, MAX_TOKENS):
+            features = tokenizer.pad({"input_ids": [encoded["input_ids"][i] for i in batch],
+                                      "attention_mask": [encoded["attention_mask"][i] for i in batch]},
+                                     return_tensors="pt")
+            states = model(**features).last_hidden_state
+            mask = features["attention_mask"].unsqueeze(-1).to(states.dtype)
+            out["mean"][batch] = ((states * mask).sum(1) / mask.sum(1)).numpy()
+            out["cls"][batch] = states[:, 0].numpy()
+    for array in out.values():
+        array.flush()
+    out.clear()
+    for pooling in paths:
+        os.replace(tmp[pooling], paths[pooling])
+
+
+def gommeler(model_path, csv_path, texts):
+    """{pooling: memmap dizisi}; önbellekte yoksa önce çıkarılır. (diziler, süre, önbellekten mi)"""
+    paths = _yollar(model_path, csv_path)
+    cached = all(os.path.exists(p) for p in paths.values())
+    start = time.perf_counter()
+    if not cached:
+        gommeleri_cikar(model_path, texts, paths)
+    arrays = {pooling: np.load(path, mmap_mode="r") for pooling, path in paths.items()}
+    return arrays, time.perf_counter() - start, cached
+
+
+def baslik(name, seed=42):
+    if name == "logreg":
+        clf = LogisticRegression(max_iter=2000, class_weight="balanced")
+    elif name == "mlp":
+        clf = MLPClassifier(hidden_layer_sizes=(256,), early_stopping=True, max_iter=300, random_state=seed)
+    else:
+        raise ValueError(f"Bilinmeyen başlık: {name}")
+    return make_pipeline(StandardScaler(), clf)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aday encoder'ları dondurulmuş gömmeler + hafif başlık ile sıralar.")
+    parser.add_argument("--heads", nargs="+", default=["logreg", "mlp"], choices=["logreg", "mlp"])
+    parser.add_argument("--pooling", nargs="+", default=POOLINGS, choices=POOLINGS)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    torch.set_num_threads(args.threads)
+
+    train_texts, train_labels = ornekler(files["train"])
+    test_texts, test_labels = ornekler(files["test"])
+
+    rows = []
+    best = {}
+    for model_info in MODEL_LIST:
+        try:
+            train, train_s, train_cached = gommeler(model_info["path"], files["train"], train_texts)
+            test, test_s, test_cached = gommeler(model_info["path"], files["test"], test_texts)
+        except Exception as e:
+            print(f"❌ {model_info['name']}: gömmeler çıkarılamadı: {e}")
+            continue
+        source = "önbellek" if train_cached and test_cached else f"{train_s + test_s:.0f} sn"
+        print(f"🧊 {model_info['name']}: gömmeler hazır ({source})")
+        for pooling in args.pooling:
+            for head in args.heads:
+                start = time.perf_counter()
+                clf = baslik(head).fit(np.asarray(train[pooling]), train_labels)
+                preds = clf.predict(np.asarray(test[pooling]))
+                f1w = f1_score(test_labels, preds, average="weighted")
+                rows.append((model_info["name"], pooling, head, accuracy_score(test_labels, preds), f1w,
+                             source, time.perf_counter() - start))
+                best[model_info["name"]] = max(best.get(model_info["name"], 0.0), f1w)
+
+    print("\n" + "=" * 100)
+    print(f"🔎 DONDURULMUŞ ENCODER TARAMASI ({len(train_texts)} train / {len(test_texts)} test cümlesi)")
+    print("=" * 100)
+    print(f"{'Model Adı':<22} | {'Havuz':<5} | {'Başlık':<6} | {'Accuracy':<8} | {'F1 (w)':<7} | "
+          f"{'Gömme':<10} | {'Başlık sn':<9}")
+    print("-" * 100)
+    for name, pooling, head, accuracy, f1w, source, seconds in rows:
+        print(f"{name:<22} | {pooling:<5} | {head:<6} | {accuracy:<8.4f} | {f1w:<7.4f} | {source:<10} | {seconds:<9.1f}")
+    print("-" * 100)
+    for rank, (name, f1w) in enumerate(sorted(best.items(), key=lambda item: item[1], reverse=True), 1):
+        print(f"{rank}. {name:<22} en iyi F1 (w) {f1w:.4f}")
+    if best:
+        print(f"🥇 Fine-tuning için önerilen aday: {max(best, key=best.get)}")
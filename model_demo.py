@@ -1,10 +1,9 @@
-import torch
-import numpy as np
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import pandas as pd
+from model_registry import MODEL_REGISTRY
+from risk_classifier import classify_batch
 
 # 🚨 GÜNCEL KLASÖR YOLU: İlk turda eğitilen 5-epoch Law-EQA modeli.
 BEST_MODEL_PATH = "./trained-models/yg_eqa"
+USE_INT8 = False # True: Linear katmanları dinamik INT8 nicelenmiş CPU modeli (bkz. model_quantize.py)
 
 # Etiket Haritası
 id2label = {0: "YUKSEK_RISK", 1: "ORTA_RISK", 2: "RISKSIZ"}
@@ -24,35 +23,30 @@ test_sentences = [
     {"text": "İşbu sözleşme 10 maddeden oluşmaktadır ve tüm maddeler taraflarca tam olarak okunmuş ve kabul edilmiştir.", "expected_label": "RISKSIZ"},
 ]
 
-def predict_risk_level(text):
-    """Verilen metin için risk seviyesini ve güven skorunu tahmin eder."""
-    
-    # Model ve Tokenizer yükleniyor
+def predict_risk_levels(texts):
+    """Metinlerin risk seviyelerini ve güven skorlarını (%) toplu tahmin eder.
+
+    Cümleler uzunluğa göre gruplanıp batch'ler hâlinde modele verilir;
+    sonuçlar girdi sırasıyla [(etiket, güven)] olarak döner.
+    """
+    # Model ve Tokenizer registry'den alınır (süreç başına bir kez yüklenir, eval modunda)
     try:
-        tokenizer = AutoTokenizer.from_pretrained(BEST_MODEL_PATH)
-        model = AutoModelForSequenceClassification.from_pretrained(BEST_MODEL_PATH)
+        handle = MODEL_REGISTRY.get(BEST_MODEL_PATH, quantized=USE_INT8)
     except Exception as e:
         # Eğer model yüklenemezse hata ver
         return f"Model Yükleme Hatası: {BEST_MODEL_PATH} yolunda model bulunamadı veya yüklenemedi. Hata: {e}"
 
-    # Metnin token haline getirilmesi
-    inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=256)
-    
-    # Tahmin yapılması
-    with torch.no_grad():
-        logits = model(**inputs).logits
-    
-    # Logitleri olasılığa çevirme (Softmax)
-    probabilities = torch.softmax(logits, dim=1)
-    
-    # En yüksek olasılığa sahip sınıfı bulma
-    predicted_class_id = torch.argmax(probabilities).item()
-    predicted_label = id2label[predicted_class_id]
-    
-    # Güven Skorunu hesaplama (%)
-    confidence_score = probabilities[0][predicted_class_id].item() * 100
-    
-    return predicted_label, confidence_score
+    # Etiket adları model config'inden gelir (id2label ile aynı). Yüklenen model doğrudan
+    # verilir; ikinci bir registry çağrısı önbellek isabeti sayısını şişirmez.
+    predictions = classify_batch(texts, BEST_MODEL_PATH, max_length=256, quantized=USE_INT8, handle=handle)
+    return [(p["label"], p["score"] * 100) for p in predictions]
+
+def predict_risk_level(text):
+    """Verilen metin için risk seviyesini ve güven skorunu tahmin eder."""
+    predictions = predict_risk_levels([text])
+    if isinstance(predictions, str):
+        return predictions
+    return predictions[0]
 
 def print_results(results):
     """Tahmin sonuçlarını rapor formatında yazdırır."""
@@ -90,15 +84,14 @@ if __name__ == "__main__":
     
     print(f"Law-EQA (5 Epoch) modeli yükleniyor ve kalitatif analiz yapılıyor (Yol: {BEST_MODEL_PATH})...")
     
-    for sentence in test_sentences:
-        prediction_result = predict_risk_level(sentence["text"])
-        
-        if isinstance(prediction_result, str) and "Hata" in prediction_result:
-            print(prediction_result)
-            break
-            
-        predicted_label, confidence_score = prediction_result
-        
+    # Tüm cümleler tek çağrıda, batch'ler hâlinde sınıflandırılır
+    predictions = predict_risk_levels([sentence["text"] for sentence in test_sentences])
+
+    if isinstance(predictions, str) and "Hata" in predictions:
+        print(predictions)
+        predictions = []
+
+    for sentence, (predicted_label, confidence_score) in zip(test_sentences, predictions):
         results.append({
             "text": sentence["text"],
             "expected_label": sentence["expected_label"],
@@ -107,4 +100,9 @@ if __name__ == "__main__":
         })
     
     if results:
-        print_results(results)
\ No newline at end of file
+        print_results(results)
+
+        stats = MODEL_REGISTRY.stats()
+        for path, info in stats["models"].items():
+            print(f"🗂️ {path}: {stats['loads']} yükleme ({info['load_seconds']:.1f} sn), "
+                  f"{info['hits']} önbellek isabeti, {info['bytes'] / 1024 ** 2:.0f} MB")
\ No newline at end of file
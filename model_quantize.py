@@ -0,0 +1,53 @@
+# Bu kod, risk sınıflandırma modellerinin CPU için dinamik INT8 sürümünü üretir.
+# Linear katmanların ağırlıkları INT8'e çevrilir, aktivasyonlar çalışma anında
+# ölçeklenir (torch.ao.quantization.quantize_dynamic). Nicelenmiş ağırlıklar
+# .cache/quantized altında saklanır; sonraki yüklemelerde fp32 ağırlıklar hiç
+# okunmaz, model iskeleti config'ten kurulup INT8 ağırlıklar doğrudan yüklenir.
+#
+# Kullanım:
+#   tokenizer, model = MODEL_REGISTRY.get("./final-legal-bert-risk-model", quantized=True)
+import hashlib
+import os
+
+import torch
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "quantized")
+WEIGHT_FILES = ("model.safetensors", "pytorch_model.bin", "config.json")
+
+
+def quantize_dynamic_int8(model):
+    """Linear katmanları dinamik INT8'e çevirir (yerinde değil, yeni model döner)."""
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def cache_key(model_path):
+    """Ağırlık dosyalarının boyut/tarihi ve torch sürümünden önbellek anahtarı üretir."""
+    digest = hashlib.sha256(torch.__version__.encode())
+    for name in WEIGHT_FILES:
+        path = os.path.join(model_path, name)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    base = os.path.basename(os.path.normpath(model_path))
+    return f"{base}-{digest.hexdigest()[:16]}"
+
+
+def load_quantized(model_path, cache_dir=CACHE_DIR):
+    """Modelin INT8 sürümünü önbellekten yükler; yoksa üretip önbelleğe yazar."""
+    from transformers import AutoConfig, AutoModelForSequenceClassification
+
+    cache_file = os.path.join(cache_dir, f"{cache_key(model_path)}.pt")
+    if os.path.exists(cache_file):
+        # Rastgele ağırlıklı iskelet kurulur, aynı yapıya nicelenir, INT8 ağırlıklar yüklenir.
+        skeleton = AutoModelForSequenceClassification.from_config(AutoConfig.from_pretrained(model_path))
+        model = quantize_dynamic_int8(skeleton.eval())
+        model.load_state_dict(torch.load(cache_file, map_location="cpu"))
+        return model.eval()
+
+    model = AutoModelForSequenceClassification.from_pretrained(model_path).eval()
+    model = quantize_dynamic_int8(model)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{cache_file}.{os.getpid()}.tmp"
+    torch.save(model.state_dict(), tmp)
+    os.replace(tmp, cache_file)
+    return model
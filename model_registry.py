@@ -0,0 +1,162 @@
+# Bu kod, süreç genelinde paylaşılan bir model kayıt defteri (registry) sunar.
+# Her model yolu (ör. ./trained-models/yg_eqa) yalnızca bir kez yüklenir, eval
+# modunda sıcak tutulur ve sonraki çağrılar aynı nesneyi kullanır. Birden çok
+# trained-models/* varyantı birlikte kullanıldığında toplam parametre belleği
+# bütçeyi aşarsa en uzun süredir kullanılmayan model bellekten çıkarılır.
+# torch ve transformers yalnızca ilgili arka uç ilk kez yüklenirken içe aktarılır.
+#
+# Kullanım:
+#   from model_registry import MODEL_REGISTRY
+#   tokenizer, model = MODEL_REGISTRY.get("./trained-models/yg_eqa")
+#   tokenizer, model = MODEL_REGISTRY.get("./trained-models/yg_eqa", quantized=True)  # INT8, CPU
+#   tokenizer, session = MODEL_REGISTRY.get("./trained-models/yg_eqa", backend="onnx")  # onnxruntime
+#   print(MODEL_REGISTRY.stats())
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+
+MEMORY_BUDGET = 2 * 1024 ** 3  # parametre + buffer belleği, bayt
+
+
+def _key(model_path, quantized, backend):
+    if backend == "onnx":
+        return f"{model_path} [onnx]"
+    return f"{model_path} [int8]" if quantized else model_path
+
+
+def model_bytes(model):
+    """Modelin ağırlıklarının (state_dict) kapladığı bayt sayısı.
+
+    Dinamik nicelenmiş Linear katmanlar ağırlıklarını parametre olarak değil
+    paketlenmiş (packed) tensörler olarak tuttuğu için state_dict üzerinden sayılır.
+    """
+    def nbytes(value):
+        if hasattr(value, "element_size"):
+            return value.numel() * value.element_size()
+        if isinstance(value, (tuple, list)):
+            return sum(nbytes(v) for v in value)
+        return 0
+
+    return sum(nbytes(v) for v in model.state_dict().values())
+
+
+class _Entry:
+    __slots__ = ("tokenizer", "model", "bytes", "load_seconds", "hits")
+
+    def __init__(self, tokenizer, model, load_seconds, nbytes=None):
+        self.tokenizer = tokenizer
+        self.model = model
+        self.bytes = model_bytes(model) if nbytes is None else nbytes
+        self.load_seconds = load_seconds
+        self.hits = 0
+
+
+class ModelRegistry:
+    """Model yolu -> (tokenizer, model) için bellek bütçeli LRU önbellek."""
+
+    def __init__(self, memory_budget=MEMORY_BUDGET):
+        self.memory_budget = memory_budget
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def get(self, model_path, quantized=False, backend="torch"):
+        """Modeli (gerekirse yükleyerek) eval modunda döndürür.
+
+        quantized=True ise Linear katmanları dinamik INT8'e çevrilmiş CPU
+        sürümü döner. backend="onnx" ise <model>/onnx altındaki dışa aktarılmış
+        model onnxruntime ile açılır (onnx_backend.OnnxClassifier). Her sürüm
+        ayrı bir kayıt olarak tutulur.
+        """
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Bilinmeyen arka uç: {backend} (torch veya onnx olmalı)")
+        if backend == "onnx" and quantized:
+            raise ValueError("INT8 modu yalnızca torch arka ucunda destekleniyor.")
+        key = _key(model_path, quantized, backend)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._load(model_path, quantized, backend)
+                self._entries[key] = entry
+                self._evict(keep=key)
+            else:
+                entry.hits += 1
+                self._entries.move_to_end(key)
+            return entry.tokenizer, entry.model
+
+    def _load(self, model_path, quantized=False, backend="torch"):
+        from transformers import AutoTokenizer
+
+        start = time.perf_counter()
+        if backend == "onnx":
+            from onnx_backend import OnnxClassifier, onnx_dir
+
+            directory = onnx_dir(model_path)
+            if not os.path.exists(directory):
+                raise FileNotFoundError(f"{directory} yok; önce: python onnx_backend.py {model_path}")
+            tokenizer = AutoTokenizer.from_pretrained(directory)
+            session = OnnxClassifier(directory)
+            self.loads += 1
+            return _Entry(tokenizer, session, time.perf_counter() - start, session.nbytes)
+
+        from transformers import AutoModelForSequenceClassification
+
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        if quantized:
+            from model_quantize import load_quantized
+
+            model = load_quantized(model_path)
+        else:
+            model = AutoModelForSequenceClassification.from_pretrained(model_path)
+        model.eval()
+        self.loads += 1
+        return _Entry(tokenizer, model, time.perf_counter() - start)
+
+    def _evict(self, keep):
+        # Bütçeden büyük tek bir model yine de yüklü kalır.
+        evicted = False
+        while self.total_bytes() > self.memory_budget and len(self._entries) > 1:
+            path = next(iter(self._entries))
+            if path == keep:
+                break
+            del self._entries[path]
+            self.evictions += 1
+            evicted = True
+        if evicted:
+            gc.collect()
+
+    def total_bytes(self):
+        return sum(entry.bytes for entry in self._entries.values())
+
+    def unload(self, model_path=None):
+        """Verilen modeli (fp32 ve INT8 sürümleri; None ise hepsini) bellekten çıkarır."""
+        with self._lock:
+            if model_path is None:
+                self._entries.clear()
+            else:
+                for quantized, backend in ((False, "torch"), (True, "torch"), (False, "onnx")):
+                    self._entries.pop(_key(model_path, quantized, backend), None)
+        gc.collect()
+
+    def stats(self):
+        """Yüklü her model için bellek, yükleme süresi ve isabet sayısı."""
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "total_bytes": self.total_bytes(),
+                "models": {
+                    path: {
+                        "bytes": entry.bytes,
+                        "load_seconds": entry.load_seconds,
+                        "hits": entry.hits,
+                    }
+                    for path, entry in self._entries.items()
+                },
+            }
+
+
+MODEL_REGISTRY = ModelRegistry()
@@ -0,0 +1,167 @@
+# Bu kod, model karşılaştırma eğitimlerini ayrı süreçlerde eşzamanlı çalıştırır.
+# CPU çekirdekleri işler arasında bölünür (her süreç kendi çekirdek kümesine
+# sabitlenir ve torch thread sayısı o kümenin boyuna ayarlanır); tek bir eğitimin
+# 32 çekirdekte kötü ölçeklenmesi yerine birkaç eğitim yan yana ilerler. İş sayısı
+# eşzamanlı yuva sayısından fazlaysa, biten işin çekirdekleri sıradakine verilir.
+# Süreçlerden gelen ilerleme (adım, kayıp, epoch sonu F1) ana süreçte tek satırlık
+# mesajlar olarak yazdırılır.
+#
+# Kullanım:
+#   sonuclar = run_concurrent(egitim_fonksiyonu, [(ad, (model_info, files)), ...], max_parallel=4)
+#   # egitim_fonksiyonu(*args, callbacks=[...]) -> trainer.evaluate() sözlüğü
+import contextlib
+import multiprocessing as mp
+import os
+import queue as queue_module
+import time
+
+from transformers import TrainerCallback
+
+MIN_THREADS_PER_JOB = 4
+LOG_EVERY_PERCENT = 10
+
+
+def available_cores():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def default_parallel(n_jobs, cores=None):
+    """Her işe en az MIN_THREADS_PER_JOB çekirdek düşecek kadar eşzamanlı iş."""
+    cores = cores if cores is not None else len(available_cores())
+    return max(1, min(n_jobs, cores // MIN_THREADS_PER_JOB))
+
+
+def partition_cores(slots, cores=None):
+    """Çekirdekleri slots adet ayrık ve eşit boyutlu kümeye böler."""
+    cores = cores if cores is not None else available_cores()
+    size = max(1, len(cores) // slots)
+    return [cores[i * size:(i + 1) * size] or cores for i in range(slots)]
+
+
+class QueueProgressCallback(TrainerCallback):
+    """Trainer olaylarını ana sürecin kuyruğuna iletir."""
+
+    def __init__(self, queue, name):
+        self.queue = queue
+        self.name = name
+        self.next_percent = LOG_EVERY_PERCENT
+
+    def on_train_begin(self, args, state, control, **kwargs):
+        self.queue.put((self.name, "start", {"max_steps": state.max_steps}))
+
+    def on_log(self, args, state, control, logs=None, **kwargs):
+        percent = 100 * state.global_step / max(state.max_steps, 1)
+        if logs and "loss" in logs and percent >= self.next_percent:
+            self.next_percent = (int(percent) // LOG_EVERY_PERCENT + 1) * LOG_EVERY_PERCENT
+            self.queue.put((self.name, "step", {"percent": percent, "loss": logs["loss"]}))
+
+    def on_evaluate(self, args, state, control, metrics=None, **kwargs):
+        self.queue.put((self.name, "eval", {"epoch": state.epoch, **(metrics or {})}))
+
+
+def _worker(fn, args, cores, queue, name):
+    import torch
+
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    torch.set_num_threads(len(cores))
+    try:
+        result = fn(*args, callbacks=[QueueProgressCallback(queue, name)])
+        queue.put((name, "done", result))
+    except Exception as e:
+        queue.put((name, "error", str(e)))
+
+
+def _yazdir(name, event, data, started):
+    elapsed = time.perf_counter() - started
+    if event == "start":
+        print(f"▶️ [{name}] başladı ({data['max_steps']} adım)")
+    elif event == "step":
+        print(f"⏳ [{name}] %{data['percent']:.0f}  loss={data['loss']:.4f}  ({elapsed:.0f} sn)")
+    elif event == "eval":
+        print(f"📊 [{name}] epoch {data['epoch']:.0f}: F1={data.get('eval_f1_weighted', 0):.4f} "
+              f"loss={data.get('eval_loss', 0):.4f}")
+    elif event == "done":
+        print(f"✅ [{name}] bitti ({elapsed:.0f} sn)")
+    elif event == "error":
+        print(f"❌ [{name}] hata: {data}")
+
+
+@contextlib.contextmanager
+def _child_env(**values):
+    """Başlatılan alt sürecin ortamını ayarlar; ana sürecin ortamı sonra eski haline döner."""
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def run_concurrent(fn, jobs, max_parallel=None):
+    """jobs: [(ad, args)] listesi. Her işi ayrı süreçte fn(*args, callbacks=...) ile çalıştırır.
+
+    {ad: sonuç sözlüğü} döndürür; hata veren işler için {"Error": mesaj}.
+    """
+    cores = available_cores()
+    slots = max_parallel or default_parallel(len(jobs), len(cores))
+    free = partition_cores(slots, cores)
+    threads = len(free[0])
+    print(f"🧵 {len(jobs)} iş, {slots} eşzamanlı süreç, süreç başına {threads} çekirdek "
+          f"(toplam {len(cores)})")
+
+    ctx = mp.get_context("spawn")  # fork + torch/OpenMP kilitlenmelerinden kaçınmak için
+    queue = ctx.Queue()
+    pending = list(jobs)
+    running = {}  # ad -> (süreç, çekirdekler)
+    results = {}
+    started = time.perf_counter()
+
+    def isle(name, event, data):
+        if name not in running:
+            return  # zaten sonlanmış sayılan sürecin geç gelen mesajı
+        _yazdir(name, event, data, started)
+        if event in ("done", "error"):
+            results[name] = data if event == "done" else {"Error": data}
+            proc, job_cores = running.pop(name)
+            proc.join()
+            free.append(job_cores)
+
+    while pending or running:
+        while pending and free:
+            name, args = pending.pop(0)
+            job_cores = free.pop(0)
+            proc = ctx.Process(target=_worker, args=(fn, args, job_cores, queue, name), daemon=False)
+            # OpenMP/MKL havuzları alt süreçte torch içe aktarılırken kurulur; ortam
+            # yalnızca başlatma anında ayarlanır, ana sürecinki değişmeden kalır.
+            with _child_env(OMP_NUM_THREADS=str(len(job_cores)), MKL_NUM_THREADS=str(len(job_cores))):
+                proc.start()
+            running[name] = (proc, job_cores)
+        try:
+            isle(*queue.get(timeout=1.0))
+            continue
+        except queue_module.Empty:
+            pass
+        # Sonuç bildirmeden ölen süreçleri (ör. bellek yetersizliği) yakala. Önce
+        # kuyrukta kalmış mesajlar işlenir; ölmeden hemen önce yazılan sonuç kaybolmaz.
+        dead = [name for name, (proc, _) in running.items() if not proc.is_alive()]
+        if not dead:
+            continue
+        while True:
+            try:
+                isle(*queue.get(timeout=0.5))
+            except queue_module.Empty:
+                break
+        for name in dead:
+            if name in running:
+                proc, _ = running[name]
+                isle(name, "error", f"süreç beklenmedik şekilde sonlandı (kod {proc.exitcode})")
+
+    print(f"⏱️ Toplam süre: {time.perf_counter() - started:.0f} sn")
+    return results
@@ -0,0 +1,130 @@
+# Bu kod, kaydedilmiş bir AutoModelForSequenceClassification klasörünü ONNX'e
+# çevirir ve onnxruntime ile çalıştırır. ONNX modeli <model>/onnx/ altına,
+# tokenizer ve config ile birlikte yazılır; çıkarım tarafı PyTorch'u hiç içe
+# aktarmadığı için CPU worker'larında soğuk başlangıç kısalır.
+#
+# Kullanım:
+#   python onnx_backend.py ./trained-models/yg_eqa           # dışa aktar + logit eşdeğerlik kontrolü
+#   classify_batch(cumleler, "./trained-models/yg_eqa", backend="onnx")
+import argparse
+import csv
+import inspect
+import os
+import sys
+
+import numpy as np
+
+ONNX_SUBDIR = "onnx"
+ONNX_FILE = "model.onnx"
+OPSET = 17
+TEST_CSV = "datase-v1-test.csv"
+PARITY_ATOL = 1e-3
+
+
+def onnx_dir(model_path):
+    return os.path.join(model_path, ONNX_SUBDIR)
+
+
+def export_onnx(model_path, output_dir=None, opset=OPSET):
+    """Modeli batch ve dizi uzunluğu dinamik olacak şekilde ONNX'e aktarır."""
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    output_dir = output_dir or onnx_dir(model_path)
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModelForSequenceClassification.from_pretrained(model_path).eval()
+
+    sample = tokenizer(["Örnek cümle.", "İkinci, biraz daha uzun bir örnek cümle."],
+                       padding=True, return_tensors="pt")
+    # Sözlükle verilen girdiler grafikte forward imzasının sırasıyla yer alır
+    # (input_ids, attention_mask, token_type_ids); adlar da bu sırayla verilmeli,
+    # yoksa attention_mask ile token_type_ids yer değiştirir.
+    input_names = [name for name in inspect.signature(model.forward).parameters if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    tmp = os.path.join(output_dir, f"{ONNX_FILE}.{os.getpid()}.tmp")
+    with torch.inference_mode():
+        torch.onnx.export(
+            model, ({name: sample[name] for name in input_names},), tmp,
+            input_names=input_names, output_names=["logits"],
+            dynamic_axes=dynamic_axes, opset_version=opset,
+        )
+    os.replace(tmp, os.path.join(output_dir, ONNX_FILE))
+    tokenizer.save_pretrained(output_dir)
+    model.config.save_pretrained(output_dir)
+    return output_dir
+
+
+class OnnxClassifier:
+    """onnxruntime oturumu; PyTorch modeliyle aynı config/id2label'ı taşır."""
+
+    def __init__(self, directory, num_threads=None):
+        import onnxruntime as ort
+        from transformers import AutoConfig
+
+        path = os.path.join(directory, ONNX_FILE)
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.config = AutoConfig.from_pretrained(directory)
+        self.nbytes = os.path.getsize(path)
+
+    def logits(self, inputs):
+        """inputs: tokenizer(..., return_tensors="np") çıktısı; logits (numpy) döndürür."""
+        feed = {name: np.asarray(inputs[name], dtype=np.int64) for name in self.input_names}
+        return self.session.run(["logits"], feed)[0]
+
+
+def softmax(logits):
+    exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def parity_check(model_path, texts, batch_size=32, directory=None):
+    """PyTorch ve ONNX logit'lerini karşılaştırır: (en büyük mutlak fark, argmax uyuşma oranı)."""
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModelForSequenceClassification.from_pretrained(model_path).eval()
+    session = OnnxClassifier(directory or onnx_dir(model_path))
+
+    max_diff = 0.0
+    same = 0
+    for i in range(0, len(texts), batch_size):
+        batch = texts[i:i + batch_size]
+        with torch.inference_mode():
+            torch_logits = model(**tokenizer(batch, padding=True, truncation=True, max_length=256,
+                                             return_tensors="pt")).logits.numpy()
+        onnx_logits = session.logits(tokenizer(batch, padding=True, truncation=True, max_length=256,
+                                               return_tensors="np"))
+        max_diff = max(max_diff, float(np.abs(torch_logits - onnx_logits).max()))
+        same += int((torch_logits.argmax(-1) == onnx_logits.argmax(-1)).sum())
+    return max_diff, same / len(texts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sınıflandırma modelini ONNX'e aktarır ve eşdeğerliğini kontrol eder.")
+    parser.add_argument("model_path", help="AutoModelForSequenceClassification klasörü")
+    parser.add_argument("--out", default=None, help="Çıktı klasörü (varsayılan: <model>/onnx)")
+    parser.add_argument("--opset", type=int, default=OPSET)
+    parser.add_argument("--no-check", action="store_true", help="Test CSV'sinde logit kontrolünü atla")
+    args = parser.parse_args()
+
+    output_dir = export_onnx(args.model_path, args.out, args.opset)
+    print(f"✅ ONNX modeli yazıldı → {os.path.join(output_dir, ONNX_FILE)}")
+
+    if not args.no_check:
+        with open(TEST_CSV, encoding="utf-8") as f:
+            texts = [row["text"] for row in csv.DictReader(f)]
+        max_diff, agreement = parity_check(args.model_path, texts, directory=output_dir)
+        ok = max_diff <= PARITY_ATOL and agreement == 1.0
+        print(f"{'✅' if ok else '❌'} Logit eşdeğerliği ({len(texts)} cümle): en büyük mutlak fark {max_diff:.2e}, "
+              f"tahmin uyuşması %{agreement * 100:.2f}")
+        if not ok:
+            sys.exit(1)
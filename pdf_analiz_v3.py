@@ -1,251 +1,34 @@
+import itertools
+import os
 import re
-from pypdf import PdfReader
-from nltk.tokenize import sent_tokenize
+import time
 from transformers import pipeline
 import torch
-import nltk
 
-# NLTK Türkçe cümle ayırıcı verisini kontrol et
-try:
-    nltk.data.find('tokenizers/punkt')
-except nltk.downloader.DownloadError:
-    nltk.download('punkt')
+from data_mask import MASK_RULES, MASK_ENGINE, MaskEngine
+from doc_extract import iter_pages
+from mask_cache import CACHE_FILE, MaskCache, cache_namespace
+from mask_spans import apply_spans, mask_with_spans, ner_spans, resolve_spans
+from run_manifest import RunManifest
+from mask_output import FORMATS, sonuclari_yaz
+from sentence_splitter import Sentence, split_sentences
 
 # -------------------------------------------------------------------
 # --- KONFİGÜRASYON ---
 # -------------------------------------------------------------------
 PDF_FILE = "2-turkiye-arnavutluk.pdf" # İşlenecek PDF dosyası
+PDF_BACKEND = None # Metin çıkarma arka ucu ("pymupdf", "pypdf", ...); None: kurulu en hızlısı
 NER_MODEL_NAME = "savasy/bert-base-turkish-ner-cased" 
-OUTPUT_FILE = "masked_document_output.txt" # Çıktıların kaydedileceği dosya
+OUTPUT_FILE = "masked_document_output.txt" # Çıktı dosyası; .jsonl / .parquet uzantısı yapılandırılmış çıktı yazar
+NER_BATCH_SIZE = 32 # NER modeline tek ileri geçişte verilen cümle sayısı
+STREAM_CHUNK_SIZE = 256 # Akış modunda bellekte aynı anda tutulan en fazla cümle sayısı
+USE_MASK_CACHE = True # Daha önce maskelenmiş cümleleri .cache/mask_cache.sqlite'dan oku
+USE_MANIFEST = True # Önceki revizyonun sonuçlarını .cache/manifests/'ten yeniden kullan
+BELGE_ID = None # Revizyonlar farklı dosya adıyla geliyorsa ortak belge kimliği (None: dosya adı)
 # --------------------
 
 # Kendi Regex Kurallarınız (MASK_RULES)
-# Bu liste, önceki ile aynıdır.
-MASK_RULES = [
-    # ------------------------------------------------------------
-    # ŞİRKET / KURUM ADI
-    # ------------------------------------------------------------
-    {
-        "name": "sirket_adi",
-        "pattern": re.compile(
-            r"\b[ A-ZÇĞİÖŞÜ0-9&\.\-]+"
-            r"(A\.?Ş\.?|AŞ|LTD\.?\s*ŞTİ\.?|Limited\s+Şirketi?|Anonim\s+Şirketi?)\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[ŞİRKET_ADI]",
-    },
-
-    # ------------------------------------------------------------
-    # KİŞİ ADI (Basit)
-    # ------------------------------------------------------------
-    {
-        "name": "kisi_adi",
-        "pattern": re.compile(
-            r"\b[A-ZÇĞİÖŞÜ][a-zçğıöşü]+[\s]+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+\b"
-        ),
-        "replacement": "[KİŞİ_ADI]",
-    },
-
-    # ------------------------------------------------------------
-    # TARAF ADI
-    # ------------------------------------------------------------
-    {
-        "name": "taraf_adi",
-        "pattern": re.compile(r"\bTaraf\s+[A-Z0-9]+\b", re.IGNORECASE),
-        "replacement": "[TARAF_ADI]",
-    },
-
-    # ------------------------------------------------------------
-    # ŞEHİR ADI (Basit)
-    # ------------------------------------------------------------
-    {
-        "name": "yer_adi",
-        "pattern": re.compile(
-            r"\b(İstanbul|Ankara|İzmir|Bursa|Antalya|Adana|Konya)\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[YER_ADI]",
-    },
-
-    # ------------------------------------------------------------
-    # ADRES BİLGİSİ
-    # ------------------------------------------------------------
-    {
-        "name": "adres_satiri",
-        "pattern": re.compile(
-            r"([A-ZÇĞİÖŞÜa-zçğıöşü0-9\s\.,/-]{0,80}"
-            r"(Mah\.?|Mahallesi|Cad\.?|Caddesi|Sok\.?|Sokağı|Bulvarı|Blv\.?)"
-            r"[A-ZÇĞİÖŞÜa-zçığıöşü0-9\s\.,/-]{0,120})"
-        ),
-        "replacement": "[ADRES]",
-    },
-
-    {
-        "name": "adres_no",
-        "pattern": re.compile(r"No[:\.]?\s*\d+\b", re.IGNORECASE),
-        "replacement": "[ADRES]",
-    },
-
-    # ------------------------------------------------------------
-    # TARİH (Sayısal Format)
-    # ------------------------------------------------------------
-    {
-        "name": "tarih_sayisal",
-        "pattern": re.compile(
-            r"\b(?:\d{1,2}[./-]\d{1,2}[./-]\d{2,4}|\d{4}[./-]\d{1,2}[./-]\d{1,2})\b"
-        ),
-        "replacement": "[TARİH]",
-    },
-
-    # ------------------------------------------------------------
-    # TARİH (Yazılı Format)
-    # ------------------------------------------------------------
-    {
-        "name": "tarih_yazili",
-        "pattern": re.compile(
-            r"\b\d{1,2}\s+"
-            r"(Ocak|Şubat|Mart|Nisan|Mayıs|Haziran|Temmuz|Ağustos|"
-            r"Eylül|Ekim|Kasım|Aralık)"
-            r"\s+\d{2,4}\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[TARİH]",
-    },
-
-    # ------------------------------------------------------------
-    # SÜRE
-    # ------------------------------------------------------------
-    {
-        "name": "sure",
-        "pattern": re.compile(r"\b\d+\s+(gün|hafta|ay|yıl|yil)\b", re.IGNORECASE),
-        "replacement": "[SÜRE]",
-    },
-
-    # ------------------------------------------------------------
-    # MADDE NUMARASI / ATIFI
-    # ------------------------------------------------------------
-    {
-        "name": "madde_no",
-        "pattern": re.compile(r"\bMadde\s+\d+[a-zA-Z]?\b", re.IGNORECASE),
-        "replacement": "[MADDE_NO]",
-    },
-    {
-        "name": "madde_atifi",
-        "pattern": re.compile(
-            r"\bMadde\s+\d+[a-zA-Z]?['’]?(e|ye|ye göre|e göre|uyarınca)\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[MADDE_ATIFI]",
-    },
-
-    # ------------------------------------------------------------
-    # PARA / TUTAR
-    # ------------------------------------------------------------
-    {
-        "name": "tutar",
-        "pattern": re.compile(
-            r"\b[\d\.]+(?:,\d+)?\s?(TL|₺|TRY|USD|EUR|Euro|Dolar)\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[TUTAR]",
-    },
-    {
-        "name": "para_birimi_tanim",
-        "pattern": re.compile(
-            r"\b(Türk\s+Lirası|Amerikan\s+Doları|Euro)\b", re.IGNORECASE
-        ),
-        "replacement": "[PARA_BIRIMI]",
-    },
-
-    # ------------------------------------------------------------
-    # BANKA / KİMLİK / İLETİŞİM BİLGİSİ
-    # ------------------------------------------------------------
-    {
-        "name": "iban",
-        "pattern": re.compile(
-            r"\bTR[0-9]{2}(?:\s?[0-9]{4}){5}\b", re.IGNORECASE
-        ),
-        "replacement": "[BANKA_BILGISI]",
-    },
-    {
-        "name": "hesap_no",
-        "pattern": re.compile(
-            r"(Hesap\s*No[:\.]?\s*)([0-9]{6,})", re.IGNORECASE
-        ),
-        "replacement": r"\1[BANKA_BILGISI]",
-    },
-    {
-        "name": "tc_kimlik",
-        "pattern": re.compile(r"\b\d{11}\b"),
-        "replacement": "[KIMLIK_NO]",
-    },
-    {
-        "name": "vergi_no",
-        "pattern": re.compile(
-            r"(Vergi\s*No[:\.]?\s*)([0-9]{6,})", re.IGNORECASE
-        ),
-        "replacement": r"\1[KIMLIK_NO]",
-    },
-    {
-        "name": "telefon",
-        "pattern": re.compile(
-            r"\b(?:\+?90|0)\s?(?:\(?\d{3}\)?)[\s\-]?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}\b"
-        ),
-        "replacement": "[ILETISIM_BILGISI]",
-    },
-    {
-        "name": "email",
-        "pattern": re.compile(
-            r"\b[A-Z0-9._%+\-]+@[A-Z0-9.\-]+\.[A-Z]{2,}\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[ILETISIM_BILGISI]",
-    },
-
-    # ------------------------------------------------------------
-    # DİĞER YAPISAL VERİLER
-    # ------------------------------------------------------------
-    {
-        "name": "url",
-        "pattern": re.compile(
-            r"\b(?:https?://|www\.)[^\s,]+", re.IGNORECASE
-        ),
-        "replacement": "[WEB_ADRESI]",
-    },
-    {
-        "name": "vergi_dairesi",
-        "pattern": re.compile(
-            r"\b[A-ZÇĞİÖŞÜa-zçğıöşü\s]+Vergi\s+Dairesi\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[VERGI_DAIRESI]",
-    },
-    {
-        "name": "ek_referansi",
-        "pattern": re.compile(
-            r"\bEk[-\s]?\d+[^\n,]*", re.IGNORECASE
-        ),
-        "replacement": "[EK_REFERANSI]",
-    },
-    {
-        "name": "kanun_adi",
-        "pattern": re.compile(
-            r"\b[ A-ZÇĞİÖŞÜa-zçğıöşü0-9\-]+"
-            r"(Kanunu|Kanun|Yönetmeliği|Yönetmelik|Tebliği|Teblig)\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[KANUN_ADI]",
-    },
-    {
-        "name": "unvan",
-        "pattern": re.compile(
-            r"\b(Genel\s+Müdür|Müdür|Yönetim\s+Kurulu\s+Başkanı|"
-            r"Şube\s+Müdürü|Av\.?|Dr\.?|Prof\.?\s*Dr\.?)\b",
-            re.IGNORECASE,
-        ),
-        "replacement": "[UNVAN]",
-    },
-]
+# Kurallar tek kaynaktan (data_mask.py) içe aktarılır; maskeleme motoru da orada derlenir.
 
 # NER Etiketleri ve Maske Karşılıkları
 NER_MAPPING = {
@@ -265,107 +48,260 @@ def load_ner_pipeline(model_name):
         device=0 if torch.cuda.is_available() else -1
     )
 
-def ner_maskeleme_islemi(text, ner_pipeline):
-    """NER modelini kullanarak metni maskeler."""
-    results = ner_pipeline(text)
-    
-    masked_text = list(text)
+def ner_toplu_calistir(sentences, ner_pipeline, batch_size=NER_BATCH_SIZE):
+    """Cümleleri token uzunluğuna göre gruplayıp NER'i toplu çalıştırır.
+
+    Benzer uzunluktaki cümleler aynı batch'e düştüğü için dolgu (padding) azalır.
+    Varlık ofsetleri her cümlenin kendi metnine göredir; sonuçlar girdi
+    sırasıyla döndürülür.
+    """
+    if not sentences:
+        return []
+    lengths = [len(ids) for ids in ner_pipeline.tokenizer(sentences, truncation=True)["input_ids"]]
+    order = sorted(range(len(sentences)), key=lambda i: lengths[i])
+
+    outputs = ner_pipeline([sentences[i] for i in order], batch_size=batch_size)
+
+    results = [None] * len(sentences)
+    for i, entities in zip(order, outputs):
+        results[i] = entities
+    return results
+
+def ner_maskeleme_islemi(text, ner_pipeline, results=None):
+    """NER modelini kullanarak metni maskeler (results: önceden hesaplanmış varlıklar)."""
+    if results is None:
+        results = ner_pipeline(text)
     
-    for entity in reversed(results):
-        label = entity['entity_group']
-        start = entity['start']
-        end = entity['end']
-        
-        if label in NER_MAPPING:
-            mask = NER_MAPPING[label]
-            
-            # Maskeyi yerleştirme ve aradaki farkı boşlukla doldurma
-            masked_text[start:end] = list(mask)
-            
-            if len(mask) < (end - start):
-                masked_text[start + len(mask):end] = [' '] * (end - start - len(mask))
-            
-    return "".join(masked_text).strip()
+    spans = resolve_spans(ner_spans(results, NER_MAPPING))
+    return apply_spans(text, spans).strip()
 
 def regex_maskeleme_islemi(text, rules=MASK_RULES):
-    """Sizin Regex kurallarınızı kullanarak maskeler."""
-    for rule in rules:
-        text = rule["pattern"].sub(rule["replacement"], text)
-    return text
+    """Sizin Regex kurallarınızı kullanarak tek yeniden yazımla maskeler."""
+    engine = MASK_ENGINE if rules is MASK_RULES else MaskEngine(rules)
+    return engine.mask(text)
 
 def pdf_metin_cikar(pdf_path):
     """PDF dosyasından tüm metni çıkarır."""
-    reader = PdfReader(pdf_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() + "\n"
+    text = "\n".join(iter_pages(pdf_path, PDF_BACKEND))
     # Çoklu boşluk ve yeni satırları temizleme
     text = re.sub(r'\s+', ' ', text).strip()
     return text
 
-def on_isleme_ve_maskeleme(pdf_path):
-    """PDF'ten metin çıkarır, cümlelere böler ve maskeler."""
-    
-    # 1. Metin Çıkarma
-    print(f"\n[AŞAMA 1] [{pdf_path}] dosyasından metin çıkarılıyor...")
-    raw_text = pdf_metin_cikar(pdf_path)
-    
-    # 2. Cümlelere Ayırma
-    sentences = sent_tokenize(raw_text, language='turkish')
-    print(f"[AŞAMA 2] Toplam {len(sentences)} cümle bulundu.")
+def pdf_sayfalari(pdf_path):
+    """PDF sayfalarını tek tek, boşlukları sadeleştirilmiş olarak üretir."""
+    for page_text in iter_pages(pdf_path, PDF_BACKEND):
+        text = re.sub(r'\s+', ' ', page_text).strip()
+        if text:
+            yield text
 
-    # 3. NER Modelini Yükleme
-    ner_pipeline = load_ner_pipeline(NER_MODEL_NAME)
-    
-    print("\n[AŞAMA 3] Maskeleme İşlemi Başladı (NER -> Regex)")
-    
-    masked_sentences = []
-    
-    # Her cümleyi maskeleme
-    for i, sentence in enumerate(sentences):
-        # Önce: NER Maskeleme (Kişi, Şirket, Yer Adları)
-        ner_masked_sentence = ner_maskeleme_islemi(sentence, ner_pipeline)
-        
-        # Sonra: Regex Maskeleme (Tarih, Tutar, Madde No vb. yapısal veriler)
-        final_masked_sentence = regex_maskeleme_islemi(ner_masked_sentence)
-        
-        masked_sentences.append({
-            "id": i + 1,
-            "orjinal_cumle": sentence,
-            "maskelenmis_cumle": final_masked_sentence
-        })
+def cumle_akisi(pages):
+    """Sayfa akışını Sentence(metin, başlangıç, bitiş) akışına çevirir.
+
+    Sayfanın son cümlesi bir sonraki sayfada devam ediyor olabileceği için
+    tutulur ve sonraki sayfanın başına eklenir. Ofsetler, sayfa metinlerinin
+    tek boşlukla birleştirilmiş hâline (pdf_metin_cikar çıktısına) göredir.
+    """
+    carry = None
+    page_start = 0
+    for page_text in pages:
+        if carry:
+            buffer, base = f"{carry.text} {page_text}", carry.start
+        else:
+            buffer, base = page_text, page_start
+        page_start += len(page_text) + 1
+        sentences = [Sentence(s.text, base + s.start, base + s.end) for s in split_sentences(buffer)]
+        if not sentences:
+            continue
+        carry = sentences.pop()
+        yield from sentences
+    if carry:
+        yield carry
 
-    return masked_sentences
+def _parcala(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def belge_manifesti(pdf_path, belge_id=BELGE_ID):
+    """Dokümanın önceki revizyonuna ait çalışma manifestini açar.
+
+    Ad alanı yalnızca maskelemeyi belirler; risk sonuçları kayıttaki "risk_modeli"
+    (risk_classifier.classifier_id) ile doğrulanarak yeniden kullanılır.
+    """
+    return RunManifest.for_document(pdf_path, cache_namespace(NER_MODEL_NAME), belge_id)
+
+def manifest_ozeti(manifest, changed, total):
+    """Kaydedilen manifestin yeni/değişmiş, yeniden kullanılan ve kaldırılan cümle sayılarını yazdırır."""
+    print(f"[MANİFEST] {changed} cümle yeni/değişmiş, {total - changed} cümle aynen "
+          f"yeniden kullanıldı, {manifest.removed_count()} cümle kaldırılmış.")
+
+def on_isleme_ve_maskeleme_akisi(pdf_path, ner_pipeline=None, chunk_size=STREAM_CHUNK_SIZE, manifest=None,
+                                 pages=None, update_manifest=True):
+    """PDF'i sayfa sayfa okuyup maskelenmiş cümle kayıtlarını sırayla üretir.
+
+    Cümleler chunk_size'lık parçalar hâlinde NER'e ve regex'e girer; bellekte
+    aynı anda yalnızca bir parça tutulur ve ilk sonuçlar son sayfa okunmadan
+    hazır olur. ner_pipeline verilirse (ör. toplu işte her worker'ın bir kez
+    yüklediği model) yeniden yüklenmez.
+
+    manifest verilirse önceki revizyonda da bulunan cümlelerin sonuçları yeniden
+    kullanılır, her kayda "degisti" alanı eklenir ve akış bitince manifest
+    yeni sürümle güncellenir. Kayıtlar manifeste record() anında yazıldığından,
+    kayda sonradan alan ekleyen çağıran (ör. risk sınıflandırması) update_manifest=False
+    verip kayıtları kendisi record() ile ekler ve save() / manifest_ozeti çağırır.
+    pages verilirse sayfa metinleri dosyadan okunmak yerine oradan alınır.
+    """
+    if manifest is not None and manifest.unchanged_file():
+        print(f"\n[MANİFEST] [{pdf_path}] önceki çalışmayla aynı; sonuçlar manifestten okunuyor.")
+        # Kayıtlar yeni manifeste de eklenir; yoksa sonraki save() boş manifest yazar.
+        completed = False
+        try:
+            for sentence_id, record in enumerate(manifest.previous_records(), 1):
+                record = {"id": sentence_id, **record, "degisti": False}
+                if update_manifest:
+                    manifest.record(record)
+                yield record
+            completed = True
+        finally:
+            if update_manifest and completed:
+                manifest.save()
+            elif update_manifest:
+                manifest.discard()
+        return
+
+    print(f"\n[AŞAMA 1-2] [{pdf_path}] sayfa sayfa okunuyor ve cümlelere ayrılıyor...")
+    print("[AŞAMA 3] Maskeleme İşlemi Başladı (NER + Regex -> tek yeniden yazım)")
+
+    # Önbellek: aynı model + kural setiyle daha önce maskelenmiş cümleler atlanır
+    cache = MaskCache(CACHE_FILE, cache_namespace(NER_MODEL_NAME)) if USE_MASK_CACHE else None
+    sentence_id = 0
+    changed = 0
+    completed = False
+    try:
+        pages = pdf_sayfalari(pdf_path) if pages is None else pages
+        for chunk in _parcala(cumle_akisi(pages), chunk_size):
+            sentences = [s.text for s in chunk]
+            # Önceki revizyonda aynen bulunan cümleler hiçbir aşamaya girmez
+            reused = manifest.lookup(sentences) if manifest is not None else {}
+            remaining = [s for s in sentences if s not in reused]
+            masked = cache.get_many(remaining) if cache and remaining else {}
+            pending = list(dict.fromkeys(s for s in remaining if s not in masked))
+
+            if pending:
+                # NER modeli yalnızca önbellekte olmayan cümle varsa yüklenir
+                if ner_pipeline is None:
+                    ner_pipeline = load_ner_pipeline(NER_MODEL_NAME)
+
+                # Parçadaki cümleler için NER, uzunluğa göre gruplanmış batch'lerle çalışır
+                start = time.perf_counter()
+                ner_results = ner_toplu_calistir(pending, ner_pipeline)
+                elapsed = time.perf_counter() - start
+                print(f"[NER] {len(pending)} cümle {elapsed:.1f} sn'de işlendi "
+                      f"({len(pending) / max(elapsed, 1e-9):.1f} cümle/sn, batch={NER_BATCH_SIZE})")
+
+                # NER (Kişi, Şirket, Yer Adları) ve Regex (Tarih, Tutar, Madde No vb.) aralıkları
+                # orijinal cümle üzerinde toplanır, çakışmalar çözülür ve cümle bir kez yazılır.
+                computed = {
+                    sentence: mask_with_spans(sentence, entities, NER_MAPPING)
+                    for sentence, entities in zip(pending, ner_results)
+                }
+                masked.update(computed)
+                if cache:
+                    cache.put_many(computed)
+
+            for sentence, start, end in chunk:
+                sentence_id += 1
+                if sentence in reused:
+                    record = {"id": sentence_id, **reused[sentence]}
+                else:
+                    final_masked_sentence, spans = masked[sentence]
+                    record = {
+                        "id": sentence_id,
+                        "orjinal_cumle": sentence,
+                        "maskelenmis_cumle": final_masked_sentence.strip(),
+                        "maske_araliklari": spans,  # denetim kaydı: (başlangıç, bitiş, etiket, kaynak)
+                    }
+                record["baslangic"], record["bitis"] = start, end  # belge metnindeki ofsetler
+                if manifest is not None:
+                    record["degisti"] = sentence not in reused
+                    changed += record["degisti"]
+                    if update_manifest:
+                        manifest.record(record)
+                yield record
+        completed = True
+    finally:
+        if manifest is not None and update_manifest:
+            if completed:
+                manifest.save()
+                manifest_ozeti(manifest, changed, sentence_id)
+            else:
+                manifest.discard()
+        if cache:
+            stats = cache.stats()
+            print(f"[ÖNBELLEK] isabet: {stats['hits']}, ıskalama: {stats['misses']} "
+                  f"(%{stats['hit_rate'] * 100:.1f}), toplam kayıt: {stats['entries']}")
+            cache.close()
+
+def on_isleme_ve_maskeleme(pdf_path, ner_pipeline=None, manifest=None):
+    """PDF'ten metin çıkarır, cümlelere böler ve maskeler (tüm sonuçları liste olarak döndürür)."""
+    return list(on_isleme_ve_maskeleme_akisi(pdf_path, ner_pipeline, manifest=manifest))
+
+def sonuclari_kaydet(results, output_file=OUTPUT_FILE, belge_id=None):
+    """Maskeleme sonuçlarını okunması kolay blok formatında dosyaya yazar.
+
+    results bir üreteç olabilir; her kayıt geldiği anda yazılır. Yazılan
+    kayıt sayısını döndürür. output_file .jsonl veya .parquet ile bitiyorsa
+    kayıtlar mask_output ile yapılandırılmış biçimde yazılır.
+    """
+    if os.path.splitext(output_file)[1].lower() in FORMATS:
+        belge_id = belge_id or os.path.splitext(os.path.basename(output_file))[0]
+        return sonuclari_yaz(results, output_file, belge_id)
+
+    count = 0
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for item in results:
+            f.write(f"ID: {item['id']}\n")
+            f.write(f"Orijinal: {item['orjinal_cumle']}\n")
+            f.write(f"Maskeli:  {item['maskelenmis_cumle']}\n")
+            if "degisti" in item:
+                f.write(f"Değişti:  {'EVET' if item['degisti'] else 'hayır'}\n")
+            if item.get("risk"):
+                f.write(f"Risk:     {item['risk']} (%{item['risk_skoru'] * 100:.1f})\n")
+            f.write("-" * 50 + "\n")
+            count += 1
+    return count
 
 if __name__ == "__main__":
     try:
-        # 1. PDF dosyasından metni al, cümlelere ayır ve maskele.
-        results = on_isleme_ve_maskeleme(PDF_FILE)
+        # 1. PDF dosyasını sayfa sayfa oku, cümlelere ayır ve maskele (akış hâlinde).
+        manifest = belge_manifesti(PDF_FILE) if USE_MANIFEST else None
+        results = on_isleme_ve_maskeleme_akisi(PDF_FILE, manifest=manifest)
+        first = next(results, None)
         
         # -------------------------------------------------------------------
-        # 4. AŞAMA: Dosyaya Kayıt
+        # 4. AŞAMA: Dosyaya Kayıt (sonuçlar geldikçe yazılır)
         # -------------------------------------------------------------------
 
-        print(f"\n[KAYIT AŞAMASI] {len(results)} cümle '{OUTPUT_FILE}' dosyasına kaydediliyor...")
+        print(f"\n[KAYIT AŞAMASI] Maskelenen cümleler '{OUTPUT_FILE}' dosyasına yazılıyor...")
         
-        # 2. PDF Çıktılarını Dosyaya Kaydetme
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            for item in results:
-                # Dosyada okunması kolay, temiz bir format kullanıldı
-                f.write(f"ID: {item['id']}\n")
-                f.write(f"Orijinal: {item['orjinal_cumle']}\n")
-                f.write(f"Maskeli:  {item['maskelenmis_cumle']}\n")
-                f.write("-" * 50 + "\n")
-
-        print(f"\n✅ KAYIT BAŞARILI! Tüm maskelenmiş çıktılar '{OUTPUT_FILE}' dosyasında.")
+        # 2. PDF Çıktılarını Dosyaya Kaydetme (okunması kolay, temiz bir format)
+        belge_id = BELGE_ID or os.path.splitext(os.path.basename(PDF_FILE))[0]
+        count = sonuclari_kaydet(itertools.chain([first], results) if first else [], OUTPUT_FILE, belge_id)
+
+        print(f"\n✅ KAYIT BAŞARILI! {count} maskelenmiş cümle '{OUTPUT_FILE}' dosyasında.")
         
         # Opsiyonel: Kontrol için ilk maskelenmiş cümleyi terminalde gösterelim
-        if len(results) > 0:
+        if first:
             print(f"\n--- İLK CÜMLE ÖRNEĞİ (PDF Çıktısı) ---")
-            print(f"Maskeli: {results[0]['maskelenmis_cumle']}")
+            print(f"Maskeli: {first['maskelenmis_cumle']}")
             print("---------------------------------------")
             
     except FileNotFoundError:
         print(f"\n🚨 HATA: {PDF_FILE} dosyası bulunamadı. Lütfen dosyanın adını ve yolunu kontrol edin.")
     except Exception as e:
-        print(f"\n🚨 GENEL HATA OLUŞTU: {e}")
\ No newline at end of file
+        print(f"\n🚨 GENEL HATA OLUŞTU: {e}")
@@ -0,0 +1,127 @@
+# Bu kod, bir klasördeki (veya verilen listedeki) tüm PDF sözleşmeleri süreç
+# havuzu ile paralel maskeler. Her worker NER modelini yalnızca bir kez yükler
+# ve CPU çekirdekleri worker'lar arasında paylaştırılır. Her doküman için
+# çıktı klasörüne ayrı bir dosya yazılır; farklı klasörlerde aynı adı taşıyan
+# PDF'lerin çıktı ve manifest adlarına yol özeti eklenir.
+#
+# Kullanım:
+#   python pdf_toplu_analiz.py sozlesmeler/
+#   python pdf_toplu_analiz.py a.pdf b.pdf c.pdf --workers 4 --out maskeli/
+import argparse
+import glob
+import hashlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+OUTPUT_DIR = "masked_outputs"
+
+_ner_pipeline = None
+
+
+def dosyalari_topla(inputs):
+    """Klasörleri *.pdf dosyalarına açar, tekrar edenleri atar."""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(glob.glob(os.path.join(item, "*.pdf"))))
+        else:
+            paths.append(item)
+    return list(dict.fromkeys(paths))
+
+
+def belge_adlari(pdf_paths):
+    """{pdf: belge adı}; ad dosya adıdır, aynı ad birden çok klasörde geçiyorsa
+    sonuna mutlak yolun kısa özeti eklenir (çıktılar birbirinin üzerine yazılmaz)."""
+    stems = {path: os.path.splitext(os.path.basename(path))[0] for path in pdf_paths}
+    counts = {}
+    for stem in stems.values():
+        counts[stem] = counts.get(stem, 0) + 1
+    names = {}
+    for path, stem in stems.items():
+        if counts[stem] > 1:
+            digest = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()[:8]
+            stem = f"{stem}-{digest}"
+        names[path] = stem
+    return names
+
+
+def varsayilan_worker_sayisi():
+    # BERT-base CPU çıkarımı ~4 thread'e kadar iyi ölçeklenir; fazlası worker'a gider.
+    return max(1, (os.cpu_count() or 1) // 4)
+
+
+def _worker_baslat(num_threads):
+    """Her worker bir kez çalışır: torch thread sayısını ayarlar, NER'i yükler."""
+    global _ner_pipeline
+    import torch
+
+    torch.set_num_threads(num_threads)
+    torch.set_num_interop_threads(1)
+
+    from pdf_analiz_v3 import NER_MODEL_NAME, load_ner_pipeline
+
+    _ner_pipeline = load_ner_pipeline(NER_MODEL_NAME)
+
+
+def _dokuman_isle(pdf_path, name, output_dir, output_format="txt"):
+    from pdf_analiz_v3 import USE_MANIFEST, belge_manifesti, on_isleme_ve_maskeleme_akisi, sonuclari_kaydet
+
+    start = time.perf_counter()
+    output_file = os.path.join(output_dir, f"{name}_masked.{output_format}")
+    manifest = belge_manifesti(pdf_path, belge_id=name) if USE_MANIFEST else None
+    results = on_isleme_ve_maskeleme_akisi(pdf_path, _ner_pipeline, manifest=manifest)
+    count = sonuclari_kaydet(results, output_file, belge_id=name)
+    return output_file, count, time.perf_counter() - start
+
+
+def toplu_isle(pdf_paths, output_dir=OUTPUT_DIR, workers=None, output_format="txt"):
+    """Dokümanları worker havuzuna dağıtır; {pdf: çıktı veya hata} döndürür."""
+    workers = workers or varsayilan_worker_sayisi()
+    workers = min(workers, len(pdf_paths)) or 1
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    os.makedirs(output_dir, exist_ok=True)
+    names = belge_adlari(pdf_paths)
+
+    print(f"🚀 {len(pdf_paths)} doküman, {workers} worker x {threads} thread ile işlenecek.")
+    outcome = {}
+    start = time.perf_counter()
+    # torch thread havuzları fork ile güvenli kopyalanmadığı için "spawn" kullanılır.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_worker_baslat,
+                             initargs=(threads,)) as pool:
+        futures = {pool.submit(_dokuman_isle, path, names[path], output_dir, output_format): path
+                   for path in pdf_paths}
+        for done, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            try:
+                output_file, count, elapsed = future.result()
+                outcome[path] = output_file
+                print(f"✅ [{done}/{len(pdf_paths)}] {os.path.basename(path)}: "
+                      f"{count} cümle, {elapsed:.1f} sn -> {output_file}")
+            except Exception as e:
+                outcome[path] = e
+                print(f"❌ [{done}/{len(pdf_paths)}] {os.path.basename(path)}: {e}")
+
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for v in outcome.values() if not isinstance(v, Exception))
+    print(f"\n🏁 {ok}/{len(pdf_paths)} doküman {elapsed:.1f} sn'de tamamlandı "
+          f"({len(pdf_paths) / max(elapsed, 1e-9) * 3600:.0f} doküman/saat).")
+    return outcome
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF sözleşmeleri paralel maskeler.")
+    parser.add_argument("inputs", nargs="+", help="PDF dosyaları ve/veya PDF içeren klasörler")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: çekirdek/4)")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Çıktı klasörü")
+    parser.add_argument("--format", default="txt", choices=["txt", "jsonl", "parquet"],
+                        help="Çıktı biçimi (jsonl/parquet: mask_output ile okunabilir)")
+    args = parser.parse_args()
+
+    pdf_paths = dosyalari_topla(args.inputs)
+    if not pdf_paths:
+        print("🚨 HATA: İşlenecek PDF dosyası bulunamadı.")
+    else:
+        toplu_isle(pdf_paths, args.out, args.workers, args.format)
@@ -0,0 +1,113 @@
+# Bu kod, risk sınıflandırmasını cümle cümle değil toplu (batch) yapar.
+# Girdiler token uzunluğuna göre sıralanır, her batch bir token bütçesinin
+# (batch boyu x en uzun cümle) altında kalacak şekilde doldurulur, dolgu yalnızca
+# batch'in en uzun cümlesine kadar yapılır ve ileri geçiş torch.inference_mode
+# altında (veya backend="onnx" ile onnxruntime'da) çalışır. Sonuçlar girdi
+# sırasıyla döndürülür.
+#
+# Kullanım:
+#   from risk_classifier import classify_batch
+#   for r in classify_batch(cumleler):
+#       print(r["label"], r["score"])
+import hashlib
+import os
+
+from model_registry import MODEL_REGISTRY
+
+DEFAULT_MODEL_PATH = "./trained-models/yg_eqa"
+MAX_LENGTH = 256
+MAX_TOKENS = 8192       # bir batch'teki dolgulu token sayısı üst sınırı
+MAX_BATCH_SIZE = 64
+CLASSIFIER_FILES = ("config.json", "model.safetensors", "pytorch_model.bin", os.path.join("onnx", "model.onnx"))
+
+
+def classifier_id(model_path=DEFAULT_MODEL_PATH, quantized=False, backend="torch", max_length=MAX_LENGTH):
+    """Risk sonuçlarını üreten sınıflandırıcının kimliği.
+
+    Model yolu, arka uç, INT8 seçeneği, max_length ve ağırlık dosyalarının
+    boyut/tarihinden üretilir; manifestteki bir risk sonucu yalnızca kimlik
+    aynıysa yeniden kullanılır (aynı yola yeniden eğitilmiş model de yeni kimlik alır).
+    """
+    digest = hashlib.sha256(f"{os.path.abspath(model_path)}|{backend}|{quantized}|{max_length}".encode())
+    for name in CLASSIFIER_FILES:
+        path = os.path.join(model_path, name)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+def token_budget_batches(lengths, max_tokens=MAX_TOKENS, max_batch_size=MAX_BATCH_SIZE):
+    """Uzunluklara göre sıralı indeks batch'leri üretir.
+
+    Her batch'te (eleman sayısı x en uzun eleman) max_tokens'ı aşmaz; tek
+    başına bütçeyi aşan uzun bir cümle kendi batch'inde yer alır.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batch = []
+    longest = 0
+    for i in order:
+        longest_if_added = max(longest, lengths[i])
+        if batch and ((len(batch) + 1) * longest_if_added > max_tokens or len(batch) >= max_batch_size):
+            yield batch
+            batch, longest_if_added = [], lengths[i]
+        batch.append(i)
+        longest = longest_if_added
+    if batch:
+        yield batch
+
+
+def _torch_olasiliklari(model, tokenizer, batches):
+    import torch
+
+    device = next(model.parameters()).device
+    with torch.inference_mode():
+        for batch, features in batches:
+            inputs = tokenizer.pad(features, padding="longest", return_tensors="pt").to(device)
+            yield batch, torch.softmax(model(**inputs).logits.float(), dim=-1).cpu().tolist()
+
+
+def _onnx_olasiliklari(session, tokenizer, batches):
+    from onnx_backend import softmax
+
+    for batch, features in batches:
+        logits = session.logits(tokenizer.pad(features, padding="longest", return_tensors="np"))
+        yield batch, softmax(logits).tolist()
+
+
+def classify_batch(texts, model_path=DEFAULT_MODEL_PATH, max_tokens=MAX_TOKENS,
+                   max_batch_size=MAX_BATCH_SIZE, max_length=MAX_LENGTH, quantized=False,
+                   backend="torch", handle=None):
+    """Metinleri toplu sınıflandırır.
+
+    Her metin için {"label", "score", "probabilities"} döndürür; score en
+    yüksek sınıfın olasılığıdır (0-1), probabilities etiket -> olasılık sözlüğüdür.
+    quantized=True ise modelin dinamik INT8 CPU sürümü, backend="onnx" ise
+    onnx_backend ile dışa aktarılmış ONNX modeli kullanılır. handle, çağıranın
+    MODEL_REGISTRY.get ile zaten aldığı (tokenizer, model) çiftidir; verilirse
+    registry'ye tekrar gidilmez.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    tokenizer, model = handle or MODEL_REGISTRY.get(model_path, quantized=quantized, backend=backend)
+    id2label = model.config.id2label
+
+    encoded = tokenizer(texts, truncation=True, max_length=max_length)
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+    batches = (
+        (batch, [{key: encoded[key][i] for key in encoded.keys()} for i in batch])
+        for batch in token_budget_batches(lengths, max_tokens, max_batch_size)
+    )
+    run = _onnx_olasiliklari if backend == "onnx" else _torch_olasiliklari
+
+    results = [None] * len(texts)
+    for batch, probabilities in run(model, tokenizer, batches):
+        for i, probs in zip(batch, probabilities):
+            best = max(range(len(probs)), key=probs.__getitem__)
+            results[i] = {
+                "label": id2label[best],
+                "score": probs[best],
+                "probabilities": {id2label[k]: p for k, p in enumerate(probs)},
+            }
+    return results
@@ -0,0 +1,170 @@
+# Bu kod, işlenen her doküman için bir çalışma manifesti (run manifest) tutar:
+# dosyanın özeti ve her cümlenin özeti ile sonucu (maskeli metin, aralıklar, varsa
+# risk sonucu). Sözleşmenin yeni bir revizyonu geldiğinde değişmeyen cümlelerin
+# sonuçları manifestten alınır; yalnızca eklenen veya değişen cümleler NER'e,
+# maskelemeye ve sınıflandırmaya girer. Dosya hiç değişmediyse çıkarma bile yapılmaz.
+#
+# Manifest JSON Lines biçimindedir: ilk satır başlık (sürüm, namespace, dosya
+# özeti), sonraki her satır bir cümle. Yeni kayıtlar record() anında geçici dosyaya
+# yazılır ve save() onu atomik olarak yerine taşır; önceki manifestten bellekte
+# yalnızca cümle özeti -> dosya ofseti dizini tutulur, kayıtlar gerektikçe okunur.
+#
+# Kullanım:
+#   manifest = RunManifest.for_document("sozlesme_v2.pdf", namespace, belge_id="sozlesme")
+#   onceki = manifest.lookup(cumleler)      # {cümle: önceki kayıt}
+#   manifest.record(kayit)                  # yeni sürümdeki sırasıyla, kayıt tamamlandıktan sonra
+#   manifest.save()                         # hata olursa manifest.discard()
+import hashlib
+import json
+import os
+import time
+
+from mask_spans import Span
+
+MANIFEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "manifests")
+MANIFEST_VERSION = 2
+_HASH_PREFIX = b'{"hash": "'  # her cümle satırı özetle başlar; dizin json çözmeden kurulur
+
+
+def sentence_hash(text, namespace=""):
+    return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _entry(line):
+    entry = json.loads(line)
+    entry["maske_araliklari"] = [Span(*s) for s in entry["maske_araliklari"]]
+    return entry
+
+
+class RunManifest:
+    """Bir dokümanın son işlenen sürümüne ait cümle özetleri ve sonuçları."""
+
+    def __init__(self, path, namespace="", document_path=None):
+        self.path = path
+        self.namespace = namespace
+        self.document_path = document_path
+        self.file_sha256 = file_hash(document_path) if document_path else None
+        self._previous_file = None
+        self._previous_count = 0
+        self._by_hash = {}  # özet -> [ilk satırın ofseti, satır sayısı]
+        self._tmp = f"{path}.{os.getpid()}.tmp"
+        self._writer = None
+        self._seen = set()
+        self._load()
+
+    @classmethod
+    def for_document(cls, document_path, namespace="", belge_id=None, directory=MANIFEST_DIR):
+        """belge_id verilmezse dosya adı kullanılır; revizyonlar farklı adla gelirse
+        aynı belge_id verilerek önceki sürümün manifesti bulunur."""
+        belge_id = belge_id or os.path.splitext(os.path.basename(document_path))[0]
+        return cls(os.path.join(directory, f"{belge_id}.jsonl"), namespace, document_path)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                return
+            # Model veya kural seti değiştiyse eski sonuçlar geçersizdir.
+            if header.get("version") != MANIFEST_VERSION or header.get("namespace") != self.namespace:
+                return
+            self._previous_file = header.get("file_sha256")
+            offset = f.tell()
+            for line in f:
+                if line.startswith(_HASH_PREFIX):
+                    digest = line[len(_HASH_PREFIX):len(_HASH_PREFIX) + 64].decode("ascii")
+                    self._by_hash.setdefault(digest, [offset, 0])[1] += 1
+                    self._previous_count += 1
+                offset += len(line)
+
+    def unchanged_file(self):
+        """Doküman önceki çalışmayla bayt bayt aynıysa True."""
+        return self._previous_count > 0 and self._previous_file == self.file_sha256
+
+    def previous_records(self):
+        """Önceki çalışmanın kayıtlarını sırasıyla, dosyadan okuyarak üretir (özet alanı hariç)."""
+        if not self._previous_count:
+            return
+        with open(self.path, "rb") as f:
+            f.readline()
+            for line in f:
+                entry = _entry(line)
+                del entry["hash"]
+                yield entry
+
+    def lookup(self, sentences):
+        """Önceki sürümde de bulunan cümleler için {cümle: önceki kayıt} döndürür."""
+        found = {}
+        wanted = {}
+        for sentence in sentences:
+            digest = sentence_hash(sentence, self.namespace)
+            if digest in self._by_hash:
+                wanted.setdefault(self._by_hash[digest][0], (digest, sentence))
+        if not wanted:
+            return found
+        with open(self.path, "rb") as f:
+            for offset in sorted(wanted):
+                digest, sentence = wanted[offset]
+                f.seek(offset)
+                entry = _entry(f.readline())
+                if entry.pop("hash") != digest:
+                    continue  # dosya yüklemeden sonra değişmiş
+                entry.pop("id", None)
+                found[sentence] = entry
+        return found
+
+    def record(self, result):
+        """Yeni sürümdeki bir cümlenin sonucunu geçici dosyaya yazar (id ve degisti saklanmaz).
+
+        Kayıt çağrı anında yazılır; sonradan eklenen alanlar (ör. risk sonucu)
+        manifeste girmez, bu yüzden kayıt tamamlandıktan sonra çağrılmalıdır.
+        """
+        digest = sentence_hash(result["orjinal_cumle"], self.namespace)
+        entry = {
+            "hash": digest,
+            **{k: v for k, v in result.items() if k not in ("id", "degisti", "hash")},
+            "maske_araliklari": [list(s) for s in result["maske_araliklari"]],
+        }
+        self._open_writer().write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._seen.add(digest)
+
+    def removed_count(self):
+        """Önceki sürümde olup yeni sürümde bulunmayan cümle sayısı."""
+        return sum(count for digest, (_, count) in self._by_hash.items() if digest not in self._seen)
+
+    def _open_writer(self):
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._writer = open(self._tmp, "w", encoding="utf-8")
+            header = {
+                "version": MANIFEST_VERSION,
+                "namespace": self.namespace,
+                "document": self.document_path,
+                "file_sha256": self.file_sha256,
+                "created": time.time(),
+            }
+            self._writer.write(json.dumps(header, ensure_ascii=False) + "\n")
+        return self._writer
+
+    def save(self):
+        """Kaydedilen cümlelerle manifesti atomik olarak değiştirir."""
+        self._open_writer().close()
+        self._writer = None
+        os.replace(self._tmp, self.path)
+
+    def discard(self):
+        """Yarım kalan çalışmanın geçici dosyasını siler; önceki manifest korunur."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.remove(self._tmp)
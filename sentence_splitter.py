@@ -0,0 +1,91 @@
+# Bu kod, sözleşme metnini tek geçişte cümlelere ayırır ve her cümlenin orijinal
+# metindeki karakter ofsetlerini döndürür. Kısaltmalar ("Md.", "T.C.", "Av.") ve
+# sıra sayıları / tarihler ("5. madde", "12. Ocak") yer tutucu ile değiştirilmek
+# yerine, aday sınırın hemen solundaki ve sağındaki kelimeye bakılarak elenir.
+# Böylece süre metin uzunluğuyla doğrusal kalır.
+#
+# Kullanım:
+#   from sentence_splitter import split_sentences
+#   for s in split_sentences(text):
+#       print(s.start, s.end, s.text)
+import re
+from typing import NamedTuple
+
+# Nokta ile bitse de cümleyi bitirmeyen kısaltmalar (son nokta hariç yazılır)
+ABBREVIATIONS = {
+    "Mr", "Mrs", "Dr", "Prof", "Doç", "Yrd", "Av", "Sn", "Müh", "Öğr", "Gör",
+    "T.C", "No", "Nr", "Madde", "Md", "md", "Bkz", "bkz", "vb", "vs", "örn", "Örn",
+    "Ltd", "Şti", "A.Ş", "Tic", "San", "Mah", "Cad", "Sok", "Blv", "Apt", "Kat",
+    "Tel", "Faks", "Fax", "s", "sf", "S", "Sy", "c", "C", "f", "fık", "ted", "yy",
+    "Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos",
+    "Eylül", "Ekim", "Kasım", "Aralık",
+}
+_MAX_ABBR_LEN = max(len(a) for a in ABBREVIATIONS) + 2
+
+# Aday sınır: bir veya daha çok bitiş işareti, ardından kapanan tırnak/parantez
+# ve boşluk. Tarihlerdeki iç noktalar ("01.01.2023") boşlukla bitmediği için aday olmaz.
+_BOUNDARY = re.compile(r"[.!?…]+[\"'”’)\]]*(?=\s)")
+_WORD_BEFORE = re.compile(r"[(\[\"'“‘]?(\S+)$")
+_NEXT_TOKEN = re.compile(r"\s+(\S+)")
+_ORDINAL = re.compile(r"\d{1,3}")
+
+
+class Sentence(NamedTuple):
+    text: str
+    start: int
+    end: int
+
+
+def _is_boundary(text, match):
+    punct = match.group()
+    next_match = _NEXT_TOKEN.match(text, match.end())
+    if next_match is None:
+        return True
+    next_token = next_match.group(1)
+
+    # Yeni cümle küçük harfle başlamaz: "Taraflar vs. diğer" gibi durumlar
+    if next_token[0].islower():
+        return False
+
+    if punct.rstrip("\"'”’)]") != ".":
+        return True  # "!", "?", "..." her zaman sınırdır
+
+    word = _WORD_BEFORE.search(text, max(0, match.start() - _MAX_ABBR_LEN), match.start())
+    if word is None:
+        return True
+    word = word.group(1)
+    if word in ABBREVIATIONS:
+        return False
+    # Tek harfli baş harf: "A. Yılmaz"
+    if len(word) == 1 and word.isalpha() and word.isupper():
+        return False
+    # Sıra sayısı / tarih: "5. Madde", "12. Ocak 2023", "3. 4. ve 5. maddeler"
+    if _ORDINAL.fullmatch(word) and (next_token[0].isdigit() or next_token.rstrip(".,") in ABBREVIATIONS):
+        return False
+    return True
+
+
+def split_sentences(text):
+    """Metni cümlelere ayırır; her cümle için (metin, başlangıç, bitiş) döndürür.
+
+    Ofsetler verilen metne göredir ve cümlenin başındaki/sonundaki boşlukları
+    içermez: text[s.start:s.end] == s.text.
+    """
+    sentences = []
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        if not _is_boundary(text, match):
+            continue
+        _append(sentences, text, start, match.end())
+        start = match.end()
+    _append(sentences, text, start, len(text))
+    return sentences
+
+
+def _append(sentences, text, start, end):
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start < end:
+        sentences.append(Sentence(text[start:end], start, end))
@@ -0,0 +1,268 @@
+# Bu kod, sözleşme risk analizini tek bir boru hattında (pipeline) çalıştırır:
+# metin çıkarma -> cümlelere ayırma + maskeleme (NER + regex) -> risk sınıflandırma
+# -> rapor/kayıt. Her aşama ayrı bir thread'de çalışır ve aşamalar birbirine sınırlı
+# boyutlu kuyruklarla bağlanır; böylece sonraki sayfaların PDF okuması ve regex
+# işi, o anki batch'in model çıkarımıyla örtüşür ve bellek kuyruk boyuyla sınırlı
+# kalır. NER ve risk modeli de paralel yüklenir. Sonunda her aşamanın işlediği öğe
+# sayısı, meşgul süresi ve saniyedeki öğe sayısı raporlanır.
+#
+# Kullanım:
+#   python sozlesme_risk_analizi.py 2-turkiye-arnavutluk.pdf
+#   python sozlesme_risk_analizi.py a.pdf b.pdf --out risk_raporlari/ --model ./trained-models/yg_eqa
+import argparse
+import os
+import queue
+import threading
+import time
+from collections import Counter
+
+from pdf_analiz_v3 import (
+    NER_MODEL_NAME,
+    USE_MANIFEST,
+    belge_manifesti,
+    load_ner_pipeline,
+    manifest_ozeti,
+    on_isleme_ve_maskeleme_akisi,
+    pdf_sayfalari,
+    sonuclari_kaydet,
+)
+from model_registry import MODEL_REGISTRY
+from risk_classifier import DEFAULT_MODEL_PATH, classifier_id, classify_batch
+
+OUTPUT_DIR = "risk_outputs"
+QUEUE_SIZE = 8          # her kuyrukta bekleyebilecek en fazla öğe (sayfa / kayıt grubu)
+CLASSIFY_CHUNK = 128    # sınıflandırmaya tek seferde verilen en fazla cümle sayısı
+REPORT_TOP_N = 10       # raporda gösterilecek en yüksek skorlu YUKSEK_RISK cümle sayısı
+HIGH_RISK_LABEL = "YUKSEK_RISK"
+
+_BITTI = object()
+
+
+class Asama:
+    """Bir aşamanın işlediği öğe sayısı ve kuyrukta beklemeden geçen süresi."""
+
+    def __init__(self, name, unit):
+        self.name = name
+        self.unit = unit
+        self.items = 0
+        self.wait = 0.0
+        self.started = None
+        self.finished = None
+
+    @property
+    def busy(self):
+        return max((self.finished or time.perf_counter()) - self.started - self.wait, 0.0)
+
+
+def _kuyruktan(q, asama):
+    """Kuyruktaki öğeleri bitiş işaretine kadar üretir; bekleme süresini ölçer."""
+    while True:
+        start = time.perf_counter()
+        item = q.get()
+        asama.wait += time.perf_counter() - start
+        if item is _BITTI:
+            return
+        yield item
+
+
+class _Durdur(Exception):
+    """Başka bir aşama hata verdiği için bu aşama bırakılıyor."""
+
+
+def _kuyruga(q, item, asama, errors):
+    """Öğeyi kuyruğa koyar; kuyruk doluyken başka bir aşama hata verirse bırakır."""
+    start = time.perf_counter()
+    while True:
+        try:
+            q.put(item, timeout=0.5)
+            break
+        except queue.Full:
+            if errors:
+                raise _Durdur()
+    asama.wait += time.perf_counter() - start
+
+
+def _calistir(asama, errors, output, work):
+    """Aşama fonksiyonunu çalıştırır; hata olsa da sonraki aşamaya bitiş işareti gönderir."""
+    asama.started = time.perf_counter()
+    try:
+        work()
+    except _Durdur:
+        pass
+    except BaseException as e:
+        errors.append((asama.name, e))
+    finally:
+        asama.finished = time.perf_counter()
+        # Sonraki aşama hata yüzünden durduysa kuyruk dolu kalabilir; beklenmez.
+        while True:
+            try:
+                output.put(_BITTI, timeout=0.5)
+                break
+            except queue.Full:
+                if errors:
+                    break
+
+
+def _parca_grupla(records, size):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def analiz_et(pdf_path, output_file, model_path=DEFAULT_MODEL_PATH, ner_pipeline=None, quantized=False,
+              backend="torch"):
+    """Tek bir sözleşmeyi uçtan uca işler; (kayıt sayısı, aşama istatistikleri, risk sayımı) döndürür."""
+    pages_q = queue.Queue(QUEUE_SIZE)
+    masked_q = queue.Queue(QUEUE_SIZE)
+    scored_q = queue.Queue(QUEUE_SIZE)
+    errors = []
+
+    cikarma = Asama("1. Metin çıkarma", "sayfa")
+    maskeleme = Asama("2. Ayırma + maskeleme", "cümle")
+    siniflandirma = Asama("3. Risk sınıflandırma", "cümle")
+    kayit = Asama("4. Rapor + kayıt", "cümle")
+
+    manifest = belge_manifesti(pdf_path) if USE_MANIFEST else None
+
+    def metin_cikar():
+        if manifest is not None and manifest.unchanged_file():
+            return  # maskeleme aşaması sonuçları manifestten okur, sayfa gerekmez
+        for page_text in pdf_sayfalari(pdf_path):
+            cikarma.items += 1
+            _kuyruga(pages_q, page_text, cikarma, errors)
+
+    def maskele():
+        records = on_isleme_ve_maskeleme_akisi(
+            pdf_path, ner_pipeline, manifest=manifest,
+            pages=_kuyruktan(pages_q, maskeleme), update_manifest=False,
+        )
+        for chunk in _parca_grupla(records, CLASSIFY_CHUNK):
+            maskeleme.items += len(chunk)
+            _kuyruga(masked_q, chunk, maskeleme, errors)
+
+    classifier = classifier_id(model_path, quantized, backend)
+
+    def siniflandir():
+        MODEL_REGISTRY.get(model_path, quantized, backend)  # yüklü değilse NER ile paralel yüklenir
+        stale = 0
+        for chunk in _kuyruktan(masked_q, siniflandirma):
+            # Manifestten gelen değişmemiş cümlelerin risk sonucu, yalnızca aynı
+            # sınıflandırıcıyla (model, --int8, --backend) üretildiyse yeniden kullanılır.
+            pending = [r for r in chunk if r.get("risk") is None or r.get("risk_modeli") != classifier]
+            stale += sum(1 for r in pending if r.get("risk") is not None)
+            predictions = classify_batch([r["maskelenmis_cumle"] for r in pending], model_path,
+                                         quantized=quantized, backend=backend)
+            for record, prediction in zip(pending, predictions):
+                record["risk"] = prediction["label"]
+                record["risk_skoru"] = prediction["score"]
+                record["risk_modeli"] = classifier
+            siniflandirma.items += len(chunk)
+            _kuyruga(scored_q, chunk, siniflandirma, errors)
+        if stale:
+            print(f"♻️ {stale} cümlenin manifestteki risk sonucu başka bir sınıflandırıcıya aitti; "
+                  f"yeniden sınıflandırıldı.")
+
+    stages = [(cikarma, pages_q, metin_cikar), (maskeleme, masked_q, maskele),
+              (siniflandirma, scored_q, siniflandir)]
+    threads = [threading.Thread(target=_calistir, args=(asama, errors, output, work), daemon=True)
+               for asama, output, work in stages]
+    for thread in threads:
+        thread.start()
+
+    risk_counts = Counter()
+    high_risk = []
+    changed = 0
+
+    def kayitlar():
+        nonlocal changed
+        for chunk in _kuyruktan(scored_q, kayit):
+            for record in chunk:
+                kayit.items += 1
+                if manifest is not None:
+                    # Risk sonucu yazıldıktan sonra manifeste eklenir (kayıt anında diske gider).
+                    manifest.record(record)
+                    changed += record["degisti"]
+                risk_counts[record["risk"]] += 1
+                if record["risk"] == HIGH_RISK_LABEL:
+                    high_risk.append((record["risk_skoru"], record["id"], record["maskelenmis_cumle"]))
+                yield record
+
+    kayit.started = time.perf_counter()
+    belge_id = os.path.splitext(os.path.basename(pdf_path))[0]
+    try:
+        count = sonuclari_kaydet(kayitlar(), output_file, belge_id)
+    except BaseException as e:
+        errors.append((kayit.name, e))
+        count = 0
+    kayit.finished = time.perf_counter()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        if manifest is not None:
+            manifest.discard()
+        name, error = errors[0]
+        raise RuntimeError(f"{name} aşamasında hata: {error}") from error
+    if manifest is not None:
+        manifest.save()
+        manifest_ozeti(manifest, changed, count)
+
+    high_risk.sort(reverse=True)
+    return count, [cikarma, maskeleme, siniflandirma, kayit], risk_counts, high_risk[:REPORT_TOP_N]
+
+
+def raporla(pdf_path, count, stages, risk_counts, high_risk, elapsed):
+    print("\n" + "=" * 85)
+    print(f"📊 SÖZLEŞME RİSK ANALİZİ: {os.path.basename(pdf_path)} ({count} cümle, {elapsed:.1f} sn)")
+    print("=" * 85)
+    print(f"{'Aşama':<26} | {'Öğe':<12} | {'Meşgul (sn)':<11} | {'Bekleme (sn)':<12} | {'Öğe/sn':<10}")
+    print("-" * 85)
+    for asama in stages:
+        rate = asama.items / max(asama.busy, 1e-9)
+        print(f"{asama.name:<26} | {f'{asama.items} {asama.unit}':<12} | {asama.busy:<11.2f} | "
+              f"{asama.wait:<12.2f} | {rate:<10.1f}")
+    print("-" * 85)
+    serial = sum(asama.busy for asama in stages)
+    print(f"⏱️ Aşamaların toplam meşgul süresi {serial:.1f} sn; örtüşme ile duvar saati {elapsed:.1f} sn.")
+
+    print("\n🔎 Risk dağılımı: " + ", ".join(f"{label}: {n}" for label, n in risk_counts.most_common()))
+    if high_risk:
+        print(f"🚨 En yüksek skorlu {len(high_risk)} {HIGH_RISK_LABEL} cümle:")
+        for score, sentence_id, text in high_risk:
+            print(f"  [{sentence_id}] %{score * 100:.1f}  {text[:100]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sözleşmeleri maskeler ve cümle cümle risk sınıflandırır.")
+    parser.add_argument("inputs", nargs="+", help="PDF/DOCX dosyaları")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Çıktı klasörü")
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH, help="Risk sınıflandırma modeli")
+    parser.add_argument("--format", default="jsonl", choices=["txt", "jsonl", "parquet"], help="Çıktı biçimi")
+    parser.add_argument("--int8", action="store_true", help="Risk modelini dinamik INT8 nicelenmiş çalıştır (CPU)")
+    parser.add_argument("--backend", default="torch", choices=["torch", "onnx"],
+                        help="Risk modeli arka ucu (onnx: önce python onnx_backend.py <model>)")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    # İki model paralel ve tüm dokümanlar için yalnızca bir kez yüklenir
+    loader = threading.Thread(target=MODEL_REGISTRY.get, args=(args.model, args.int8, args.backend))
+    loader.start()
+    ner_pipeline = load_ner_pipeline(NER_MODEL_NAME)
+    loader.join()
+    for pdf_path in args.inputs:
+        name = os.path.splitext(os.path.basename(pdf_path))[0]
+        output_file = os.path.join(args.out, f"{name}_risk.{args.format}")
+        start = time.perf_counter()
+        try:
+            count, stages, risk_counts, high_risk = analiz_et(
+                pdf_path, output_file, args.model, ner_pipeline, args.int8, args.backend)
+        except Exception as e:
+            print(f"\n🚨 HATA: {pdf_path}: {e}")
+            continue
+        raporla(pdf_path, count, stages, risk_counts, high_risk, time.perf_counter() - start)
+        print(f"💾 Sonuçlar → {output_file}")
@@ -1,15 +1,7 @@
-from transformers import pipeline
-import torch # Gerekli kütüphaneyi ekliyoruz
+from risk_classifier import classify_batch
 
-# 1. Pipeline'ı Yükle
+# 1. Model yolu (model ilk çağrıda bir kez yüklenir, CPU'da çalışır)
 model_path = "./final-legal-bert-risk-model"
-risk_classifier = pipeline(
-    "text-classification",
-    model=model_path,
-    tokenizer=model_path,
-    # BURAYI DEĞİŞTİRİN: GPU'dan (-1) CPU'ya geçiyoruz
-    device=-1  
-)
 
 # 2. Sınıflandırmak İstediğiniz Örnek Metinler (Aynı Kalır)
 texts_to_analyze = [
@@ -20,9 +12,8 @@ texts_to_analyze = [
 
 print("\n--- Sınıflandırma Sonuçları ---")
 
-for text in texts_to_analyze:
-    # Model yüklendikten sonra tahmin başlar
-    result = risk_classifier(text)[0]
+# Tüm metinler tek çağrıda, uzunluğa göre gruplanmış batch'lerle sınıflandırılır
+for text, result in zip(texts_to_analyze, classify_batch(texts_to_analyze, model_path)):
     
     label_turkish = result['label'].replace('_', ' ') 
     
@@ -0,0 +1,66 @@
+import csv
+import os
+import re
+
+import pytest
+
+from data_mask import MASK_ENGINE, mask_text, mask_text_sequential
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _cumleler():
+    texts = []
+    for name in ("dataset-v1-train.csv", "datase-v1-test.csv"):
+        with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+            texts.extend(re.sub(r"\s+", " ", row["text"]).strip() for row in csv.DictReader(f))
+    return texts
+
+
+CUMLELER = _cumleler()
+
+
+def test_engine_matches_sequential_on_corpus():
+    farkli = [t for t in CUMLELER if mask_text(t) != mask_text_sequential(t)]
+    assert farkli == []
+
+
+def test_engine_matches_sequential_on_joined_document():
+    belge = "\n".join(CUMLELER[:200])
+    assert mask_text(belge) == mask_text_sequential(belge)
+
+
+@pytest.mark.parametrize("text", [
+    "Ahmet Yılmaz, TR33 0006 1005 1978 6457 8413 26 numaralı hesaba 5.000 TL ödeyecektir.",
+    # kisi_adi maskesi adres_satiri'nin ilk eşleşmesini engeller; eski döngü kalan kısmı yine maskeler
+    "İstanbul Anadolu Mahkemeleri yetkilidir. Tel: 0532 123 45 67, e-posta: ali@ornek.com",
+    "ISPARTA ili ve İzmir'de, 12 Ocak 2023 tarihinde T.C. kimlik no 12345678901 ile.",
+    "Türkiye İş Bankası A.Ş. ve ABC Ltd. Şti. arasında",
+    # ek_referansi önceki kuralın yazdığı [KİŞİ_ADI] etiketini de yutar
+    "Ek-1 Ahmet Yılmaz",
+    # IGNORECASE altında "ı" == "i"; çapa ön elemesi kuralı atlamamalı
+    "Kadıköy vergı dairesi",
+    "KADIKÖY VERGİ DAİRESİ",
+    "Ek-2, Ahmet Yılmaz ve Ek-3 ABC Lojistik A.Ş. ile imzalı",
+    "",
+])
+def test_engine_matches_sequential_on_overlapping_rules(text):
+    assert mask_text(text) == mask_text_sequential(text)
+
+
+def test_reference_swallowing_earlier_mask():
+    assert mask_text("Ek-1 Ahmet Yılmaz") == "[EK_REFERANSI]"
+    assert [name for _, _, name, _ in MASK_ENGINE.spans("Ek-1 Ahmet Yılmaz")] == ["ek_referansi"]
+
+
+def test_spans_are_sorted_and_disjoint():
+    text = "İstanbul Anadolu Mahkemeleri yetkilidir. Tel: 0532 123 45 67, e-posta: ali@ornek.com"
+    spans = list(MASK_ENGINE.spans(text))
+    assert spans
+    for (_, end, _, _), (start, _, _, _) in zip(spans, spans[1:]):
+        assert end <= start
+    pieces, pos = [], 0
+    for start, end, _, replacement in spans:
+        pieces.append(text[pos:start] + replacement)
+        pos = end
+    assert "".join(pieces) + text[pos:] == MASK_ENGINE.mask(text)
@@ -0,0 +1,52 @@
+import pytest
+
+import gazetteer
+from gazetteer import Gazetteer, turkish_fold
+
+
+@pytest.fixture
+def sozluk_dizini(tmp_path):
+    (tmp_path / "iller.txt").write_text(
+        "# yorum satırı\nIsparta\nİzmir\nKahraman\nKahramanmaraş\nAfyon Karahisar\n", encoding="utf-8"
+    )
+    (tmp_path / "bankalar.txt").write_text("İş Bankası\nIsparta\n", encoding="utf-8")
+    return tmp_path
+
+
+def _iller(directory):
+    return Gazetteer("iller", directory=directory, cache_dir=None)
+
+
+def test_turkish_fold_keeps_length():
+    assert turkish_fold("İSTANBUL IĞDIR") == "istanbul ığdır"
+    assert len(turkish_fold("İİİ")) == 3
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("ISPARTA ve İZMİR'de", "[İL] ve [İL]'de"),
+    ("ısparta ile izmir", "[İL] ile [İL]"),
+    ("AFYON   KARAHİSAR merkez", "[İL] merkez"),
+    ("Kahramanmaraş'ta", "[İL]'ta"),          # en uzun girdi kazanır
+    ("Ispartalı ve İzmirli", "Ispartalı ve İzmirli"),  # kelime sınırı
+    ("İzmirKahraman", "İzmirKahraman"),
+])
+def test_case_folding_and_word_boundaries(sozluk_dizini, text, expected):
+    assert _iller(sozluk_dizini).sub("[İL]", text) == expected
+
+
+def test_union_prefers_earlier_gazetteer(sozluk_dizini):
+    bankalar = Gazetteer("bankalar", directory=sozluk_dizini, cache_dir=None)
+    merged = Gazetteer.union([bankalar, _iller(sozluk_dizini)], cache_dir=None)
+    assert list(merged.finditer_labeled("Isparta İş Bankası")) == [(0, 7, 0), (8, 18, 0)]
+    assert list(merged.finditer_labeled("İzmir")) == [(0, 5, 1)]
+
+
+def test_automaton_cache_roundtrip(sozluk_dizini, tmp_path, monkeypatch):
+    monkeypatch.setattr(gazetteer, "_loaded", {})
+    cache_dir = tmp_path / "cache"
+    first = Gazetteer("iller", directory=sozluk_dizini, cache_dir=str(cache_dir))
+    assert list(cache_dir.glob("*.pkl"))
+    monkeypatch.setattr(gazetteer, "_loaded", {})
+    second = Gazetteer("iller", directory=sozluk_dizini, cache_dir=str(cache_dir))
+    assert first.key == second.key
+    assert list(second.finditer("izmir ve ISPARTA")) == [(0, 5), (9, 16)]
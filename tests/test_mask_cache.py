@@ -0,0 +1,53 @@
+import itertools
+import types
+
+import pytest
+
+import mask_cache
+from mask_cache import MaskCache
+from mask_spans import Span
+
+
+@pytest.fixture
+def saat(monkeypatch):
+    """Her çağrıda bir artan sahte saat; last_used sıralaması belirli olur."""
+    ticks = itertools.count(1)
+    monkeypatch.setattr(mask_cache, "time", types.SimpleNamespace(time=lambda: next(ticks)))
+
+
+def _kayit(text):
+    return (f"[{text}]", [Span(0, len(text), f"[{text}]", "regex:test")])
+
+
+def test_roundtrip_and_stats(tmp_path, saat):
+    cache = MaskCache(str(tmp_path / "c.sqlite"), namespace="ns")
+    cache.put_many({"a": _kayit("a")})
+    assert cache.get_many(["a", "b", "a"]) == {"a": _kayit("a")}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    cache.close()
+
+
+def test_namespace_isolates_entries(tmp_path, saat):
+    path = str(tmp_path / "c.sqlite")
+    MaskCache(path, namespace="model-a").put_many({"a": _kayit("a")})
+    assert MaskCache(path, namespace="model-b").get_many(["a"]) == {}
+    assert MaskCache(path, namespace="model-a").get_many(["a"]) == {"a": _kayit("a")}
+
+
+def test_least_recently_used_is_evicted(tmp_path, saat):
+    cache = MaskCache(str(tmp_path / "c.sqlite"), max_entries=2)
+    cache.put_many({"a": _kayit("a")})
+    cache.put_many({"b": _kayit("b")})
+    cache.get_many(["a"])                 # a yeniden kullanıldı; en eski artık b
+    cache.put_many({"c": _kayit("c")})
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert cache.stats()["entries"] == 2
+
+
+def test_byte_limit_evicts(tmp_path, saat):
+    cache = MaskCache(str(tmp_path / "c.sqlite"), max_bytes=200)
+    for text in ("a" * 40, "b" * 40, "c" * 40):
+        cache.put_many({text: _kayit(text)})
+    assert cache.stats()["bytes"] <= 200
+    assert "c" * 40 in cache.get_many(["c" * 40])
@@ -0,0 +1,59 @@
+from mask_spans import Span, apply_spans, mask_with_spans, ner_spans, resolve_spans
+
+
+def test_ner_wins_over_partially_overlapping_regex():
+    spans = [
+        Span(0, 20, "[ŞİRKET_ADI]", "regex:sirket_adi"),
+        Span(15, 25, "[KİŞİ_ADI]", "ner:PER"),
+    ]
+    assert resolve_spans(spans) == [Span(15, 25, "[KİŞİ_ADI]", "ner:PER")]
+
+
+def test_regex_containing_ner_span_wins():
+    text = "Ek-3 ile Ahmet Yılmaz imzalı"
+    spans = [
+        Span(0, 21, "[EK_REFERANSI]", "regex:ek_referansi"),
+        Span(9, 21, "[KİŞİ_ADI]", "ner:PER"),
+        Span(9, 21, "[KİŞİ_ADI]", "regex:kisi_adi"),
+    ]
+    resolved = resolve_spans(spans)
+    assert resolved == [Span(0, 21, "[EK_REFERANSI]", "regex:ek_referansi")]
+    assert apply_spans(text, resolved) == "[EK_REFERANSI] imzalı"
+
+
+def test_equal_extent_spans_fall_back_to_priority():
+    spans = [Span(3, 9, "[R]", "regex:r"), Span(3, 9, "[N]", "ner:PER"), Span(4, 6, "[X]", "regex:x")]
+    assert resolve_spans(spans) == [Span(3, 9, "[N]", "ner:PER")]
+
+
+def test_longer_span_wins_within_same_source():
+    spans = [
+        Span(0, 5, "[A]", "regex:a"),
+        Span(3, 12, "[B]", "regex:b"),
+        Span(12, 15, "[C]", "regex:c"),
+    ]
+    assert resolve_spans(spans) == [Span(3, 12, "[B]", "regex:b"), Span(12, 15, "[C]", "regex:c")]
+
+
+def test_leftmost_wins_on_equal_length_and_empty_spans_dropped():
+    spans = [Span(4, 8, "[B]", "regex:b"), Span(2, 6, "[A]", "regex:a"), Span(9, 9, "[X]", "ner:PER")]
+    assert resolve_spans(spans) == [Span(2, 6, "[A]", "regex:a")]
+
+
+def test_custom_priority_and_unknown_source_last():
+    spans = [Span(0, 4, "[N]", "ner:PER"), Span(0, 4, "[R]", "regex:r"), Span(2, 10, "[U]", "kullanici")]
+    assert resolve_spans(spans, {"regex": 0, "ner": 1}) == [Span(0, 4, "[R]", "regex:r")]
+
+
+def test_apply_spans_and_ner_mapping():
+    text = "Ali Veli İzmir'de oturur."
+    entities = [
+        {"entity_group": "PER", "start": 0, "end": 8},
+        {"entity_group": "MISC", "start": 9, "end": 14},
+    ]
+    spans = ner_spans(entities, {"PER": "[KİŞİ_ADI]"})
+    assert spans == [Span(0, 8, "[KİŞİ_ADI]", "ner:PER")]
+    assert apply_spans(text, spans) == "[KİŞİ_ADI] İzmir'de oturur."
+    masked, resolved = mask_with_spans(text, entities, {"PER": "[KİŞİ_ADI]"})
+    assert masked.startswith("[KİŞİ_ADI] ")
+    assert resolved[0].source == "ner:PER"
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from near_duplicates import analiz_et, normalize, signatures, temizle, yakin_kopya_kumeleri  # noqa: E402
+
+KALIP = "Taraflar {} tarihinde İstanbul mahkemelerini yetkili kabul etmiştir ve bu madde kesindir."
+FARKLI = "Kiracı kira bedelini her ayın beşinci gününe kadar banka hesabına yatırmakla yükümlüdür."
+
+
+def test_normalize_folds_turkish_and_digits():
+    assert normalize("İSTANBUL, 12.05.2023!") == "istanbul 0 0 0"
+    assert normalize("IĞDIR") == "ığdır"
+
+
+def test_template_clauses_cluster_together():
+    texts = [KALIP.format("01.01.2023"), KALIP.format("05.06.2024"), FARKLI, KALIP.format("9.3.2021").replace("Taraflar", "TARAFLAR").replace(".", "!")]
+    clusters = yakin_kopya_kumeleri(signatures(texts))
+    assert [sorted(c) for c in clusters] == [[0, 1, 3]]
+
+
+def test_no_clusters_for_distinct_texts():
+    texts = [FARKLI, KALIP.format("01.01.2023"), "Bu sözleşme iki nüsha olarak düzenlenmiş ve imzalanmıştır."]
+    assert yakin_kopya_kumeleri(signatures(texts)) == []
+    assert signatures([]).shape == (0, 128)
+
+
+def test_leakage_and_label_conflict_are_dropped_from_train(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({
+        "text": [KALIP.format("01.01.2023"), FARKLI, FARKLI, "Tek satır."],
+        "label": [0, 1, 0, 1],
+    }).to_csv("train.csv", index=False)
+    pd.DataFrame({"text": [KALIP.format("02.02.2022")], "label": [0]}).to_csv("test.csv", index=False)
+
+    data, clusters = analiz_et(["train.csv", "test.csv"])
+    assert sorted(sorted(c) for c in clusters) == [[0, 4], [1, 2]]
+    temizle(data, clusters, ["train.csv", "test.csv"])
+    assert pd.read_csv("train-dedup.csv")["text"].tolist() == ["Tek satır."]
+    assert len(pd.read_csv("test-dedup.csv")) == 1
+
+
+def test_test_file_is_never_modified(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({"text": ["Bu sözleşme iki nüsha olarak düzenlenmiş ve imzalanmıştır."], "label": [1]}) \
+        .to_csv("tr.csv", index=False)
+    pd.DataFrame({"text": [KALIP.format("01.01.2023"), KALIP.format("02.02.2022"), KALIP.format("03.03.2021")],
+                  "label": [0, 0, 0]}).to_csv("te.csv", index=False)
+
+    data, clusters = analiz_et(["tr.csv", "te.csv"])
+    assert [sorted(c) for c in clusters] == [[1, 2, 3]]
+    temizle(data, clusters, ["tr.csv", "te.csv"])
+    assert len(pd.read_csv("tr-dedup.csv")) == 1
+    assert len(pd.read_csv("te-dedup.csv")) == 3
@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from pdf_analiz_v3 import on_isleme_ve_maskeleme_akisi  # noqa: E402
+from run_manifest import RunManifest  # noqa: E402
+
+
+def test_unchanged_file_replay_keeps_manifest(tmp_path):
+    document = tmp_path / "sozlesme.pdf"
+    document.write_bytes(b"%PDF-1.4 sabit")
+    directory = str(tmp_path / "m")
+    manifest = RunManifest.for_document(str(document), "ns", directory=directory)
+    for i, sentence in enumerate(["Bir.", "İki.", "Üç."], 1):
+        manifest.record({"id": i, "orjinal_cumle": sentence, "maskelenmis_cumle": sentence,
+                         "maske_araliklari": []})
+    manifest.save()
+
+    for _ in range(2):  # aynı dosya iki kez daha işlenir
+        manifest = RunManifest.for_document(str(document), "ns", directory=directory)
+        records = list(on_isleme_ve_maskeleme_akisi(str(document), manifest=manifest))
+        assert [r["orjinal_cumle"] for r in records] == ["Bir.", "İki.", "Üç."]
+        assert not any(r["degisti"] for r in records)
+
+    assert len(list(RunManifest.for_document(str(document), "ns", directory=directory).previous_records())) == 3
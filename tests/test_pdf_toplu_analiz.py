@@ -0,0 +1,13 @@
+from pdf_toplu_analiz import belge_adlari
+
+
+def test_unique_stems_are_kept():
+    assert belge_adlari(["a/sozlesme.pdf", "b/ek.pdf"]) == {"a/sozlesme.pdf": "sozlesme", "b/ek.pdf": "ek"}
+
+
+def test_duplicate_stems_get_distinct_names():
+    names = belge_adlari(["a/sozlesme.pdf", "b/sozlesme.pdf", "c/ek.pdf"])
+    assert names["c/ek.pdf"] == "ek"
+    assert names["a/sozlesme.pdf"] != names["b/sozlesme.pdf"]
+    assert all(names[p].startswith("sozlesme-") for p in ("a/sozlesme.pdf", "b/sozlesme.pdf"))
+    assert names == belge_adlari(["a/sozlesme.pdf", "b/sozlesme.pdf", "c/ek.pdf"])
@@ -0,0 +1,34 @@
+import pytest
+
+from risk_classifier import token_budget_batches
+
+
+def _dogrula(lengths, batches, max_tokens, max_batch_size):
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) <= max_batch_size
+        if len(batch) > 1:
+            assert len(batch) * max(lengths[i] for i in batch) <= max_tokens
+
+
+@pytest.mark.parametrize("max_tokens, max_batch_size", [(64, 64), (100, 4), (1000, 3)])
+def test_batches_respect_budget_and_cover_all(max_tokens, max_batch_size):
+    lengths = [5, 40, 12, 33, 7, 7, 64, 18, 2, 25, 50, 9]
+    batches = list(token_budget_batches(lengths, max_tokens, max_batch_size))
+    _dogrula(lengths, batches, max_tokens, max_batch_size)
+
+
+def test_batches_are_length_sorted():
+    lengths = [3, 10, 1, 7]
+    batches = list(token_budget_batches(lengths, max_tokens=20, max_batch_size=64))
+    assert batches == [[1, 3], [0, 2]]
+
+
+def test_oversized_item_gets_own_batch():
+    batches = list(token_budget_batches([300, 10, 10], max_tokens=100, max_batch_size=64))
+    assert batches[0] == [0]
+    assert batches[1:] == [[1, 2]]
+
+
+def test_empty_input():
+    assert list(token_budget_batches([])) == []
@@ -0,0 +1,111 @@
+import json
+
+from mask_spans import Span
+from run_manifest import RunManifest
+
+
+def _kayit(i, sentence, risk=None):
+    return {
+        "id": i,
+        "orjinal_cumle": sentence,
+        "maskeli_cumle": sentence.upper(),
+        "maske_araliklari": [Span(0, 3, "[X]", "regex:test")],
+        "degisti": True,
+        "risk": risk,
+    }
+
+
+def _isle(document, directory, sentences, namespace="ns"):
+    manifest = RunManifest.for_document(str(document), namespace, belge_id="sozlesme", directory=str(directory))
+    found = manifest.lookup(sentences)
+    for i, sentence in enumerate(sentences):
+        manifest.record(found.get(sentence) or _kayit(i, sentence, risk="riskli"))
+    manifest.save()
+    return manifest, found
+
+
+def test_unchanged_file_reuses_all_records(tmp_path):
+    document = tmp_path / "sozlesme.txt"
+    document.write_text("v1", encoding="utf-8")
+    sentences = ["Birinci madde.", "İkinci madde."]
+    _isle(document, tmp_path / "m", sentences)
+
+    manifest = RunManifest.for_document(str(document), "ns", belge_id="sozlesme", directory=str(tmp_path / "m"))
+    assert manifest.unchanged_file()
+    records = list(manifest.previous_records())
+    assert [r["orjinal_cumle"] for r in records] == sentences
+    assert records[0]["maske_araliklari"] == [Span(0, 3, "[X]", "regex:test")]
+    assert "degisti" not in records[0]
+
+
+def test_revision_reuses_only_unchanged_sentences(tmp_path):
+    document = tmp_path / "sozlesme.txt"
+    document.write_text("v1", encoding="utf-8")
+    _isle(document, tmp_path / "m", ["Birinci madde.", "İkinci madde.", "Silinen madde."])
+
+    document.write_text("v2", encoding="utf-8")
+    manifest, found = _isle(document, tmp_path / "m", ["Birinci madde.", "Yeni madde.", "İkinci madde."])
+    assert not manifest.unchanged_file()
+    assert set(found) == {"Birinci madde.", "İkinci madde."}
+    assert "id" not in found["Birinci madde."]
+    assert found["Birinci madde."]["risk"] == "riskli"
+    assert manifest.removed_count() == 1
+
+
+def test_namespace_or_version_change_invalidates(tmp_path):
+    document = tmp_path / "sozlesme.txt"
+    document.write_text("v1", encoding="utf-8")
+    _isle(document, tmp_path / "m", ["Birinci madde."])
+
+    other = RunManifest.for_document(str(document), "baska-model", belge_id="sozlesme", directory=str(tmp_path / "m"))
+    assert not other.unchanged_file()
+    assert other.lookup(["Birinci madde."]) == {}
+
+    path = tmp_path / "m" / "sozlesme.jsonl"
+    header, *lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    data = json.loads(header)
+    data["version"] = -1
+    path.write_text(json.dumps(data) + "\n" + "".join(lines), encoding="utf-8")
+    stale = RunManifest.for_document(str(document), "ns", belge_id="sozlesme", directory=str(tmp_path / "m"))
+    assert stale.lookup(["Birinci madde."]) == {}
+
+
+def test_records_stream_to_disk_and_discard_keeps_previous(tmp_path):
+    document = tmp_path / "sozlesme.txt"
+    document.write_text("v1", encoding="utf-8")
+    directory = tmp_path / "m"
+    _isle(document, directory, ["Birinci madde."])
+
+    document.write_text("v2", encoding="utf-8")
+    manifest = RunManifest.for_document(str(document), "ns", belge_id="sozlesme", directory=str(directory))
+    manifest.record(_kayit(0, "Yeni madde."))
+    assert len([p for p in directory.iterdir() if p.suffix == ".tmp"]) == 1
+
+    manifest.discard()
+    assert [p.name for p in directory.iterdir()] == ["sozlesme.jsonl"]
+    previous = RunManifest.for_document(str(document), "ns", belge_id="sozlesme", directory=str(directory))
+    assert [r["orjinal_cumle"] for r in previous.previous_records()] == ["Birinci madde."]
+
+    manifest = RunManifest.for_document(str(document), "ns", belge_id="sozlesme", directory=str(directory))
+    record = _kayit(0, "Yeni madde.")
+    manifest.record(record)
+    record["risk"] = "sonradan"  # record() sonrası değişiklik manifeste girmez
+    manifest.save()
+    saved = RunManifest.for_document(str(document), "ns", belge_id="sozlesme", directory=str(directory))
+    assert saved.unchanged_file()
+    assert saved.lookup(["Yeni madde."])["Yeni madde."]["risk"] is None
+
+
+def test_lookup_reads_entries_by_offset(tmp_path):
+    document = tmp_path / "sozlesme.txt"
+    document.write_text("v1", encoding="utf-8")
+    sentences = ["Birinci madde.", "İkinci madde.", "Birinci madde.", "Üçüncü madde."]
+    _isle(document, tmp_path / "m", sentences)
+
+    manifest = RunManifest.for_document(str(document), "ns", belge_id="sozlesme", directory=str(tmp_path / "m"))
+    found = manifest.lookup(["Üçüncü madde.", "İkinci madde.", "Yok."])
+    assert {k: v["maskeli_cumle"] for k, v in found.items()} == {
+        "Üçüncü madde.": "ÜÇÜNCÜ MADDE.", "İkinci madde.": "İKINCI MADDE."}
+    manifest.record(_kayit(0, "İkinci madde."))
+    assert manifest.removed_count() == 3
+    manifest.discard()
@@ -0,0 +1,31 @@
+import pytest
+
+from sentence_splitter import split_sentences
+
+
+def test_offsets_point_into_original_text():
+    text = "  Md. 5. maddede T.C. vatandaşı A. Yılmaz yer alır.\n\nİkinci cümle!  Üçüncü cümle?  "
+    sentences = split_sentences(text)
+    assert [s.text for s in sentences] == [
+        "Md. 5. maddede T.C. vatandaşı A. Yılmaz yer alır.",
+        "İkinci cümle!",
+        "Üçüncü cümle?",
+    ]
+    for s in sentences:
+        assert text[s.start:s.end] == s.text
+
+
+@pytest.mark.parametrize("text", [
+    "Taraflar vs. diğer hususlarda anlaşmıştır.",
+    "12. Ocak 2023 tarihinde imzalanmıştır.",
+    "Sözleşmenin 3. 4. ve 5. maddeleri saklıdır.",
+    "Bedel 01.01.2023 tarihinde ödenir.",
+    "Av. Mehmet Kaya ve Dr. Ayşe Demir imzalar.",
+])
+def test_abbreviations_and_ordinals_do_not_split(text):
+    assert [s.text for s in split_sentences(text)] == [text]
+
+
+def test_empty_and_whitespace_only():
+    assert split_sentences("") == []
+    assert split_sentences(" \n\t ") == []
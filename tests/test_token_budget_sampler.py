@@ -0,0 +1,21 @@
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from token_budget_sampler import TokenBudgetBatchSampler  # noqa: E402
+
+
+def test_short_sentences_are_capped_by_max_batch_size():
+    # 4096 token'lık bütçe 40 token'lık 600 cümleyi ~100'lük batch'lere koyardı.
+    sampler = TokenBudgetBatchSampler([40] * 600, max_tokens=4096, max_batch_size=16)
+    batches = list(sampler)
+    assert len(sampler) == len(batches) == 38
+    assert max(len(batch) for batch in batches) == 16
+
+
+def test_long_sentences_still_respect_token_budget():
+    lengths = [256] * 10 + [30] * 20
+    batches = list(TokenBudgetBatchSampler(lengths, max_tokens=1024, max_batch_size=16))
+    assert sorted(i for batch in batches for i in batch) == list(range(30))
+    assert all(len(batch) * max(lengths[i] for i in batch) <= 1024 for batch in batches)
@@ -0,0 +1,164 @@
+# Bu kod, eğitimde sabit cümle sayılı rastgele batch'ler yerine token bütçeli
+# batch'ler kurar. Cümleler uzunluğa göre sıralanıp (eşit uzunluktakiler her
+# epoch'ta karıştırılarak) batch boyu x en uzun cümle <= max_tokens olacak şekilde
+# paketlenir, batch sırası her epoch'ta karıştırılır. Bir batch'teki cümle sayısı
+# ayrıca max_batch_size ile (Trainer'da per_device_train_batch_size) sınırlanır:
+# sınır olmasaydı 4096 token'lık bütçe ~40 token'lık maddelerde ~100 cümlelik
+# batch'ler kurar, epoch başına adım sayısı sabit 16'lık yükleyicinin ~38 adımından
+# ~6'ya düşer ve aynı öğrenme oranı/epoch ayarlarıyla model çok daha az güncellenirdi.
+# Sınırla adım sayısı sabit yükleyicidekinden az olamaz; yalnızca bütçeyi aşan uzun
+# cümleler daha küçük batch'lere bölündüğü için biraz artabilir. Kısa maddeler artık
+# 256 token'lık bir maddeye kadar doldurulmaz. Her epoch sonunda dolgu (padding) oranı
+# ve saniyedeki gerçek token sayısı yazdırılır. Değerlendirme ve tahmin (predict)
+# Trainer'ın sıralı yükleyicileriyle yapılır; çıktılar veri kümesinin sırasında kalır.
+#
+# Kullanım (train_large.py / dörtModel.py / modelKıyaslama.py):
+#   trainer = TokenBudgetTrainer(max_tokens=TOKEN_BUDGET, model=model, args=args, ...)
+#   trainer.train()
+import random
+import time
+
+from torch.utils.data import DataLoader, Sampler
+from transformers import Trainer, TrainerCallback
+
+TOKEN_BUDGET = 4096          # bir batch'teki dolgulu token sayısı üst sınırı (16 x 256)
+REFERENCE_BATCH_SIZE = 16    # karşılaştırma için eski sabit batch boyu
+
+
+class TokenBudgetBatchSampler(Sampler):
+    """Uzunluk listesinden token bütçeli indeks batch'leri üretir.
+
+    Batch'ler uzunluğa göre sıralı sırada paketlendiği için batch sayısı her
+    epoch'ta aynıdır (öğrenme oranı takvimi bozulmaz); içerik eşit uzunluktaki
+    cümlelerin karışmasıyla, sıra ise batch'lerin karıştırılmasıyla değişir.
+    Bir batch'te en fazla max_batch_size cümle bulunur; böylece adım sayısı
+    sabit batch boylu eğitimdekinin altına düşmez.
+    """
+
+    def __init__(self, lengths, max_tokens=TOKEN_BUDGET, max_batch_size=REFERENCE_BATCH_SIZE,
+                 shuffle=True, seed=42):
+        self.lengths = list(lengths)
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+        self._num_batches = len(self._batches(random.Random(seed)))
+
+    def _batches(self, rng):
+        if self.shuffle:
+            order = sorted(range(len(self.lengths)), key=lambda i: (self.lengths[i], rng.random()))
+        else:
+            order = sorted(range(len(self.lengths)), key=lambda i: self.lengths[i])
+        batches, batch = [], []
+        for i in order:
+            # Sıra artan uzunlukta olduğu için eklenen cümle batch'in en uzunudur.
+            if batch and ((len(batch) + 1) * self.lengths[i] > self.max_tokens
+                          or len(batch) >= self.max_batch_size):
+                batches.append(batch)
+                batch = []
+            batch.append(i)
+        if batch:
+            batches.append(batch)
+        if self.shuffle:
+            rng.shuffle(batches)
+        return batches
+
+    def __iter__(self):
+        rng = random.Random(self.seed + self.epoch)
+        self.epoch += 1
+        return iter(self._batches(rng))
+
+    def __len__(self):
+        return self._num_batches
+
+
+def padding_ratio(batches, lengths):
+    """Verilen batch'lerde dolgu token'larının toplam token'lara oranı."""
+    real = sum(lengths[i] for batch in batches for i in batch)
+    padded = sum(len(batch) * max(lengths[i] for i in batch) for batch in batches)
+    return 1 - real / padded if padded else 0.0
+
+
+class PaddingStatsCollator:
+    """Collator'ı sarar; batch'lerdeki gerçek ve dolgulu token sayılarını biriktirir."""
+
+    def __init__(self, collator):
+        self.collator = collator
+        self.reset()
+
+    def reset(self):
+        self.real_tokens = 0
+        self.padded_tokens = 0
+
+    def __call__(self, features):
+        batch = self.collator(features)
+        mask = batch["attention_mask"]
+        self.real_tokens += int(mask.sum())
+        self.padded_tokens += mask.numel()
+        return batch
+
+
+class PaddingStatsCallback(TrainerCallback):
+    """Her epoch sonunda dolgu oranını ve saniyedeki token sayısını yazdırır."""
+
+    def __init__(self, stats_collator, lengths, max_tokens, max_batch_size):
+        self.stats = stats_collator
+        self.lengths = lengths
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+        self.epoch_start = None
+
+    def on_train_begin(self, args, state, control, **kwargs):
+        # Eski yöntem (karışık sıralı, sabit boylu batch) için beklenen dolgu oranı ve adım sayısı
+        order = list(range(len(self.lengths)))
+        random.Random(args.seed).shuffle(order)
+        size = self.max_batch_size
+        fixed = [order[i:i + size] for i in range(0, len(order), size)]
+        budget = TokenBudgetBatchSampler(self.lengths, self.max_tokens, size, seed=args.seed)
+        print(f"📦 Token bütçesi {self.max_tokens} (en fazla {size} cümle): {len(budget)} batch/epoch, "
+              f"beklenen dolgu %{padding_ratio(list(budget), self.lengths) * 100:.1f} "
+              f"(sabit {size}'lık rastgele batch: {len(fixed)} batch/epoch, "
+              f"dolgu %{padding_ratio(fixed, self.lengths) * 100:.1f})")
+
+    def on_epoch_begin(self, args, state, control, **kwargs):
+        self.stats.reset()
+        self.epoch_start = time.perf_counter()
+
+    def on_epoch_end(self, args, state, control, **kwargs):
+        elapsed = time.perf_counter() - self.epoch_start
+        padded = max(self.stats.padded_tokens, 1)
+        print(f"📏 Epoch {state.epoch:.0f}: dolgu oranı %{(1 - self.stats.real_tokens / padded) * 100:.1f}, "
+              f"{self.stats.real_tokens / max(elapsed, 1e-9):.0f} gerçek token/sn "
+              f"({self.stats.padded_tokens / max(elapsed, 1e-9):.0f} toplam token/sn)")
+
+
+class TokenBudgetTrainer(Trainer):
+    """Eğitim batch'lerini token bütçesine göre kuran Trainer.
+
+    Batch'ler max_tokens'a göre kurulur; per_device_train_batch_size (ya da
+    verilirse max_batch_size) bir batch'teki cümle sayısının üst sınırıdır.
+    Değerlendirme ve tahmin varsayılan sıralı yükleyicileri kullanır; uzunluğa göre
+    sıralansalardı trainer.predict çıktıları etiketlerle hizasız kalırdı.
+    """
+
+    def __init__(self, *args, max_tokens=TOKEN_BUDGET, max_batch_size=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size or self.args.per_device_train_batch_size
+        self.data_collator = PaddingStatsCollator(self.data_collator)
+        if self.train_dataset is not None:
+            lengths = [len(ids) for ids in self.train_dataset["input_ids"]]
+            self.add_callback(PaddingStatsCallback(self.data_collator, lengths, max_tokens, self.max_batch_size))
+
+    def get_train_dataloader(self):
+        dataset = self._remove_unused_columns(self.train_dataset, description="training")
+        lengths = [len(ids) for ids in dataset["input_ids"]]
+        sampler = TokenBudgetBatchSampler(lengths, self.max_tokens, self.max_batch_size, seed=self.args.seed)
+        return DataLoader(
+            dataset,
+            batch_sampler=sampler,
+            collate_fn=self.data_collator,
+            num_workers=self.args.dataloader_num_workers,
+            pin_memory=self.args.dataloader_pin_memory,
+        )
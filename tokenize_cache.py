@@ -0,0 +1,75 @@
+# Bu kod, eğitim CSV'lerinin token haline getirilmiş sürümünü diskte saklar.
+# Anahtar; tokenizer'ın kendisinin (vocab, normalizer, özel token'lar) özeti,
+# max_length ve CSV dosyalarının özetinden oluşur. Aynı vocab'ı paylaşan modeller
+# ve aynı veriyle tekrarlanan hiperparametre turları aynı önbelleği kullanır;
+# önbellek Arrow biçiminde yazılıp load_from_disk ile bellek eşlemeli (memory-mapped)
+# açıldığı için tokenize adımı tamamen atlanır.
+#
+# Kullanım (train_large.py / dörtModel.py / modelKıyaslama.py):
+#   tokenized_datasets = tokenized_dataset(files, tokenizer, max_length=256)
+import hashlib
+import json
+import os
+import shutil
+
+from datasets import load_dataset, load_from_disk
+
+from run_manifest import file_hash
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "tokenized")
+CACHE_VERSION = 1
+
+
+def tokenizer_hash(tokenizer):
+    """Tokenizer'ın çıktıyı belirleyen içeriğinden özet üretir (model adından bağımsız)."""
+    digest = hashlib.sha256(type(tokenizer).__name__.encode())
+    if getattr(tokenizer, "is_fast", False):
+        # tokenizer.json: vocab, normalizer, pre-tokenizer, post-processor. "truncation" ve
+        # "padding" çağrı anında değişen ayarlardır (modele göre None/512/256, ilk çağrıdan
+        # sonra da değişir); özete girerse aynı vocab'lı modeller önbelleği paylaşamaz.
+        state = json.loads(tokenizer.backend_tokenizer.to_str())
+        state.pop("truncation", None)
+        state.pop("padding", None)
+        digest.update(json.dumps(state, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    else:
+        digest.update(json.dumps(sorted(tokenizer.get_vocab().items()), ensure_ascii=False).encode("utf-8"))
+        digest.update(json.dumps(tokenizer.init_kwargs, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(json.dumps(tokenizer.special_tokens_map, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def cache_key(files, tokenizer, max_length, text_column="text"):
+    digest = hashlib.sha256(f"v{CACHE_VERSION}:{max_length}:{text_column}".encode())
+    digest.update(tokenizer_hash(tokenizer).encode())
+    for split in sorted(files):
+        digest.update(f"{split}:{file_hash(files[split])}".encode())
+    return digest.hexdigest()[:24]
+
+
+def tokenized_dataset(files, tokenizer, max_length=256, text_column="text", cache_dir=CACHE_DIR):
+    """files ({"train": csv, "test": csv}) için token'lanmış DatasetDict döndürür.
+
+    Önbellekte varsa diskten bellek eşlemeli açılır; yoksa CSV'ler okunup
+    token'lanır ve önbelleğe atomik olarak yazılır.
+    """
+    path = os.path.join(cache_dir, cache_key(files, tokenizer, max_length, text_column))
+    if os.path.isdir(path):
+        print(f"♻️ Token önbelleği kullanılıyor → {path}")
+        return load_from_disk(path)
+
+    def preprocess_function(examples):
+        return tokenizer(examples[text_column], truncation=True, max_length=max_length)
+
+    dataset = load_dataset("csv", data_files=files)
+    tokenized = dataset.map(preprocess_function, batched=True)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    tokenized.save_to_disk(tmp)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # Başka bir süreç aynı anahtarı önce yazdı; onunkini kullan.
+        shutil.rmtree(tmp, ignore_errors=True)
+    print(f"💾 Token önbelleği yazıldı → {path}")
+    return load_from_disk(path)
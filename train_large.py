@@ -1,9 +1,11 @@
-from datasets import load_dataset
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, Trainer, TrainingArguments, DataCollatorWithPadding
+from transformers import AutoTokenizer, AutoModelForSequenceClassification, TrainingArguments, DataCollatorWithPadding
 import torch
 import evaluate
 import numpy as np
 
+from token_budget_sampler import TOKEN_BUDGET, TokenBudgetTrainer
+from tokenize_cache import tokenized_dataset
+
 # ⚠️ ÖN KOŞULLAR:
 # 'dataset-v1-train.csv' ve 'datase-v1-test.csv' dosyaları bu kod ile aynı klasörde olmalıdır.
 # Gerekli kütüphaneler (transformers, datasets, evaluate, numpy) yüklü olmalıdır.
@@ -13,17 +15,13 @@ files = {
     "train": "dataset-v1-train.csv", 
     "test": "datase-v1-test.csv"  # Test dosyasının typo'su korundu.
 }
-dataset = load_dataset("csv", data_files=files)
 
 # 2️⃣ Tokenizer (Türkçe Legal BERT)
 model_name = "msbayindir/legal-turkish-bert-base-cased" 
 tokenizer = AutoTokenizer.from_pretrained(model_name)
 
-def preprocess_function(examples):
-    # Metinleri tokenize et, max uzunluk 256
-    return tokenizer(examples["text"], truncation=True, max_length=256)
-
-tokenized_datasets = dataset.map(preprocess_function, batched=True)
+# Metinleri tokenize et, max uzunluk 256 (aynı tokenizer + CSV için önbellekten gelir)
+tokenized_datasets = tokenized_dataset(files, tokenizer, max_length=256)
 
 # 3️⃣ Model ve Etiket Haritası (etiket_id.txt'ye göre)
 id2label = {0: "YUKSEK_RISK", 1: "ORTA_RISK", 2: "RISKSIZ"}
@@ -56,7 +54,7 @@ def compute_metrics(eval_pred):
 args = TrainingArguments(
     output_dir="./results-legal-bert",
     num_train_epochs=10,              # Güvenli üst limit. En iyi model korunacaktır.
-    per_device_train_batch_size=16,   # Base model için yüksek batch size
+    per_device_train_batch_size=16,   # TokenBudgetTrainer'da batch başına cümle üst sınırı
     per_device_eval_batch_size=16,
     gradient_accumulation_steps=1,
     learning_rate=3e-5,               
@@ -74,7 +72,9 @@ args = TrainingArguments(
 
 collator = DataCollatorWithPadding(tokenizer=tokenizer)
 
-trainer = Trainer(
+# Batch'ler TOKEN_BUDGET token'a göre kurulur (dolgu azalır); en fazla 16 cümle, adım sayısı korunur.
+trainer = TokenBudgetTrainer(
+    max_tokens=TOKEN_BUDGET,
     model=model,
     args=args,
     train_dataset=tokenized_datasets["train"],